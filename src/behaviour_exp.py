@@ -2,12 +2,11 @@
 
 from math import pi
 import os
-from sim.sim import Sim
-from sim.arguments import get_args
+from sim.sweep import Job, run_sweep
 import numpy as np
 
 
-def run_behaviour_exp(nb_repeat, name, cmd, ror, droo_range, droa_range):
+def run_behaviour_exp(nb_repeat, name, cmd, ror, droo_range, droa_range, workers=None):
     """Run the behaviour experience.
 
     Args:
@@ -17,6 +16,7 @@ def run_behaviour_exp(nb_repeat, name, cmd, ror, droo_range, droa_range):
         ror (float): The range of repulsion (in length units).
         droo_range (float): The range of values to explore with delta r_o (in length units).
         droa_range (float): The range of values to explore with delta r_a (in length units).
+        workers (int, optional): The number of worker processes. Defaults to None (the number of processors).
     """
     # Create the required folders
     if not os.path.exists("../logs"):
@@ -29,23 +29,19 @@ def run_behaviour_exp(nb_repeat, name, cmd, ror, droo_range, droa_range):
         cmd_log.write(cmd)
         cmd_log.write(f"ror: {ror}, droo_range: {droo_range}, droa_range: {droa_range}")
 
-        # Repeat the simulation
-        for i in range(nb_repeat):
-            for droo in droo_range:
-                roo = ror + droo
-                for droa in droa_range:
-                    roa = roo + droa
-                    full_cmd = cmd.format(ror, roo, roa)
-                    print(
-                        f"[Behaviour experience] droo: {droo} droa: {droa} - Progression: {i * 100 // nb_repeat}%"
-                    )
-                    itr_cmd = full_cmd + " --output {}/droo_{}_droa_{}_itr_{}".format(
-                        name, droo, droa, i
-                    )
-                    ar = get_args(itr_cmd.split(" "))
-                    sim = Sim()
-                    sim.from_args(ar)
-    print("[Behaviour experience] Done !")
+    # Simulate one row of the grid per job, each cell and repeat of the row being a replica
+    jobs = []
+    for droo in droo_range:
+        roo = ror + droo
+        droa, itr = np.meshgrid(droa_range, np.arange(nb_repeat), indexing="ij")
+        droa, itr = droa.reshape(-1), itr.reshape(-1)
+        outputs = [
+            "{}/droo_{}_droa_{}_itr_{}".format(name, droo, droa[k], itr[k])
+            for k in range(len(itr))
+        ]
+        sweep = {"orientation_radius": np.full(len(itr), roo), "attraction_radius": roo + droa}
+        jobs.append(Job(cmd.format(ror, roo, roo), outputs, sweep))
+    run_sweep("Behaviour experience", jobs, workers, manifest=f"../logs/{name}/manifest.jsonl")
 
 
 if __name__ == "__main__":
@@ -2,17 +2,48 @@
 
 from math import pi
 import os
-from sim.sim import Sim
+from sim import arguments as argu
 from sim.arguments import get_args
+from sim.incrementor import Incrementor
+from sim.sweep import Job, expand, run_sweep
 
 
-def run_memory_exp(nb_repeat, name, cmd):
+def get_rising_steps(cmd):
+    """Compute the number of steps of the rising part of the range of orientation variation of a command.
+
+    The variation is replayed with the incrementor of the simulation, until its increment turns negative.
+
+    Args:
+        cmd (str): The command to simulate.
+
+    Returns:
+        int: The number of steps before the range of orientation starts falling (the number of steps of the
+            simulation when it never falls).
+    """
+    args = get_args(cmd.split(" "))
+    if not argu.roo_cond(args.orientation_var, args.roo_step_duration):
+        return args.step_nb
+    incrementor = Incrementor(*argu.get_roo_var(args.orientation_var), args.roo_step_duration)
+    steps = 0
+    while incrementor.is_rising and steps < args.step_nb:
+        incrementor.next()
+        steps += 1
+    return steps
+
+
+def run_memory_exp(nb_repeat, name, cmd, nb_branch=1, workers=None):
     """Run the memory experience.
 
+    With one branch, each repetition is simulated from start to end, and logged in itr_<i>. With more branches,
+    the rising part of the schedule is simulated once, and logged in rising/itr_<i>, then the falling branches are
+    forked from its final state, and logged in itr_<i>_branch_<b>.
+
     Args:
         nb_repeat (int): The number of repetitions.
         name (str): The name of this experience.
         cmd (str): The command template to use.
+        nb_branch (int, optional): The number of falling branches of each repetition. Defaults to 1.
+        workers (int, optional): The number of worker processes. Defaults to None (the number of processors).
     """
     # Create the required folders
     if not os.path.exists("../logs"):
@@ -24,15 +55,28 @@ def run_memory_exp(nb_repeat, name, cmd):
     with open(f"../logs/{name}/cmd_template.txt", "w") as cmd_log:
         cmd_log.write(cmd)
 
-    # Repeat the simulation
-    for i in range(nb_repeat):
-        print("[Memory experience] Progression: {}%".format(i * 100 // nb_repeat))
-        itr_cmd = cmd + " --output {}/itr_{}".format(name, i)
-        args = get_args(itr_cmd.split(" "))
-        sim = Sim()
-        sim.from_args(args)
-    print("[Memory experience] Done !")
+    manifest = f"../logs/{name}/manifest.jsonl"
+    if nb_branch == 1:
+        # Repeat the simulation (the replicas are logged in itr_<i>)
+        jobs = expand(cmd, {}, name + "/itr_{itr}", nb_repeat)
+        run_sweep("Memory experience", jobs, workers, manifest=manifest)
+        return
+
+    # Repeat the rising part (the replicas are logged in rising/itr_<i>)
+    rising = f"../logs/{name}/rising.npz"
+    rising_cmd = cmd + f" --checkpoint {rising} --checkpoint-step {get_rising_steps(cmd)}"
+    jobs = expand(rising_cmd, {}, name + "/rising/itr_{itr}", nb_repeat)
+    run_sweep("Memory experience (rising)", jobs, workers, manifest=manifest)
 
+    # Fork the falling branches from the rising part (the replicas are logged in itr_<i>_branch_<b>)
+    jobs = [
+        Job(
+            cmd + f" --restore {rising} --fork 1",
+            [f"{name}/itr_{i}_branch_{b}" for i in range(nb_repeat)],
+        )
+        for b in range(nb_branch)
+    ]
+    run_sweep("Memory experience (falling)", jobs, workers, manifest=manifest)
 
 if __name__ == "__main__":
     nb_repeat = 1 #15
@@ -17,6 +17,7 @@ PALETTE = {
 from .canvas import Canvas
 from .incrementor import Incrementor
 from .individual import Individual
+from .engine import Engine
 from .population import Population
 from .universe import Universe
 from .data_logger import DataLogger
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 from argparse import ArgumentParser, ArgumentTypeError
 
+import numpy as np
+
 from . import BOID_TURN_SPEED, VELOCITY, DEFAULT_NUM_NEIGHBORS
 
 
@@ -35,9 +37,11 @@ def global_cond(velocity, time_step, repulsion_radius):
         time_step (float): The time increment of each step in the simulation time.
         repulsion_radius (int): The radius where particles repulse each others.
 
+    The velocity and the radius can also hold one value per replica.
+
     Raise an argparse.ArgumentTypeError when velocity * time_step > repulsion_radius
     """
-    if not (velocity * time_step < repulsion_radius):
+    if not np.all(velocity * time_step < repulsion_radius):
         raise ArgumentTypeError(
             "***ERROR: global condition of the simulation: velocity * time_step > repulsion_radius when it should not."
         )
@@ -103,6 +107,23 @@ def get_roo_var(roo_var):
     return float(l[0]), float(l[1]), float(l[2])
 
 
+def get_render_window(render_window):
+    """
+    Get the window of rendered ticks casted in int.
+
+    Args:
+        render_window (string): window of rendered ticks, first tick : tick after the last one (optional).
+
+    """
+    l = render_window.split(":")
+    if len(l) != 2 or not l[0]:
+        raise ArgumentTypeError(
+            "***ERROR: wrong argument: --render-window must be defined as 'first tick : tick after the last one', "
+            "the last one being optional."
+        )
+    return int(l[0]), int(l[1]) if l[1] else None
+
+
 def get_args(arg_list=None):
     """
     Standard function to specify the default value of the hyper-parameters of experimental setups
@@ -141,6 +162,42 @@ def get_args(arg_list=None):
         type=str, 
         default="1920x1080",
         help="the resolution")
+    parser.add_argument(
+        "--codec",
+        type=str,
+        default="libvpx-vp9",
+        help="the ffmpeg codec of the video (e.g. libx264)",
+    )
+    parser.add_argument(
+        "--renderer",
+        type=str,
+        choices=["matplotlib", "raster"],
+        default="matplotlib",
+        help="the renderer of the video and the snapshots: matplotlib (PDF snapshots) or a faster raster one "
+        "(PNG snapshots, without the verbose properties)",
+    )
+    parser.add_argument(
+        "--render-every",
+        dest="render_every",
+        type=int,
+        default=1,
+        help="the number of ticks between two rendered ticks (the frame rate follows, to keep the playback speed)",
+    )
+    parser.add_argument(
+        "--render-window",
+        dest="render_window",
+        type=str,
+        default="0:",
+        help="the window of rendered ticks defined as first tick : tick after the last one (optional)",
+    )
+    parser.add_argument(
+        "--render-duration",
+        dest="render_duration",
+        type=float,
+        default=None,
+        help="the duration of the video in seconds: the window is played at a constant speed, the rendered ticks "
+        "being decimated to keep the frame rate under --fps",
+    )
     parser.add_argument(
         "--highlight", 
         action="store_true", 
@@ -167,6 +224,100 @@ def get_args(arg_list=None):
     parser.add_argument(
         "--verbose", action="store_true", help="increase output verbosity"
     )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="save the snapshots as frames in OUTPUT, drawn later by 'python -m sim.snapshots' (no matplotlib "
+        "during the run)",
+    )
+    parser.add_argument(
+        "--verlet-skin",
+        dest="verlet_skin",
+        type=float,
+        default=0.0,
+        help="the skin of the neighbor lists reused across steps (0 searches the neighbors at every step)",
+    )
+    parser.add_argument(
+        "--replicas",
+        type=int,
+        default=1,
+        help="the number of independent replicas simulated together (each one logged in OUTPUT_<replica>)",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="the seed of the random generators",
+    )
+    parser.add_argument(
+        "--log-format",
+        dest="log_format",
+        type=str,
+        choices=["csv", "npz", "parquet"],
+        default="csv",
+        help="the format of the logs: CSV files or folders of typed parts (parquet requires pyarrow)",
+    )
+    parser.add_argument(
+        "--log-chunk",
+        dest="log_chunk",
+        type=int,
+        default=0,
+        help="the number of rows written at once while logging (0 writes the logs at the end)",
+    )
+    parser.add_argument(
+        "--record",
+        action="store_true",
+        help="record the trajectory of each replica in OUTPUT/trajectory",
+    )
+    parser.add_argument(
+        "--record-format",
+        dest="record_format",
+        type=str,
+        choices=["npy", "compressed"],
+        default="npy",
+        help="the format of the recorded trajectories: memory-mapped float arrays or quantized and compressed "
+        "chunks",
+    )
+    parser.add_argument(
+        "--record-bits",
+        dest="record_bits",
+        type=int,
+        default=16,
+        help="the resolution of the compressed positions, as a fraction 1 / 2^BITS of the border length",
+    )
+    parser.add_argument(
+        "--record-chunk",
+        dest="record_chunk",
+        type=int,
+        default=256,
+        help="the number of frames per compressed chunk",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        type=str,
+        default=None,
+        help="the path to save a checkpoint of the simulation to (.npz)",
+    )
+    parser.add_argument(
+        "--checkpoint-step",
+        dest="checkpoint_step",
+        type=int,
+        default=None,
+        help="the step to save the checkpoint at, ending the simulation (defaults to the last step)",
+    )
+    parser.add_argument(
+        "--restore",
+        type=str,
+        default=None,
+        help="the path to a checkpoint to start from instead of a new population",
+    )
+    parser.add_argument(
+        "--fork",
+        type=int,
+        default=0,
+        help="the number of branches forked from each restored replica, with new random generators "
+        "seeded by --seed (0 resumes the restored simulation as is)",
+    )
     parser.add_argument(
         "--step-nb",
         dest="step_nb",
@@ -241,7 +392,8 @@ def get_args(arg_list=None):
         "--diff-threshold",
         dest="diff_threshold",
         type=float,
-        help="threshold to detect an abnormal behaviour in a individual surrounding",
+        help="threshold to detect an abnormal behaviour in a individual surrounding (in radians): a neighbor whose "
+        "orientation differs from the mean one by strictly more is an outlier",
     )
     parser.add_argument(
         "--view-dist",
@@ -42,3 +42,52 @@ class Border(ABC):
 
         """
         pass
+
+    @abstractmethod
+    def wrap_many(self, points):
+        """Wrap several points to stay within the border.
+
+        Args:
+            points (numpy.ndarray): The (N,2) points to wrap.
+
+        Returns:
+            numpy.ndarray: The (N,2) wrapped points.
+
+        """
+        pass
+
+    @abstractmethod
+    def vector_many(self, points_from, points_to, pairs=None):
+        """Compute the vectors that connect several points.
+
+        Args:
+            points_from (numpy.ndarray): The (N,2) start points.
+            points_to (numpy.ndarray): The (M,2) end points.
+            pairs (tuple<numpy.ndarray,numpy.ndarray>, optional): The indices (i, j) of the (K) pairs of start
+                and end points to connect. Defaults to None (every start point to every end point).
+
+        Returns:
+            numpy.ndarray: The (N,M,2) vectors from each start point to each end point, or the (K,2) vectors from
+            points_from[i] to points_to[j] when the pairs are given, wrt. the border type.
+
+        """
+        pass
+
+    @staticmethod
+    def _difference(points_from, points_to, pairs=None):
+        """Compute the raw differences between several points.
+
+        Args:
+            points_from (numpy.ndarray): The (N,2) start points.
+            points_to (numpy.ndarray): The (M,2) end points.
+            pairs (tuple<numpy.ndarray,numpy.ndarray>, optional): The indices (i, j) of the pairs to connect.
+                Defaults to None.
+
+        Returns:
+            numpy.ndarray: The (N,M,2) or (K,2) differences, as in vector_many.
+
+        """
+        if pairs is None:
+            return points_to[np.newaxis, :, :] - points_from[:, np.newaxis, :]
+        i, j = pairs
+        return points_to[j] - points_from[i]
@@ -15,3 +15,9 @@ class Infinite(Border):
 
     def vector(self, point2d_from, point2d_to):
         return point2d_to - point2d_from
+
+    def wrap_many(self, points):
+        return points
+
+    def vector_many(self, points_from, points_to, pairs=None):
+        return self._difference(points_from, points_to, pairs)
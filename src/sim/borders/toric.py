@@ -11,6 +11,11 @@ class Toric(Border):
 
     """
 
+    def __init__(self, length, origin=np.zeros((2, 1))):
+        super().__init__(length, origin)
+        self.half_length = np.reshape(length, (2, 1)) / 2
+        """numpy.ndarray: The half of the vector of length."""
+
     def wrap(self, point2d):
         return self._wrap_centered(self.origin, point2d)
 
@@ -19,5 +24,16 @@ class Toric(Border):
 
     def _wrap_centered(self, center, point):
         relative_point = point - center
-        size = np.array([self.length[0] / 2, self.length[1] / 2])
+        size = self.half_length
         return center + (relative_point + size) % (2 * size) - size
+
+    def wrap_many(self, points):
+        origin = np.reshape(self.origin, -1)
+        return origin + self._minimum_image(points - origin)
+
+    def vector_many(self, points_from, points_to, pairs=None):
+        return self._minimum_image(self._difference(points_from, points_to, pairs))
+
+    def _minimum_image(self, diff):
+        size = np.reshape(self.half_length, -1)
+        return (diff + size) % (2 * size) - size
@@ -17,3 +17,11 @@ class Wall(Border):
 
     def vector(self, point2d_from, point2d_to):
         return point2d_to - point2d_from
+
+    def wrap_many(self, points):
+        half_len = np.reshape(self.length, -1) / 2
+        origin = np.reshape(self.origin, -1)
+        return np.clip(points, origin - half_len, origin + half_len)
+
+    def vector_many(self, points_from, points_to, pairs=None):
+        return self._difference(points_from, points_to, pairs)
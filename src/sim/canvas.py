@@ -1,41 +1,79 @@
 # -*- coding: utf-8 -*-
 import os
+import sys
+import traceback
+from math import ceil
 from time import localtime, strftime
-import subprocess
 
-import matplotlib.pyplot as plt
 import numpy as np
 
-from .borders import Border, Infinite
-from . import OUT_DIR, PALETTE
+from .borders import Infinite
+from . import OUT_DIR
+from .frame import FRAME_SUFFIX, Frame, FrameRenderer
+from .raster import RasterRenderer
+from .video import VideoEncoder
+from .writer import AsyncWriter
 
 
 class Canvas:
-    def __init__(self, dt, render):
+    def __init__(
+        self,
+        dt,
+        render,
+        res=(1920, 1080),
+        codec="libvpx-vp9",
+        blit=True,
+        renderer="matplotlib",
+        schedule=None,
+        batch=False,
+    ):
         """Canvas Constructor.
 
         Args:
             dt (int): simulation time step.
             render (bool): predicate for video generation.
+            res (list<int>, optional): The width and the height of the video (in pixels). Defaults to (1920, 1080).
+            codec (str, optional): The ffmpeg video codec. Defaults to 'libvpx-vp9'.
+            blit (bool, optional): Whether the background of the video frames is restored instead of drawn again.
+                Defaults to True.
+            renderer (str, optional): The renderer of the video frames and the snapshots, 'matplotlib' (PDF
+                snapshots) or 'raster' (faster, PNG snapshots without the properties). Defaults to 'matplotlib'.
+            schedule (FrameSchedule, optional): The ticks rendered in the video. Defaults to None (every tick).
+            batch (bool, optional): Whether the snapshots are saved as frames to draw later (see sim.snapshots),
+                without importing matplotlib. Defaults to False.
+
+        Raises:
+            ValueError: When a video is rendered in batch mode.
 
         """
+        if render and batch:
+            raise ValueError("The video can't be rendered in batch mode")
         self.cond_border = True
         """bool: indicate if there is walls on the edge of the simulation"""
-        self.fps = float(1 / dt)
+        self.schedule = schedule or FrameSchedule(dt)
+        """FrameSchedule: The ticks rendered in the video."""
+        self.fps = self.schedule.fps
         """float: The frame rate (in Hertz)."""
         self.__render = render
         """bool: Whether the video is rendered or not."""
+        self.limits = None
+        """tuple<tuple<float,float>,tuple<float,float>>: The X and Y limits of a fixed border (None fits)."""
+        self.current_frame = None
+        """Frame: The last drawn frame."""
+        self.snapshots = None
+        if not batch:
+            self.snapshots = RasterRenderer(res) if renderer == "raster" else FrameRenderer((8, 4.5))
+        """FrameRenderer or RasterRenderer: The renderer of the snapshots, used by the writer only (None saves the
+        frames instead)."""
+        self.writer = AsyncWriter()
+        """AsyncWriter: The writer saving the images (and the logs) in the background."""
         if self.render:
             # Prepare for rendering
-            if not os.path.exists(OUT_DIR):
-                os.mkdir(OUT_DIR)
-            self.filename = OUT_DIR + strftime("%Y%m%dT%H%M%S", localtime()) + ".mp4"
-            self.video = (
-                f"ffmpeg -r {self.fps} -i {OUT_DIR}"
-                + r"%d.svg -qscale:v 0 -c:v libvpx-vp9 -vf scale=1920:1080 -crf 20 -hide_banner " #-loglevel quiet
-                + self.filename
-                + f"; rm {OUT_DIR}*.svg" 
-            )
+            os.makedirs(OUT_DIR, exist_ok=True)
+            # The process id keeps apart the videos of runs started at the same time
+            self.filename = OUT_DIR + strftime("%Y%m%dT%H%M%S", localtime()) + f"_{os.getpid()}.mp4"
+            self.video = VideoEncoder(self.filename, res, self.fps, codec, blit=blit, renderer=renderer)
+            """VideoEncoder: The encoder of the video."""
 
     @property
     def render(self):
@@ -55,55 +93,49 @@ class Canvas:
         """
         return self
 
-    def __exit__(self, *args, **kwargs):
+    def __exit__(self, exc_type, exc_value, exc_traceback):
         """Ending method.
 
-        Output the final video.
+        Wait for the pending outputs, then output the final video. An error of the outputs is raised, unless the
+        simulation already raised one: then it is printed, not to hide the error of the simulation.
 
         Args:
-            *args: Variable length argument list.
-            **kwargs: Arbitrary keyword arguments.
+            exc_type (type): The type of the error raised by the simulation (None without error).
+            exc_value (BaseException): The error raised by the simulation.
+            exc_traceback (traceback): The traceback of the error raised by the simulation.
 
         """
-        if self.render:
-            subprocess.call(self.video, shell=True)
+        try:
+            self.writer.close()
+        except Exception as error:
+            if exc_type is None:
+                raise
+            print("***ERROR: the outputs failed too:", file=sys.stderr)
+            traceback.print_exception(type(error), error, error.__traceback__)
+        finally:
+            if self.render:
+                self.video.close()
 
     def draw(self, border, pop, verbose):
-        """Generation a new frame.
+        """Generate a new frame.
 
-        Returns:
-            pyplot.figure: The frame.
+        Args:
+            border (Border): The border of the universe.
+            pop (Population): The population to draw.
+            verbose (bool): Whether the properties of the population are drawn.
 
         """
-        valc = plt.figure(
-            figsize=(8, 4.5), tight_layout=True, facecolor=PALETTE["background"]
-        ).add_subplot(111, facecolor=PALETTE["background"])
-        valc.set_aspect("equal")
-        valc.axis("off")
-
+        self.limits = None
         if not isinstance(border, Infinite):  # fix border
             self.cond_border = False
             begin = border.origin - border.length
             end = border.origin + border.length
-            valc.set_xlim(begin[0], end[0])
-            valc.set_ylim(begin[1], end[1])
+            self.limits = ((begin[0], end[0]), (begin[1], end[1]))
 
         x, y, u, v, color = pop.draw()
-        y = np.array(y)-y[-1]
-        x = np.array(x)-x[-1]
-        self.quiver = valc.quiver(x, y, u, v, color=color, pivot="middle",units='xy')
-        if verbose:
-            s = "\n".join(pop.get_properties())
-            self.text = valc.get_figure().text(
-                0.015,
-                0.975,
-                s,
-                bbox=dict(facecolor=PALETTE["highlight"], alpha=0.5),
-                ha="left",
-                va="top",
-            )
-
-        self.current_frame = valc
+        y = np.array(y) - y[-1]
+        x = np.array(x) - x[-1]
+        self.current_frame = Frame(x, y, u, v, color, self.limits, pop.get_properties() if verbose else None)
 
     def update(self, ind, pop, verbose):
         """Update the video file and the frame.
@@ -114,43 +146,97 @@ class Canvas:
 
         """
         if self.render:
-            if self.cond_border:
-                self.current_frame.relim()
-                self.current_frame.autoscale_view()
+            x, y, u, v, color = pop.draw()
+            limits = None if self.cond_border else self.limits
+            self.current_frame = Frame(x, y, u, v, color, limits, pop.get_properties() if verbose else None)
+            self.writer.submit(self.video.write, self.current_frame)
 
-            self.show_pop(pop)
-
-            if verbose:
-                self.show_properties(pop.get_properties())
-            self.current_frame.get_figure().savefig(f"{OUT_DIR}{ind}.svg")
+    def snapshot(self, filename):
+        """Save a the current frame as an image.
 
-    def show_properties(self, properties):
-        """Get a list of string describing the properties.
+        The image is saved by the writer, in the background. In batch mode, the frame is saved instead, to draw it
+        later.
 
-        Returns:
-            A list of string describing the properties.
+        Args:
+            filename: The given file name (aka. the path to save to).
 
         """
+        if self.snapshots is None:
+            self.writer.submit(self.current_frame.dump, filename + FRAME_SUFFIX)
+        else:
+            self.writer.submit(self.snapshots.save, self.current_frame, f"{filename}.{self.snapshots.EXTENSION}")
+
+
+
+class FrameSchedule:
+    """The class selects the ticks rendered in a video.
 
-        s = "\n".join(properties)
-        self.text.set_text(s)
+    The rendered ticks are every k-th tick of a window of ticks. The frame rate keeps the playback speed
+    physically correct: one second of video shows one second of simulation, unless a duration is targeted. Then
+    the decimation is raised until the frame rate is at most the maximal one, and the whole window is played at a
+    constant speed in the given duration.
 
-    def show_pop(self, pop):
-        """Get a list of string describing the properties.
+    """
+
+    def __init__(self, dt, steps=None, every=1, window=(0, None), duration=None, max_fps=30.0):
+        """Build a frame schedule.
+
+        Args:
+            dt (float): The time step (in seconds).
+            steps (int, optional): The number of steps of the simulation. Defaults to None (unknown).
+            every (int, optional): The number of ticks between two rendered ticks. Defaults to 1.
+            window (tuple<int,int>, optional): The first rendered tick and the tick after the last one (None for
+                the end of the simulation). Defaults to (0, None).
+            duration (float, optional): The duration of the video (in seconds). Defaults to None (the simulated
+                duration).
+            max_fps (float, optional): The maximal frame rate when a duration is targeted (in Hertz). Defaults to
+                30.
+
+        Raises:
+            ValueError: When every is not positive, when the window is empty, or when a duration is targeted
+                without an end to the window.
+        """
+        if every < 1:
+            raise ValueError(f"Every {every} ticks can't be rendered")
+        start, stop = window
+        if steps is not None:
+            stop = steps if stop is None else min(stop, steps)
+        if stop is not None and stop <= start:
+            raise ValueError(f"The window [{start}, {stop}) of rendered ticks is empty")
+        if duration is not None and stop is None:
+            raise ValueError("A duration can't be targeted without an end to the window of rendered ticks")
+        self.start = start
+        """int: The first rendered tick."""
+        self.stop = stop
+        """int: The tick after the last rendered one (None for no end)."""
+        self.every = every
+        """int: The number of ticks between two rendered ticks."""
+        self.fps = 1 / (dt * every)
+        """float: The frame rate (in Hertz)."""
+        if duration is not None:
+            ticks = stop - start
+            self.every = max(every, ceil(ticks / (duration * max_fps)))
+            self.fps = ceil(ticks / self.every) / duration
+
+    @property
+    def frames(self):
+        """Get the number of rendered ticks.
 
         Returns:
-            A list of string describing the properties.
+            int: The number of rendered ticks (None without an end to the window).
 
         """
-        x, y, u, v, color = pop.draw()
-        self.quiver.remove()
-        self.quiver = self.current_frame.quiver(x, y, u, v, color=color, pivot="middle",units='xy')
+        return len(range(self.start, self.stop, self.every)) if self.stop is not None else None
 
-    def snapshot(self, filename):
-        """Save a the current frame as an image.
+    def rendered(self, tick):
+        """Whether a tick is rendered.
 
         Args:
-            filename: The given file name (aka. the path to save to).
+            tick (int): The tick.
+
+        Returns:
+            bool: Whether the tick is rendered.
 
         """
-        self.current_frame.get_figure().savefig(f"{filename}.pdf", bbox_inches=0)
+        before_stop = self.stop is None or tick < self.stop
+        return self.start <= tick and before_stop and (tick - self.start) % self.every == 0
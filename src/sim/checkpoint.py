@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+import json
+
+import numpy as np
+
+from .engine import Engine
+
+
+def save(path, universe, step, incrementor=None, loggers=()):
+    """Save the state of a simulation as a checkpoint.
+
+    The columns of the individuals and the per-replica parameters are stored as arrays in a NumPy archive, the
+    other values (random generator states, incrementor counters, logged data) as JSON.
+
+    Args:
+        path (str): The path to the archive.
+        universe (Universe): The universe to save.
+        step (int): The number of steps already performed.
+        incrementor (Incrementor, optional): The incrementor of the range of orientation. Defaults to None.
+        loggers (list<DataLogger>, optional): The data logger of each replica. Defaults to ().
+    """
+    pop = universe.pop
+    arrays = {f"engine_{name}": column for name, column in pop.engine.columns().items()}
+    params = {}
+    for name in pop.PER_REPLICA:
+        value = getattr(pop, name)
+        if np.ndim(value) > 0:
+            arrays[f"param_{name}"] = np.asarray(value)
+        else:
+            params[name] = float(value)
+    meta = {
+        "step": step,
+        "dt": universe.dt,
+        "replicas": pop.replicas,
+        "color": pop.engine.color,
+        "params": params,
+        "rngs": [rng.bit_generator.state for rng in pop.rngs],
+        "incrementor": None if incrementor is None else vars(incrementor),
+        "loggers": [dl.dump() for dl in loggers],
+    }
+    np.savez_compressed(path, meta=np.array(json.dumps(meta)), **arrays)
+
+
+def restore(path, universe, incrementor=None):
+    """Restore the state of a simulation from a checkpoint.
+
+    The population of the universe is replaced; its perception and its other settings are kept.
+
+    Args:
+        path (str): The path to the archive.
+        universe (Universe): The universe to restore.
+        incrementor (Incrementor, optional): The incrementor of the range of orientation to restore. Defaults to
+            None.
+
+    Returns:
+        tuple<int,list<dict>>: The number of steps already performed and the logged data of each replica (see
+            DataLogger.load()).
+    """
+    with np.load(path) as archive:
+        meta = json.loads(str(archive["meta"]))
+        columns = {name[7:]: archive[name] for name in archive.files if name.startswith("engine_")}
+        params = {name[6:]: archive[name] for name in archive.files if name.startswith("param_")}
+    params.update(meta["params"])
+
+    pop = universe.pop
+    pop.engine = Engine.from_columns(columns, meta["color"])
+    pop.replicas = meta["replicas"]
+    pop.rngs = []
+    for state in meta["rngs"]:
+        rng = np.random.default_rng()
+        rng.bit_generator.state = state
+        pop.rngs.append(rng)
+    for name, value in params.items():
+        setattr(pop, name, value)
+    pop.verlet_list = None
+    if incrementor is not None and meta["incrementor"] is not None:
+        vars(incrementor).update(meta["incrementor"])
+    return meta["step"], meta["loggers"]
@@ -1,36 +1,330 @@
 # -*- coding: utf-8 -*-
 import datetime
+import glob
 import os
 
+import numpy as np
 import pandas
 
+from .writer import output
+
+
+class Table:
+    """The class stores rows of data as typed columns.
+
+    Each column is a NumPy buffer grown by doubling, so adding rows costs an amortized constant time per row and
+    the data frame is only built on demand. A vector value is stored as one column per component, suffixed by
+    _x and _y for 2D vectors (by the component index otherwise).
+
+    """
+
+    def __init__(self, capacity=64, chunk=0, sink=None):
+        """Build an empty table.
+
+        Args:
+            capacity (int, optional): The initial number of rows the buffers can hold. Defaults to 64.
+            chunk (int, optional): The number of rows handed to the sink at once. Defaults to 0 (the rows are
+                kept).
+            sink (callable, optional): The function receiving the data frame of each full chunk, whose rows are
+                then forgotten. Defaults to None.
+
+        """
+        self.chunk = chunk
+        """int: The number of rows handed to the sink at once (0 keeps the rows)."""
+        self.sink = sink
+        """callable: The function receiving the data frame of each full chunk."""
+        self.offset = 0
+        """int: The number of rows already handed to the sink."""
+        self._size = 0
+        """int: The number of rows."""
+        self._capacity = capacity
+        """int: The number of rows the buffers can hold."""
+        self._buffers = {}
+        """dict<str,numpy.ndarray>: The buffer of each column."""
+
+    def __len__(self):
+        return self._size
+
+    def append(self, row):
+        """Add a row.
+
+        Args:
+            row (dict): The value of each column.
+
+        """
+        self.extend({name: np.asarray(value)[np.newaxis] for name, value in row.items()})
+
+    def extend(self, columns):
+        """Add several rows.
+
+        The columns missing from the new rows are filled with NaN (or None), as are the new columns in the
+        previous rows.
+
+        Args:
+            columns (dict<str,numpy.ndarray>): The values of each column, one row per value (a 2D array holds
+                vectors).
+
+        Raises:
+            ValueError: When the columns don't have the same number of values, or when an integer or boolean
+                column is missing.
+
+        """
+        columns = self._split(columns)
+        sizes = {len(values) for values in columns.values()}
+        if len(sizes) > 1:
+            raise ValueError("The columns don't have the same number of values")
+        n = sizes.pop() if sizes else 0
+        self._reserve(self._size + n)
+
+        rows = slice(self._size, self._size + n)
+        for name, values in columns.items():
+            self._store(name, values, rows)
+        for name in self._buffers.keys() - columns.keys():
+            buffer = self._buffers[name]
+            if buffer.dtype.kind not in "fO":
+                raise ValueError(f"The values of the column {name} are missing")
+            buffer[rows] = np.nan if buffer.dtype.kind == "f" else None
+        self._size += n
+
+        if self.chunk > 0 and self.sink is not None and self._size >= self.chunk:
+            self.drain()
+
+    def drain(self):
+        """Hand the rows to the sink, then forget them."""
+        if self._size > 0 and self.sink is not None:
+            self.sink(self.frame())
+            self.offset += self._size
+            self._size = 0
+
+    def frame(self):
+        """Build the data frame of the rows (indexed after the rows already handed to the sink).
+
+        Returns:
+            pandas.DataFrame: The data frame.
+
+        """
+        return pandas.DataFrame(
+            {name: buffer[: self._size] for name, buffer in self._buffers.items()},
+            index=pandas.RangeIndex(self.offset, self.offset + self._size),
+        )
+
+    def dump(self):
+        """Dump the rows as plain values.
+
+        Returns:
+            dict<str,list>: The values of each column.
+
+        """
+        return {name: buffer[: self._size].tolist() for name, buffer in self._buffers.items()}
+
+    @staticmethod
+    def _split(columns):
+        """Split the vector columns into one column per component.
+
+        Args:
+            columns (dict<str,numpy.ndarray>): The values of each column.
+
+        Returns:
+            dict<str,numpy.ndarray>: The values of each scalar column.
+
+        """
+        scalars = {}
+        for name, values in columns.items():
+            values = np.asarray(values)
+            if values.ndim == 2:
+                suffixes = "xy" if values.shape[1] == 2 else range(values.shape[1])
+                for k, suffix in enumerate(suffixes):
+                    scalars[f"{name}_{suffix}"] = values[:, k]
+            else:
+                scalars[name] = values
+        return scalars
+
+    def _reserve(self, size):
+        """Grow the buffers to hold the given number of rows.
+
+        Args:
+            size (int): The number of rows to hold.
+
+        """
+        if size <= self._capacity:
+            return
+        while self._capacity < size:
+            self._capacity *= 2
+        for name, buffer in self._buffers.items():
+            grown = np.empty(self._capacity, dtype=buffer.dtype)
+            grown[: self._size] = buffer[: self._size]
+            self._buffers[name] = grown
+
+    def _store(self, name, values, rows):
+        """Store the values of a column, creating or widening its buffer when required.
+
+        Args:
+            name (str): The name of the column.
+            values (numpy.ndarray): The values to store.
+            rows (slice): The rows to store the values in.
+
+        """
+        dtype = values.dtype if values.dtype.kind in "biuf" else np.dtype(object)
+        if name not in self._buffers:
+            buffer = np.empty(self._capacity, dtype=dtype)
+            if self._size > 0:
+                # The previous rows are NaN
+                if dtype.kind in "biu":
+                    buffer = buffer.astype(float)
+                buffer[: self._size] = np.nan if buffer.dtype.kind == "f" else None
+            self._buffers[name] = buffer
+        buffer = self._buffers[name]
+        wider = np.result_type(buffer.dtype, dtype)
+        if wider != buffer.dtype:
+            buffer = self._buffers[name] = buffer.astype(wider)
+        buffer[rows] = values
+
+
+def read_log(path):
+    """Read a log written by a DataLogger, whatever its format.
+
+    Args:
+        path (str): The path to the log, without extension (e.g. ../logs/run/quantities).
+
+    Returns:
+        pandas.DataFrame: The logged rows.
+    """
+    if os.path.isfile(path + ".csv"):
+        return pandas.read_csv(path + ".csv", index_col=0, float_precision="round_trip")
+    frames = []
+    for part in sorted(glob.glob(os.path.join(path, "part-*"))):
+        if part.endswith(".parquet"):
+            frames.append(pandas.read_parquet(part))
+        else:
+            with np.load(part) as archive:
+                frames.append(pandas.DataFrame({name: archive[name] for name in archive.files}))
+    return pandas.concat(frames, ignore_index=True) if frames else pandas.DataFrame()
+
 
 class DataLogger:
-    def __init__(self):
-        """Build a DataLogger with a default destination name."""
+    FORMATS = ("csv", "npz", "parquet")
+    """tuple<str>: The formats of the logs."""
+
+    def __init__(self, log_format="csv", chunk=0, writer=None):
+        """Build a DataLogger with a default destination name.
+
+        Args:
+            log_format (str, optional): The format of the logs: 'csv' (one file per log), 'npz' or 'parquet' (a
+                folder of typed parts per log, parquet requiring pyarrow). Defaults to 'csv'.
+            chunk (int, optional): The number of rows written at once while logging. Defaults to 0 (every row is
+                written by flush()).
+            writer (AsyncWriter, optional): The writer writing the logs in the background. Defaults to None (the
+                logs are written at once).
+        """
+        if log_format not in self.FORMATS:
+            raise ValueError(f"Unknown log format: {log_format}")
         now = datetime.datetime.now()
         name = now.strftime("%d-%m-%Y_%H-%M-%S")
         self.destination = f"../logs/{name}/"
         """str: The folder to save the CSV file in."""
-        self.state = pandas.DataFrame()
-        """pandas.DataFrame: The state information."""
-        self.quantities = pandas.DataFrame()
-        """pandas.DataFrame: The quantities information."""
+        self.log_format = log_format
+        """str: The format of the logs."""
+        self.chunk = chunk
+        """int: The number of rows written at once while logging (0 waits for flush())."""
+        self.writer = writer
+        """AsyncWriter: The writer writing the logs in the background (None writes them at once)."""
+        self.parts = {}
+        """dict<str,int>: The number of parts written for each log."""
+        self.state = self._table("state")
+        """Table: The state information."""
+        self.quantities = self._table("quantities")
+        """Table: The quantities information."""
 
     def flush(self):
-        """Flush all the data as CSV file."""
+        """Write the remaining data (the data frames as CSV files)."""
         self.mkdir_dest()
 
-        # Store all data frame
+        # Store all tables and data frames
         for name, value in self.__dict__.items():
-            if isinstance(value, pandas.DataFrame):
+            if isinstance(value, Table):
+                if value.offset == 0:
+                    # Nothing written yet: write the whole log, even empty, over any previous flush
+                    output(self.writer, self.write, name, value.frame(), True)
+                else:
+                    value.drain()
+            elif isinstance(value, pandas.DataFrame):
                 path = f"{self.destination}{name}.csv"
-                value.to_csv(path)
+                output(self.writer, value.copy().to_csv, path)
+
+    def write(self, name, frame, first=False):
+        """Write rows at the end of a log.
+
+        Args:
+            name (str): The name of the log.
+            frame (pandas.DataFrame): The rows to write.
+            first (bool, optional): Whether the rows are written as the first part, over the previous ones.
+                Defaults to False.
+        """
+        self.mkdir_dest()
+        part = 0 if first else self.parts.get(name, 0)
+        self.parts[name] = part + 1
+        if self.log_format == "csv":
+            frame.to_csv(f"{self.destination}{name}.csv", mode="w" if part == 0 else "a", header=part == 0)
+            return
+        folder = f"{self.destination}{name}/"
+        os.makedirs(folder, exist_ok=True)
+        if self.log_format == "parquet":
+            frame.to_parquet(f"{folder}part-{part:05d}.parquet", index=False)  # Requires pyarrow
+        else:
+            columns = {column: self._typed(frame[column].to_numpy()) for column in frame.columns}
+            np.savez(f"{folder}part-{part:05d}.npz", **columns)
+
+    def dump(self):
+        """Dump the data to restore it later, including the rows already written.
+
+        Returns:
+            dict<str,dict<str,list>>: The values of each column of each table.
+        """
+        if self.writer is not None:
+            self.writer.wait()  # The written rows are read back
+        dump = {}
+        for name, value in self.__dict__.items():
+            if isinstance(value, Table):
+                frame = value.frame()
+                if value.offset > 0:
+                    frame = pandas.concat([read_log(f"{self.destination}{name}"), frame], ignore_index=True)
+                dump[name] = {column: frame[column].tolist() for column in frame.columns}
+        return dump
+
+    def load(self, dump):
+        """Restore the dumped data.
+
+        Args:
+            dump (dict<str,dict<str,list>>): The values of each column of each table.
+        """
+        for name, columns in dump.items():
+            table = self._table(name)
+            table.extend(columns)
+            setattr(self, name, table)
 
     def mkdir_dest(self):
-        """Make the required directories."""
-        from_start = ""
-        for folder in self.destination.split("/")[:-1]:
-            from_start += f"{folder}/"
-            if not os.path.exists(from_start):
-                os.mkdir(from_start)
+        """Make the required directories (concurrent simulations may make them at the same time)."""
+        os.makedirs(self.destination, exist_ok=True)
+
+    def _table(self, name):
+        """Build a table streamed to a log.
+
+        Args:
+            name (str): The name of the log.
+
+        Returns:
+            Table: The table.
+        """
+        return Table(chunk=self.chunk, sink=lambda frame: output(self.writer, self.write, name, frame))
+
+    @staticmethod
+    def _typed(values):
+        """Convert the values of an object column to strings, to store them without pickling.
+
+        Args:
+            values (numpy.ndarray): The values of a column.
+
+        Returns:
+            numpy.ndarray: The typed values.
+        """
+        return values.astype(str) if values.dtype.kind == "O" else values
@@ -0,0 +1,311 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+
+from . import Individual
+from .utils import normalize_angles
+
+
+def _column(name, doc):
+    """Build a property reading and writing one row of an engine column.
+
+    Args:
+        name (str): The name of the engine column.
+        doc (str): The docstring of the property.
+
+    Returns:
+        property: The property to install on IndividualView.
+    """
+
+    def fget(self):
+        return float(getattr(self.engine, name)[self.index])
+
+    def fset(self, value):
+        getattr(self.engine, name)[self.index] = value
+
+    return property(fget, fset, doc=doc)
+
+
+def _array(name, doc):
+    """Build a property exposing the used part of an engine buffer.
+
+    Args:
+        name (str): The name of the buffer.
+        doc (str): The docstring of the property.
+
+    Returns:
+        property: The property to install on Engine.
+    """
+
+    def fget(self):
+        return self._buffers[name][: self._size]
+
+    def fset(self, value):
+        self._buffers[name][: self._size] = value
+
+    return property(fget, fset, doc=doc)
+
+
+def all_pairs(replica):
+    """List every ordered pair of distinct individuals of the same replica.
+
+    Args:
+        replica (numpy.ndarray): The replica of each individual.
+
+    Returns:
+        tuple<numpy.ndarray,numpy.ndarray>: The indices (i, j) of the pairs, sorted by i then j.
+    """
+    i_list = [np.zeros(0, dtype=int)]
+    j_list = [np.zeros(0, dtype=int)]
+    for value in np.unique(replica):
+        members = np.flatnonzero(replica == value)
+        i, j = np.nonzero(~np.eye(len(members), dtype=bool))
+        i_list.append(members[i])
+        j_list.append(members[j])
+    i = np.concatenate(i_list)
+    j = np.concatenate(j_list)
+    sort = np.lexsort((j, i))
+    return i[sort], j[sort]
+
+
+class IndividualView(Individual):
+    """The class exposes one individual of an Engine as an Individual.
+
+    Reading or writing an attribute reads or writes the engine arrays, so the view stays valid when the engine
+    grows.
+
+    """
+
+    def __init__(self, engine, index):
+        """Build a view on an individual of an engine.
+
+        Args:
+            engine (Engine): The engine storing the individual.
+            index (int): The index of the individual in the engine.
+
+        """
+        self.engine = engine
+        """Engine: The engine storing the individual."""
+        self.index = index
+        """int: The index of the individual in the engine."""
+
+    @property
+    def pos(self):
+        """numpy.ndarray: The position (in length units)."""
+        return self.engine.pos[self.index].reshape(-1, 1)
+
+    @pos.setter
+    def pos(self, value):
+        self.engine.pos[self.index] = np.reshape(value, -1)
+
+    @property
+    def angle(self):
+        """float: The orientation (in radians)."""
+        return float(self.engine.angle[self.index])
+
+    @angle.setter
+    def angle(self, value):
+        self.engine.angle[self.index] = normalize_angles(np.reshape(value, -1)[0])
+
+    @property
+    def replica(self):
+        """int: The replica the individual belongs to."""
+        return int(self.engine.replica[self.index])
+
+    @property
+    def color(self):
+        """The color to display."""
+        return self.engine.color[self.index]
+
+    @color.setter
+    def color(self, value):
+        self.engine.color[self.index] = value
+
+    speed = _column("speed", "float: The speed (in length units per seconds).")
+    turning_rate = _column("turning_rate", "float: The angular speed (in radians per seconds).")
+    ror = _column("ror", "float: The range of repulsion (in length units).")
+    roo = _column("roo", "float: The range of orientation (in length units).")
+    roa = _column("roa", "float: The range of attraction (in length units).")
+
+
+class Engine:
+    """The class stores a population as a structure of arrays.
+
+    Every per-individual quantity lives in a contiguous array, so the kinematics of the whole population is
+    updated with whole-array operations. Individual-style views are kept for the callers working on one
+    individual at a time.
+
+    Independent replicas of a population can share one engine: each individual is tagged with its replica and
+    never interacts with the other replicas.
+
+    """
+
+    def __init__(self, capacity=64):
+        """Build an empty engine.
+
+        Args:
+            capacity (int, optional): The initial number of individuals the buffers can hold. Defaults to 64.
+
+        """
+        self._size = 0
+        """int: The number of individuals."""
+        self._buffers = {
+            "pos": np.zeros((capacity, 2)),
+            "angle": np.zeros(capacity),
+            "speed": np.zeros(capacity),
+            "turning_rate": np.zeros(capacity),
+            "ror": np.zeros(capacity),
+            "roo": np.zeros(capacity),
+            "roa": np.zeros(capacity),
+            "replica": np.zeros(capacity, dtype=int),
+        }
+        """dict<str,numpy.ndarray>: The buffers holding the columns (grown by doubling)."""
+        self.color = []
+        """list: The color of each individual."""
+        self.views = []
+        """list<IndividualView>: The view on each individual."""
+
+    pos = _array("pos", "numpy.ndarray: The (N,2) positions (in length units).")
+    angle = _array("angle", "numpy.ndarray: The orientations (in radians).")
+    speed = _array("speed", "numpy.ndarray: The speeds (in length units per seconds).")
+    turning_rate = _array("turning_rate", "numpy.ndarray: The angular speeds (in radians per seconds).")
+    ror = _array("ror", "numpy.ndarray: The ranges of repulsion (in length units).")
+    roo = _array("roo", "numpy.ndarray: The ranges of orientation (in length units).")
+    roa = _array("roa", "numpy.ndarray: The ranges of attraction (in length units).")
+    replica = _array("replica", "numpy.ndarray: The replica of each individual.")
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def dir(self):
+        """Get the unitary vectors of direction.
+
+        Returns:
+            numpy.ndarray: The (N,2) unitary vectors of direction.
+
+        """
+        return np.stack([np.cos(self.angle), np.sin(self.angle)], axis=1)
+
+    def append(self, ind, replica=0):
+        """Copy an individual at the end of the arrays.
+
+        Args:
+            ind (Individual): The individual to copy.
+            replica (int, optional): The replica the individual belongs to. Defaults to 0.
+
+        Returns:
+            IndividualView: The view on the stored individual.
+
+        """
+        if self._size == len(self._buffers["pos"]):
+            for name, buffer in self._buffers.items():
+                grown = np.zeros((2 * len(buffer),) + buffer.shape[1:], dtype=buffer.dtype)
+                grown[: self._size] = buffer
+                self._buffers[name] = grown
+        self._size += 1
+        self.color.append(None)
+        self.replica[-1] = replica
+        view = IndividualView(self, self._size - 1)
+        view.pos = ind.pos
+        view.angle = ind.angle
+        view.color = ind.color
+        view.speed = ind.speed
+        view.turning_rate = ind.turning_rate
+        view.ror = ind.ror
+        view.roo = ind.roo
+        view.roa = ind.roa
+        self.views.append(view)
+        return view
+
+    def columns(self):
+        """Get the used part of every column.
+
+        Returns:
+            dict<str,numpy.ndarray>: The column of each name.
+
+        """
+        return {name: buffer[: self._size] for name, buffer in self._buffers.items()}
+
+    @classmethod
+    def from_columns(cls, columns, color):
+        """Build an engine holding the given columns.
+
+        Args:
+            columns (dict<str,numpy.ndarray>): The column of each name, as returned by columns().
+            color (list): The color of each individual.
+
+        Returns:
+            Engine: The new engine.
+
+        """
+        engine = cls(max(len(color), 1))
+        engine._size = len(color)
+        for name, column in columns.items():
+            engine._buffers[name][: len(color)] = column
+        engine.color = list(color)
+        engine.views = [IndividualView(engine, k) for k in range(len(color))]
+        return engine
+
+    def take(self, index):
+        """Copy some individuals into a new engine.
+
+        Args:
+            index (numpy.ndarray): The indices of the individuals to copy.
+
+        Returns:
+            Engine: The new engine holding the copies.
+
+        """
+        columns = {name: column[index] for name, column in self.columns().items()}
+        return Engine.from_columns(columns, [self.color[k] for k in index])
+
+    def truncate(self, n):
+        """Forget the individuals past the given number.
+
+        Args:
+            n (int): The number of individuals to keep.
+
+        """
+        self._size = n
+        del self.color[n:]
+        del self.views[n:]
+
+    def turn_by(self, dangles, dt):
+        """Movement from the given angular speeds.
+
+        Args:
+            dangles (numpy.ndarray): The angular variations (in radians).
+            dt (float): The simulation time step (in seconds).
+
+        """
+        # Don't turn too fast
+        limit = dt * self.turning_rate
+        self.angle = normalize_angles(self.angle + np.clip(dangles, -limit, limit))
+
+    def turn_to(self, angles, dt):
+        """Turn to the desired angles.
+
+        Args:
+            angles (numpy.ndarray): The desired orientations (in radians).
+            dt (float): The simulation time step (in seconds).
+
+        """
+        self.turn_by(normalize_angles(angles - self.angle), dt)
+
+    def tick(self, dt):
+        """Update the positions wrt. the velocities.
+
+        Args:
+            dt (float): simulation time step.
+
+        """
+        self.pos += (self.speed * dt)[:, np.newaxis] * self.dir
+
+    def wrap(self, border):
+        """Wrap the positions to stay within the border.
+
+        Args:
+            border (Border): The border policy.
+
+        """
+        self.pos = border.wrap_many(self.pos)
@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+
+from . import PALETTE
+
+FRAME_SUFFIX = ".frame.npz"
+"""str: The suffix of the saved frames."""
+
+
+class Frame:
+    """The class holds what a frame shows, to draw it later (on another thread).
+
+    The values are copies, so the frame is unchanged by the next ticks.
+
+    """
+
+    def __init__(self, x, y, u, v, color, limits=None, properties=None):
+        """Build a frame.
+
+        Args:
+            x (numpy.ndarray): The X position of each vector.
+            y (numpy.ndarray): The Y position of each vector.
+            u (numpy.ndarray): The X component of each vector.
+            v (numpy.ndarray): The Y component of each vector.
+            color (list<str>): The colour of each vector.
+            limits (tuple<tuple<float,float>,tuple<float,float>>, optional): The X and Y limits of the view.
+                Defaults to None (fit to the vectors).
+            properties (list<str>, optional): The properties written in the corner. Defaults to None.
+        """
+        self.x, self.y, self.u, self.v = (np.array(values, dtype=float) for values in (x, y, u, v))
+        """numpy.ndarray: The positions and the components of the vectors."""
+        self.color = list(color)
+        """list<str>: The colour of each vector."""
+        self.limits = limits
+        """tuple<tuple<float,float>,tuple<float,float>>: The X and Y limits of the view (None fits the vectors)."""
+        self.properties = None if properties is None else list(properties)
+        """list<str>: The properties written in the corner."""
+
+    def dump(self, path):
+        """Save the frame, to draw it later.
+
+        Args:
+            path (str): The path to the NumPy archive (.npz).
+        """
+        arrays = {"x": self.x, "y": self.y, "u": self.u, "v": self.v, "color": np.array(self.color, dtype=str)}
+        if self.limits is not None:
+            arrays["limits"] = np.array(self.limits, dtype=float)
+        if self.properties is not None:
+            arrays["properties"] = np.array(self.properties, dtype=str)
+        np.savez(path, **arrays)
+
+    @classmethod
+    def load(cls, path):
+        """Load a saved frame.
+
+        Args:
+            path (str): The path to the NumPy archive (.npz).
+
+        Returns:
+            Frame: The frame.
+        """
+        with np.load(path) as archive:
+            limits = tuple(map(tuple, archive["limits"].reshape(2, 2).tolist())) if "limits" in archive.files else None
+            properties = archive["properties"].tolist() if "properties" in archive.files else None
+            x, y, u, v = (archive[name] for name in "xyuv")
+            return cls(x, y, u, v, archive["color"].tolist(), limits, properties)
+
+
+class FrameRenderer:
+    """The class draws frames on a single figure, kept from frame to frame.
+
+    The figure is built once, with the object-oriented API of matplotlib (pyplot, not thread-safe, is not used).
+    Each frame only updates the quiver and the text artists. With blitting, the static background (the axes) is
+    rasterized again only when the view limits change; otherwise it is restored and the artists alone are drawn on
+    it.
+
+    """
+
+    EXTENSION = "pdf"
+    """str: The format of the saved images."""
+
+    def __init__(self, figsize, dpi=100, blit=False):
+        """Build a renderer.
+
+        Args:
+            figsize (tuple<float,float>): The width and the height of the figure (in inches).
+            dpi (int, optional): The resolution of the figure (in dots per inch). Defaults to 100.
+            blit (bool, optional): Whether the background is restored instead of drawn again. Defaults to False.
+        """
+        # Imported here, so that the simulations without images don't import matplotlib
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        self.figure = Figure(figsize=figsize, dpi=dpi, tight_layout=True, facecolor=PALETTE["background"])
+        """matplotlib.figure.Figure: The figure the frames are drawn on."""
+        self.canvas = FigureCanvasAgg(self.figure)
+        """FigureCanvasAgg: The canvas rasterizing the figure."""
+        self.valc = self.figure.add_subplot(111, facecolor=PALETTE["background"])
+        """matplotlib.axes.Axes: The axes of the vectors."""
+        self.valc.set_aspect("equal")
+        self.valc.axis("off")
+        self.blit = blit
+        """bool: Whether the background is restored instead of drawn again."""
+        self.quiver = None
+        """matplotlib.quiver.Quiver: The vectors."""
+        self.text = None
+        """matplotlib.text.Text: The properties written in the corner."""
+        self.background = None
+        """BufferRegion: The rasterized background (None when it must be drawn again)."""
+
+    def update(self, frame):
+        """Update the artists to show a frame.
+
+        Args:
+            frame (Frame): The frame to show.
+        """
+        limits = (self.valc.get_xlim(), self.valc.get_ylim())
+        if self.quiver is None or self.quiver.N != len(frame.x):
+            # The first frame, or a new number of vectors
+            if self.quiver is not None:
+                self.quiver.remove()
+            self.quiver = self.valc.quiver(
+                frame.x,
+                frame.y,
+                frame.u,
+                frame.v,
+                color=frame.color,
+                pivot="middle",
+                units="xy",
+                animated=self.blit,
+            )
+            self.background = None
+        else:
+            self.quiver.set_offsets(np.column_stack([frame.x, frame.y]))
+            self.quiver.set_UVC(frame.u, frame.v)
+            self.quiver.set_color(frame.color)
+        if frame.limits is not None:
+            self.valc.set_xlim(*frame.limits[0])
+            self.valc.set_ylim(*frame.limits[1])
+        else:
+            self.valc.dataLim.update_from_data_xy(self.quiver.get_offsets(), ignore=True)
+            self.valc.autoscale_view()
+        if (self.valc.get_xlim(), self.valc.get_ylim()) != limits:
+            self.background = None
+
+        if frame.properties is None:
+            if self.text is not None:
+                self.text.set_visible(False)
+        elif self.text is None:
+            self.text = self.figure.text(
+                0.015,
+                0.975,
+                "\n".join(frame.properties),
+                bbox=dict(facecolor=PALETTE["highlight"], alpha=0.5),
+                ha="left",
+                va="top",
+                animated=self.blit,
+            )
+        else:
+            self.text.set_text("\n".join(frame.properties))
+            self.text.set_visible(True)
+
+    def rasterize(self, frame):
+        """Rasterize a frame.
+
+        Args:
+            frame (Frame): The frame to rasterize.
+
+        Returns:
+            numpy.ndarray: The (H,W,4) RGBA pixels, overwritten by the next frame.
+        """
+        self.update(frame)
+        if not self.blit:
+            self.canvas.draw()
+        else:
+            if self.background is None:
+                self.canvas.draw()  # Without the animated artists
+                self.background = self.canvas.copy_from_bbox(self.figure.bbox)
+            else:
+                self.canvas.restore_region(self.background)
+            self.valc.draw_artist(self.quiver)
+            if self.text is not None and self.text.get_visible():
+                self.figure.draw_artist(self.text)
+        return np.asarray(self.canvas.buffer_rgba())
+
+    def save(self, frame, path, bbox_inches=0):
+        """Draw a frame and save it as an image.
+
+        Args:
+            frame (Frame): The frame to save.
+            path (str): The path to the image, whose extension gives the format.
+            bbox_inches (float or str, optional): The bounding box given to savefig(). Defaults to 0.
+        """
+        self.update(frame)
+        self.figure.savefig(path, bbox_inches=bbox_inches)
@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+from functools import cached_property
+
+import numpy as np
+
+from .borders import Toric
+from .engine import all_pairs
+
+
+class CellList:
+    """The class implements a uniform grid to list the pairs of close individuals.
+
+    The individuals are hashed into square cells whose side is the search radius, so the neighbors of an
+    individual can only lie in its own cell or in one of the 8 adjacent cells. Each replica gets its own cells.
+
+    """
+
+    OFFSETS = [(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1)]
+    """list<tuple<int,int>>: The offsets to the adjacent cells."""
+
+    def __init__(self, radius):
+        """Build a new cell list.
+
+        Args:
+            radius (float): The search radius (in length units), used as the cell side.
+
+        """
+        self.radius = radius
+        """float: The search radius (in length units)."""
+
+    def neighborhood(self, engine, border):
+        """List the pairs of individuals closer than the search radius.
+
+        Args:
+            engine (Engine): The population stored as arrays.
+            border (Border): The border policy.
+
+        Returns:
+            Neighborhood: The neighborhood of the pairs closer than the search radius.
+
+        """
+        pos = engine.pos
+        if not np.isfinite(self.radius) or len(pos) == 0:
+            return Neighborhood(engine, border, all_pairs(engine.replica))
+        if isinstance(border, Toric):
+            candidates = self._periodic_candidates(pos, engine.replica, border)
+        else:
+            candidates = self._candidates(pos, engine.replica)
+        neighborhood = Neighborhood(engine, border, candidates)
+        return neighborhood.subset(neighborhood.dist2 <= self.radius ** 2)
+
+    def _candidates(self, pos, replica):
+        """List the ordered pairs of individuals in the same or in adjacent cells.
+
+        Args:
+            pos (numpy.ndarray): The (N,2) positions.
+            replica (numpy.ndarray): The replica of each individual.
+
+        Returns:
+            tuple<numpy.ndarray,numpy.ndarray>: The indices (i, j) of the pairs, sorted by i then j.
+
+        """
+        cells = np.floor((pos - pos.min(axis=0)) / self.radius).astype(np.int64)
+        shape = cells.max(axis=0) + 1
+        return self._expand(cells, replica, shape, self.OFFSETS, periodic=False)
+
+    def _periodic_candidates(self, pos, replica, border):
+        """List the ordered pairs of individuals in the same or in adjacent cells of a torus.
+
+        The grid tiles the torus exactly, so the cells of the last row and column are adjacent to the first
+        ones. When the torus is less than 3 cells wide, each adjacent cell is only visited once.
+
+        Args:
+            pos (numpy.ndarray): The (N,2) positions.
+            replica (numpy.ndarray): The replica of each individual.
+            border (Toric): The toric border.
+
+        Returns:
+            tuple<numpy.ndarray,numpy.ndarray>: The indices (i, j) of the pairs, sorted by i then j.
+
+        """
+        length = np.reshape(border.length, -1).astype(float)
+        shape = np.maximum(np.floor(length / self.radius), 1).astype(np.int64)
+        corner = np.reshape(border.origin, -1) - length / 2
+        cells = np.floor((pos - corner) / (length / shape)).astype(np.int64) % shape
+        offsets = [
+            (dx, dy)
+            for dx in np.unique(np.array([-1, 0, 1]) % shape[0])
+            for dy in np.unique(np.array([-1, 0, 1]) % shape[1])
+        ]
+        return self._expand(cells, replica, shape, offsets, periodic=True)
+
+    @staticmethod
+    def _expand(cells, replica, shape, offsets, periodic):
+        """List the ordered pairs of individuals of a replica whose cells are separated by one of the offsets.
+
+        Args:
+            cells (numpy.ndarray): The (N,2) cell coordinates of each individual.
+            replica (numpy.ndarray): The replica of each individual.
+            shape (numpy.ndarray): The number of cells along each axis.
+            offsets (list<tuple<int,int>>): The offsets to the visited cells.
+            periodic (bool): Whether the grid wraps around its edges.
+
+        Returns:
+            tuple<numpy.ndarray,numpy.ndarray>: The indices (i, j) of the pairs, sorted by i then j.
+
+        """
+        n = len(cells)
+        keys = (replica * shape[0] + cells[:, 0]) * shape[1] + cells[:, 1]
+        order = np.argsort(keys, kind="stable")
+        sorted_keys = keys[order]
+
+        i_list = []
+        j_list = []
+        for offset in offsets:
+            adjacent = cells + offset
+            if periodic:
+                adjacent %= shape
+                valid = np.ones(n, dtype=bool)
+            else:
+                valid = np.all((adjacent >= 0) & (adjacent < shape), axis=1)
+            adjacent_keys = (replica * shape[0] + adjacent[:, 0]) * shape[1] + adjacent[:, 1]
+            start = np.searchsorted(sorted_keys, adjacent_keys, side="left")
+            stop = np.searchsorted(sorted_keys, adjacent_keys, side="right")
+            counts = np.where(valid, stop - start, 0)
+            # Expand each individual against the members of the adjacent cell
+            first = np.cumsum(counts) - counts
+            rank = np.arange(counts.sum()) - np.repeat(first, counts)
+            i_list.append(np.repeat(np.arange(n), counts))
+            j_list.append(order[np.repeat(start, counts) + rank])
+        i = np.concatenate(i_list)
+        j = np.concatenate(j_list)
+
+        distinct = i != j
+        i, j = i[distinct], j[distinct]
+        sort = np.lexsort((j, i))
+        return i[sort], j[sort]
+
+
+class VerletList:
+    """The class implements neighbor lists reused across ticks.
+
+    The pairs closer than the search radius plus a skin are listed with a cell list, then reused as candidates
+    until an individual has moved by more than half the skin since the listing. Until then, no pair can have
+    come closer than the search radius without being listed.
+
+    """
+
+    def __init__(self, radius, skin):
+        """Build a new Verlet list.
+
+        Args:
+            radius (float): The search radius (in length units).
+            skin (float): The extra distance listed to reuse the pairs (in length units).
+
+        """
+        self.radius = radius
+        """float: The search radius (in length units)."""
+        self.skin = skin
+        """float: The extra distance listed to reuse the pairs (in length units)."""
+        self.pairs = None
+        """tuple<numpy.ndarray,numpy.ndarray>: The listed pairs (i, j)."""
+        self.reference = None
+        """numpy.ndarray: The (N,2) positions when the pairs were listed."""
+
+    def neighborhood(self, engine, border):
+        """List the pairs of individuals closer than the search radius.
+
+        Args:
+            engine (Engine): The population stored as arrays.
+            border (Border): The border policy.
+
+        Returns:
+            Neighborhood: The neighborhood of the pairs closer than the search radius.
+
+        """
+        if self._is_outdated(engine, border):
+            listed = CellList(self.radius + self.skin).neighborhood(engine, border)
+            self.pairs = (listed.i, listed.j)
+            self.reference = engine.pos.copy()
+            return listed.subset(listed.dist2 <= self.radius ** 2)
+        neighborhood = Neighborhood(engine, border, self.pairs)
+        return neighborhood.subset(neighborhood.dist2 <= self.radius ** 2)
+
+    def _is_outdated(self, engine, border):
+        """Whether the pairs must be listed again.
+
+        Args:
+            engine (Engine): The population stored as arrays.
+            border (Border): The border policy.
+
+        Returns:
+            bool: Whether an individual was added or has moved by more than half the skin.
+
+        """
+        if self.reference is None or len(self.reference) != len(engine):
+            return True
+        index = np.arange(len(engine))
+        moved = border.vector_many(self.reference, engine.pos, (index, index))
+        return np.max(np.sum(moved ** 2, axis=1), initial=0.0) > (self.skin / 2) ** 2
+
+
+class Neighborhood:
+    """The class holds the candidate pairs of individuals of one tick and their geometry.
+
+    The geometry of each pair is computed once, on first access, and shared by every perception and by the
+    zone rules.
+
+    """
+
+    PAIRWISE = ("diff", "dist2", "dist", "along", "across")
+    """tuple<str>: The cached attributes holding one value per pair."""
+
+    def __init__(self, engine, border, pairs):
+        """Build a new neighborhood.
+
+        Args:
+            engine (Engine): The population stored as arrays.
+            border (Border): The border policy.
+            pairs (tuple<numpy.ndarray,numpy.ndarray>): The indices (i, j) of the candidate pairs, sorted by i.
+
+        """
+        self.engine = engine
+        """Engine: The population stored as arrays."""
+        self.border = border
+        """Border: The border policy."""
+        self.i, self.j = pairs
+        """numpy.ndarray: The indices of the observers (i) and of the observed individuals (j)."""
+
+    def __len__(self):
+        return len(self.i)
+
+    @cached_property
+    def heading(self):
+        """numpy.ndarray: The (N,2) unitary vectors of direction of the individuals."""
+        return self.engine.dir
+
+    @cached_property
+    def diff(self):
+        """numpy.ndarray: The (K,2) vectors from i to j (in length units)."""
+        return self.border.vector_many(self.engine.pos, self.engine.pos, (self.i, self.j))
+
+    @cached_property
+    def dist2(self):
+        """numpy.ndarray: The squared distances between i and j (in squared length units)."""
+        return np.sum(self.diff ** 2, axis=1)
+
+    @cached_property
+    def dist(self):
+        """numpy.ndarray: The distances between i and j (in length units)."""
+        return np.sqrt(self.dist2)
+
+    @cached_property
+    def along(self):
+        """numpy.ndarray: The projections of the vectors from i to j on the heading of i."""
+        heading = self.heading[self.i]
+        return heading[:, 0] * self.diff[:, 0] + heading[:, 1] * self.diff[:, 1]
+
+    @cached_property
+    def across(self):
+        """numpy.ndarray: The cross products of the heading of i with the vectors from i to j."""
+        heading = self.heading[self.i]
+        return heading[:, 0] * self.diff[:, 1] - heading[:, 1] * self.diff[:, 0]
+
+    def subset(self, mask):
+        """Restrict the neighborhood to some pairs, keeping the geometry already computed.
+
+        Args:
+            mask (numpy.ndarray): The pairs to keep.
+
+        Returns:
+            Neighborhood: The restricted neighborhood.
+
+        """
+        neighborhood = Neighborhood(self.engine, self.border, (self.i[mask], self.j[mask]))
+        for name, value in self.__dict__.items():
+            if name == "heading":
+                neighborhood.heading = value  # One value per individual
+            elif name in self.PAIRWISE:
+                neighborhood.__dict__[name] = value[mask]
+        return neighborhood
@@ -1,12 +1,19 @@
 # -*- coding: utf-8 -*-
 from math import atan2, pi
 
+import numpy as np
+
 from ..utils import normalize_angle
 from .perception import Perception
 
 
 class BlindSpot(Perception):
-    """The class implements a blind spot in the perception of the neighbors."""
+    """The class implements a blind spot in the perception of the neighbors.
+
+    A blind spot directly wrapping another blind spot fuses with it, so that all the cones are tested at once. The
+    cones attribute lists the bisector and the half opening of every fused cone.
+
+    """
 
     def __init__(self, bisector, opening, border, perception=None):
         """Build a new blind spot.
@@ -21,10 +28,12 @@ class BlindSpot(Perception):
         super().__init__(border, perception)
         assert 0 < opening <= pi
         assert -pi <= bisector < pi
-        self.bisector = bisector
-        """float: The direction (in radians)."""
-        self.half_opening = opening / 2
-        """float: The opening (in radians)."""
+        self.cones = [(bisector, opening / 2)]
+        """list<tuple<float,float>>: The bisector and the half opening of each cone (in radians)."""
+        if isinstance(perception, BlindSpot) and perception.border is border:
+            # Fuse with the wrapped blind spot
+            self.cones = perception.cones + self.cones
+            self.wrapped = perception.wrapped
 
     def _filter(self, ind, pop):
         filtered_pop = []
@@ -33,8 +42,24 @@ class BlindSpot(Perception):
                 continue
             # Compute the relative orientation to the current individual
             relative_pos = self.border.vector(ind.pos, other.pos)
-            abs_angle = atan2(relative_pos[1], relative_pos[0])
+            abs_angle = atan2(relative_pos[1, 0], relative_pos[0, 0])
             relative_angle = normalize_angle(abs_angle - ind.angle)
-            if abs(normalize_angle(relative_angle - self.bisector)) > self.half_opening:
-                filtered_pop.append(other)  # The individual is not in the blind spot
+            if all(
+                abs(normalize_angle(relative_angle - bisector)) > half_opening
+                for bisector, half_opening in self.cones
+            ):
+                filtered_pop.append(other)  # The individual is not in a blind spot
         return filtered_pop
+
+    def _filter_all(self, neighborhood, mask):
+        pairs = np.flatnonzero(mask)
+        bisectors, half_openings = np.array(self.cones).T
+        along = neighborhood.along[pairs, np.newaxis]
+        across = neighborhood.across[pairs, np.newaxis]
+        # Project the vector to the neighbor on the bisector of each cone
+        projection = np.cos(bisectors) * along + np.sin(bisectors) * across
+        # The neighbor is in a cone when its angle to the bisector is at most the half opening
+        hidden = projection >= neighborhood.dist[pairs, np.newaxis] * np.cos(half_openings)
+        keep = np.zeros(len(neighborhood), dtype=bool)
+        keep[pairs[~np.any(hidden, axis=1)]] = True
+        return keep
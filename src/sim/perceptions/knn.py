@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import numpy as np
 from numpy.linalg import norm
 
 from .perception import Perception
@@ -31,3 +32,40 @@ class KNN(Perception):
         knn = dpop[: min(self.k, len(dpop))]
         # List the k nearest neighbors
         return [ind for d, ind in knn]
+
+    def nearest(self, neighborhood, mask):
+        """Find the k nearest detected neighbors of every individual at once.
+
+        The squared distances of the detected pairs are laid out in one row per individual, then each row is
+        partitioned around its k-th smallest value.
+
+        Args:
+            neighborhood (Neighborhood): The candidate pairs of individuals.
+            mask (numpy.ndarray): The mask of the pairs detected by the wrapped perception.
+
+        Returns:
+            numpy.ndarray: The (N,k) indices in the neighborhood of the pairs to the k nearest neighbors, in no
+            particular order (-1 when an individual detects less than k neighbors).
+
+        """
+        n = len(neighborhood.engine)
+        pairs = np.flatnonzero(mask)
+        i = neighborhood.i[pairs]
+        counts = np.bincount(i, minlength=n)
+        width = counts.max(initial=0)
+        slot = np.arange(len(pairs)) - (np.cumsum(counts) - counts)[i]
+        distances = np.full((n, width), np.inf)
+        distances[i, slot] = neighborhood.dist2[pairs]
+        indices = np.full((n, width), -1)
+        indices[i, slot] = pairs
+        if width <= self.k:
+            return indices
+        nearest = np.argpartition(distances, self.k - 1, axis=1)[:, : self.k]
+        return np.take_along_axis(indices, nearest, axis=1)
+
+    def _filter_all(self, neighborhood, mask):
+        keep = np.zeros(len(neighborhood), dtype=bool)
+        if self.k > 0:
+            nearest = self.nearest(neighborhood, mask)
+            keep[nearest[nearest >= 0]] = True
+        return keep
@@ -1,11 +1,17 @@
 # -*- coding: utf-8 -*-
-from ..utils import normalize_angle
+from math import inf, pi
+
+import numpy as np
+
+from ..utils import circular_mean, normalize_angle, normalize_angles
 from .perception import Perception
 
 
 def mean_orientation(pop):
     """Compute the mean orientation of the given population.
 
+    The orientations are averaged as unit vectors, so that -pi and pi are close.
+
     Args:
         pop (list<Individual>): The population to study.
 
@@ -13,17 +19,15 @@ def mean_orientation(pop):
         float: The mean orientation of the population (in radians).
 
     """
-    angle_sum = 0.0
-    for ind in pop:
-        angle_sum += normalize_angle(ind.angle)
-    return angle_sum / len(pop)
+    return circular_mean([ind.angle for ind in pop], (-pi, pi))
 
 
 class Outlier(Perception):
     """The class implements a outlier based perception of the neighbors.
 
     If there is an outlier, only the individual maximizing the difference to the group is perceived, otherwise,
-    the whole group is perceived.
+    the whole group is perceived. A neighbor is an outlier when its orientation differs from the mean orientation
+    of the group by strictly more than the threshold.
 
     """
 
@@ -40,9 +44,13 @@ class Outlier(Perception):
         self.diff_threshold = diff_threshold
         """float: The threshold difference to the mean to tell that an individual is an outlier (in radians)."""
 
+    def cutoff(self, radius):
+        # The mean orientation depends on the whole wrapped neighborhood
+        return super().cutoff(inf)
+
     def _filter(self, ind, pop):
         mean_ori = mean_orientation(pop)
-        max_diff = 0.0
+        max_diff = self.diff_threshold
         outlier = None
         # Identify an outlier
         for ind_pop in pop:
@@ -52,3 +60,30 @@ class Outlier(Perception):
                 outlier = ind_pop
         # List the outlier if it exists otherwise the whole population
         return [outlier] if outlier else pop
+
+    def _filter_all(self, neighborhood, mask):
+        n = len(neighborhood.engine)
+        pairs = np.flatnonzero(mask)
+        i = neighborhood.i[pairs]
+        angles = neighborhood.engine.angle[neighborhood.j[pairs]]
+
+        # Mean orientation of each neighborhood, averaged as unit vectors
+        sum_cos = np.bincount(i, weights=np.cos(angles), minlength=n)
+        sum_sin = np.bincount(i, weights=np.sin(angles), minlength=n)
+        mean_ori = np.arctan2(sum_sin, sum_cos)
+        angular_diff = np.abs(normalize_angles(angles - mean_ori[i]))
+
+        # Largest difference of each neighborhood, the pairs being grouped by observer
+        max_diff = np.full(n, -inf)
+        if len(pairs) > 0:
+            starts = np.flatnonzero(np.append(True, i[1:] != i[:-1]))
+            max_diff[i[starts]] = np.maximum.reduceat(angular_diff, starts)
+        has_outlier = max_diff > self.diff_threshold
+
+        # List the first outlier if it exists otherwise the whole neighborhood
+        keep = np.zeros(len(neighborhood), dtype=bool)
+        keep[pairs] = ~has_outlier[i]
+        candidates = np.flatnonzero(has_outlier[i] & (angular_diff == max_diff[i]))
+        _, first = np.unique(i[candidates], return_index=True)
+        keep[pairs[candidates[first]]] = True
+        return keep
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 from abc import ABC, abstractmethod
 
+import numpy as np
+
 from .. import Individual
 
 
@@ -34,6 +36,60 @@ class Perception(ABC):
             pop_filtered = self.wrapped.detect(ind, pop)
         return self._filter(ind, pop_filtered)
 
+    def detect_all(self, neighborhood):
+        """Detect the neighbors of every individual at once.
+
+        Args:
+            neighborhood (Neighborhood): The candidate pairs of individuals.
+
+        Returns:
+            numpy.ndarray: The mask of the candidate pairs (i, j) where i detects j.
+
+        """
+        if self.wrapped:
+            mask = self.wrapped.detect_all(neighborhood)
+        else:
+            mask = np.ones(len(neighborhood), dtype=bool)
+        return self._filter_all(neighborhood, mask)
+
+    def cutoff(self, radius):
+        """Compute the distance the candidate pairs must lie within for the detection to be exact up to a radius.
+
+        Args:
+            radius (float): The distance up to which the detected neighbors matter (in length units).
+
+        Returns:
+            float: The distance the candidate pairs must lie within (in length units).
+
+        """
+        return self.wrapped.cutoff(radius) if self.wrapped else radius
+
+    def _filter_all(self, neighborhood, mask):
+        """Filter the pairs whose second individual is not seen by the first one.
+
+        The default implementation calls _filter once per individual, perceptions should override it with a
+        whole-array version.
+
+        Args:
+            neighborhood (Neighborhood): The candidate pairs of individuals.
+            mask (numpy.ndarray): The mask of the pairs detected by the wrapped perception.
+
+        Returns:
+            numpy.ndarray: The mask of the pairs detected by this perception.
+
+        """
+        views = neighborhood.engine.views
+        keep = np.zeros(len(neighborhood), dtype=bool)
+        pairs = np.flatnonzero(mask)
+        i = neighborhood.i[pairs]
+        j = neighborhood.j[pairs]
+        observers, starts = np.unique(i, return_index=True)
+        stops = np.append(starts[1:], len(i))
+        for ind, start, stop in zip(observers, starts, stops):
+            seen = self._filter(views[ind], [views[other] for other in j[start:stop]])
+            keep[pairs[start:stop]] = np.isin(j[start:stop], [other.index for other in seen])
+        return keep
+
     @abstractmethod
     def _filter(self, ind, pop):
         """Filter the individuals from the population that are not seen by the given individual
@@ -19,6 +19,9 @@ class Range(Perception):
         super().__init__(border, perception)
         self.perception_range = perception_range
 
+    def cutoff(self, radius):
+        return super().cutoff(min(radius, self.perception_range))
+
     def _filter(self, ind, pop):
         return [
             pop_ind
@@ -26,3 +29,6 @@ class Range(Perception):
             if pop_ind is not ind
             and norm(self.border.vector(ind.pos, pop_ind.pos)) < self.perception_range
         ]
+
+    def _filter_all(self, neighborhood, mask):
+        return mask & (neighborhood.dist < self.perception_range)
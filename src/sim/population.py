@@ -1,17 +1,20 @@
 # -*- coding: utf-8 -*-
 
+import copy
 from math import cos, pi, sin
-import random
 
 import numpy as np
 import numpy.linalg as lin
-import numpy.random as np_rand
 
-from . import Individual, PALETTE
-from .utils import angle, normalize
+from . import Engine, Individual, PALETTE
+from .neighbors import CellList, Neighborhood, VerletList
+from .utils import sum_by_index
 
 
 class Population:
+    PER_REPLICA = ("speed", "turning_rate", "roa", "roo", "ror", "std")
+    """tuple<str>: The parameters that can take one value per replica."""
+
     def __init__(
         self,
         roa,
@@ -26,6 +29,9 @@ class Population:
         ror_sd=0.0,
         roo_sd=0.0,
         roa_sd=0.0,
+        seed=None,
+        skin=0.0,
+        replicas=1,
     ):
         """Population Constructor.
 
@@ -42,24 +48,35 @@ class Population:
             ror_sd (float): The standard deviation of the range of repulsion (in length units).
             roo_sd (float): The standard deviation of the range of orientation (in length units).
             roa_sd (float): The standard deviation of the range of attraction (in length units).
+            seed (int, optional): The seed of the random generators. Defaults to None.
+            skin (float, optional): The skin of the neighbor lists reused across ticks (in length units). Defaults
+                to 0.0 (the neighbors are searched at every tick).
+            replicas (int, optional): The number of independent replicas simulated together. Defaults to 1.
+
+        The speed, the turning rate, the radii and the decision noise can also be given as one value per replica,
+        to sweep them in a single simulation.
 
         """
-        self.pop = []
-        """list<Individual>: The list of individuals."""
+        self.engine = Engine()
+        """Engine: The individuals of every replica stored as arrays (one replica after the other)."""
+        self.replicas = replicas
+        """int: The number of independent replicas simulated together."""
+        self.rngs = [np.random.default_rng(s) for s in np.random.SeedSequence(seed).spawn(replicas)]
+        """list<numpy.random.Generator>: The random generator of each replica."""
         self.speed = speed
-        """float: The mean speed (in length units per seconds)."""
+        """float or numpy.ndarray: The mean speed (in length units per seconds), for every replica or for each one."""
         self.turning_rate = turning_rate
-        """float: The maximal turning rate (in radians per seconds)."""
+        """float or numpy.ndarray: The maximal turning rate (in radians per seconds), for every replica or for each one."""
         self.roa = roa
-        """float: The radius of attraction (in length units)."""
+        """float or numpy.ndarray: The radius of attraction (in length units), for every replica or for each one."""
         self.roo = roo
-        """float: The radius of orientation (in length units)."""
+        """float or numpy.ndarray: The radius of orientation (in length units), for every replica or for each one."""
         self.ror = ror
-        """float: The radius of repulsion (in length units)."""
+        """float or numpy.ndarray: The radius of repulsion (in length units), for every replica or for each one."""
         self.perception = per
         """Perception: The perception of the population."""
         self.std = std
-        """float: The standard deviation in the decision process (in radians)."""
+        """float or numpy.ndarray: The standard deviation in the decision process (in radians), for every replica or for each one."""
         self.speed_sd = speed_sd
         """float: The standard deviation of the speed (in length units per seconds)."""
         self.tr_sd = tr_sd
@@ -70,6 +87,20 @@ class Population:
         """float: The standard deviation of the range of orientation (in length units)."""
         self.roa_sd = roa_sd
         """float: The standard deviation of the range of attraction (in length units)."""
+        self.skin = skin
+        """float: The skin of the neighbor lists reused across ticks (in length units)."""
+        self.verlet_list = None
+        """VerletList: The neighbor lists reused across ticks."""
+
+    @property
+    def pop(self):
+        """Get the individuals.
+
+        Returns:
+            list<Individual>: The list of individuals.
+
+        """
+        return self.engine.views
 
     @property
     def cgroup(self):
@@ -79,11 +110,9 @@ class Population:
             numpy.ndarray: The position of the group center.
 
         """
-        origin = np.zeros((2, 1))
-        mean = np.mean(
-            [self.perception.border.vector(origin, ind.pos) for ind in self.pop], axis=0
-        )
-        return mean
+        origin = np.zeros((1, 2))
+        relative_pos = self.perception.border.vector_many(origin, self.engine.pos)[0]
+        return np.mean(relative_pos, axis=0).reshape(-1, 1)
 
     @property
     def dgroup(self):
@@ -93,7 +122,7 @@ class Population:
             numpy.ndarray: The group direction.
 
         """
-        return np.mean([ind.dir for ind in self.pop], axis=0)
+        return np.mean(self.engine.dir, axis=0).reshape(-1, 1)
 
     @property
     def pgroup(self):
@@ -113,15 +142,15 @@ class Population:
             float: The group momentum.
 
         """
-        cg = self.cgroup
-        m = []
-
-        for ind in self.pop:
-            r_ic = normalize(self.perception.border.vector(cg, ind.pos))
-            m_ic = np.cross(r_ic, ind.dir, axis=0)
-            m.append(m_ic)
-        m_array = np.array(m)
-        m_mean = np.mean(m_array)
+        cg = self.cgroup.reshape(1, -1)
+        r_ic = self.perception.border.vector_many(cg, self.engine.pos)[0]
+        # Normalize the vectors that are not close to (0,0)
+        norms = np.linalg.norm(r_ic, axis=1)
+        far = ~np.all(np.isclose(r_ic, 0.0), axis=1)
+        r_ic[far] /= norms[far, np.newaxis]
+        direction = self.engine.dir
+        m_ic = r_ic[:, 0] * direction[:, 1] - r_ic[:, 1] * direction[:, 0]
+        m_mean = np.mean(m_ic)
 
         return np.linalg.norm(m_mean)
 
@@ -130,97 +159,133 @@ class Population:
         """Compute the list of rank for each individual when sorted by the front.
 
         Returns:
-            The list of rank for each individual when sorted by the front.
+            numpy.ndarray: The rank of each individual when sorted by the front.
 
         """
-        cgroup = self.cgroup
-        dgroup = self.dgroup.reshape(-1)
-        pop_sorted = []
-        order = [-1 for _ in range(len(self.pop))]  # Preallocate the list
-
-        # Fill a list of tuple and sort the population by
-        for i in range(len(self.pop)):
-            ind = self.pop[i]
-            relative_pos = (ind.pos - cgroup).reshape(-1)
-            front = np.dot(relative_pos, dgroup)
-            pop_sorted.append((front, i))
-        pop_sorted.sort(key=lambda elem: elem[0], reverse=True)
-
-        # Create the list of individual rank
-        for i in range(len(pop_sorted)):
-            _, ind_id = pop_sorted[i]
-            order[ind_id] = i
-
-        return order
+        relative_pos = self.engine.pos - self.cgroup.reshape(1, -1)
+        front = relative_pos @ self.dgroup.reshape(-1)
+        return self._rank(-front)
 
     @property
     def center_order(self):
         """Compute the list of rank for each individual when sorted by the center.
 
         Returns:
-            The list of rank for each individual when sorted by the center.
+            numpy.ndarray: The rank of each individual when sorted by the center.
 
         """
-        cgroup = self.cgroup
-        pop_sorted = []
-        order = [-1 for _ in range(len(self.pop))]  # Preallocate the list
-
-        # Fill a list of tuple and sort the population by its distance to the center
-        for i in range(len(self.pop)):
-            ind = self.pop[i]
-            relative_pos = (ind.pos - cgroup).reshape(-1)
-            d_center = np.dot(relative_pos, relative_pos)
-            pop_sorted.append((d_center, i))
-        pop_sorted.sort(key=lambda elem: elem[0])
-
-        # Create the list of individual rank
-        for i in range(len(pop_sorted)):
-            _, ind_id = pop_sorted[i]
-            order[ind_id] = i
+        relative_pos = self.engine.pos - self.cgroup.reshape(1, -1)
+        d_center = np.sum(relative_pos ** 2, axis=1)
+        return self._rank(d_center)
 
+    @staticmethod
+    def _rank(keys):
+        """Compute the rank of each key in the ascending order (ties keep their original order).
+
+        Args:
+            keys (numpy.ndarray): The keys to sort.
+
+        Returns:
+            numpy.ndarray: The rank of each key.
+
+        """
+        order = np.empty(len(keys), dtype=int)
+        order[np.argsort(keys, kind="stable")] = np.arange(len(keys))
         return order
 
-    def add_individual(self, color=None, pos=None, angle=None):
+    def replica(self, replica):
+        """Take a snapshot of one replica as a population of its own.
+
+        The snapshot copies the individuals, so it is meant to compute and store the quantities of the replica.
+
+        Args:
+            replica (int): The replica to take.
+
+        Returns:
+            Population: The snapshot of the replica.
+
+        """
+        snapshot = copy.copy(self)
+        snapshot.engine = self.engine.take(np.flatnonzero(self.engine.replica == replica))
+        snapshot.engine.replica = 0
+        for name in self.PER_REPLICA:
+            setattr(snapshot, name, self._of_replica(getattr(self, name), replica))
+        snapshot.replicas = 1
+        snapshot.rngs = [self.rngs[replica]]
+        snapshot.verlet_list = None
+        return snapshot
+
+    def fork(self, branches, seed=None):
+        """Fork every replica into independent branches.
+
+        The branches start from the state of their replica, then draw from new random generators so they diverge.
+
+        Args:
+            branches (int): The number of branches of each replica.
+            seed (int, optional): The seed of the new random generators. Defaults to None.
+
+        Returns:
+            Population: The population of the branches, the replica b * replicas + r being the branch b of the
+                replica r.
+
+        """
+        forked = copy.copy(self)
+        forked.engine = self.engine.take(np.tile(np.arange(len(self.engine)), branches))
+        forked.engine.replica += np.repeat(np.arange(branches) * self.replicas, len(self.engine))
+        for name in self.PER_REPLICA:
+            value = getattr(self, name)
+            if np.ndim(value) > 0:
+                setattr(forked, name, np.tile(value, branches))
+        forked.replicas = branches * self.replicas
+        forked.rngs = [np.random.default_rng(s) for s in np.random.SeedSequence(seed).spawn(forked.replicas)]
+        forked.verlet_list = None
+        return forked
+
+    def add_individual(self, color=None, pos=None, angle=None, replica=0):
         """Add a individual to this population.
 
         Args:
             color (Color): color for canvas visualisation.
             pos (numpy.ndarray): Initial position.
             angle (float): The initial orientation.
+            replica (int): The replica to add the individual to.
         """
-        color = color or random.choice(PALETTE["accents"])
-        if pos or angle:
+        rng = self.rngs[replica]
+        color = color or str(rng.choice(PALETTE["accents"]))
+        if pos is not None or angle is not None:
             # At least one pose element is specified, no warranty
-            pos = pos or self._generate_random_pos(self.roa)
-            ind_angle = angle or (2 * pi * (random.random() - 0.5))
+            roa = self._of_replica(self.roa, replica)
+            pos = pos if pos is not None else self._generate_random_pos(roa, rng)
+            ind_angle = angle if angle is not None else 2 * pi * (rng.random() - 0.5)
             ind = Individual(
                 color,
                 pos,
-                self.ror,
-                self.roa,
-                self.roo,
+                self._of_replica(self.ror, replica),
+                self._of_replica(self.roo, replica),
+                self._of_replica(self.roa, replica),
                 ind_angle,
-                speed=self.speed,
-                turning_rate=self.turning_rate,
+                speed=self._of_replica(self.speed, replica),
+                turning_rate=self._of_replica(self.turning_rate, replica),
             )
+            self.engine.append(ind, replica)
         else:
             # Generate each parameter using a gaussian distribution
-            new_speed = self.speed
-            new_tr = self.turning_rate
-            new_ror = self.ror
-            new_roo = self.roo
-            new_roa = self.roa
+            new_speed = self._of_replica(self.speed, replica)
+            new_tr = self._of_replica(self.turning_rate, replica)
+            new_ror = self._of_replica(self.ror, replica)
+            new_roo = self._of_replica(self.roo, replica)
+            new_roa = self._of_replica(self.roa, replica)
 
             if self.speed_sd > 0.0:
-                new_speed += random.gauss(0.0, self.speed_sd)
+                new_speed += rng.normal(0.0, self.speed_sd)
             if self.tr_sd > 0.0:
-                new_tr += random.gauss(0.0, self.tr_sd)
+                new_tr += rng.normal(0.0, self.tr_sd)
             if self.ror_sd > 0.0:
-                new_ror += random.gauss(0.0, self.ror_sd)
+                new_ror += rng.normal(0.0, self.ror_sd)
             if self.roo_sd > 0.0:
-                new_roo += random.gauss(0.0, self.roo_sd)
+                new_roo += rng.normal(0.0, self.roo_sd)
             if self.roa_sd > 0.0:
-                new_roa += random.gauss(0.0, self.roa_sd)
+                new_roa += rng.normal(0.0, self.roa_sd)
 
             ind = Individual(
                 color,
@@ -232,35 +297,37 @@ class Population:
                 new_speed,
                 new_tr,
             )
-            # No specified pose, ensure the new individual sees another one
+            # No specified pose, ensure the new individual sees another one of its replica
+            n = len(self.engine)
+            others = np.flatnonzero(self.engine.replica == replica)
+            view = self.engine.append(ind, replica)
+            candidates = (np.full(len(others), n), others)  # The pairs from the new individual
             for _ in range(100000):
-                ind.pos = self._generate_random_pos(new_roa)
-                ind.angle = 2 * pi * (random.random() - 0.5)
-                if (
-                    len(self.pop) == 0
-                    or len(self.perception.detect(ind, self.pop)) >= 1
-                ):
+                view.pos = self._generate_random_pos(new_roa, rng)
+                view.angle = 2 * pi * (rng.random() - 0.5)
+                neighborhood = Neighborhood(self.engine, self.perception.border, candidates)
+                if len(others) == 0 or np.any(self.perception.detect_all(neighborhood)):
                     break
             else:
+                self.engine.truncate(n)
                 raise RuntimeError(
                     "Failed to find a valid configuration after 100 000 tries!"
                 )
 
-        self.pop.append(ind)
-
-    def _generate_random_pos(self, radius):
+    def _generate_random_pos(self, radius, rng):
         """Generate a random position in circle centered on (0,0) and the given radius.
 
         Args:
             radius (float): The spawning range (in length units).
+            rng (numpy.random.Generator): The random generator to use.
 
         Returns:
             numpy.ndarray: The randomly generated position.
 
         """
         border = self.perception.border
-        r = radius * random.random()
-        th = 2 * pi * (random.random() - 0.5)
+        r = radius * rng.random()
+        th = 2 * pi * (rng.random() - 0.5)
         pos = np.array([[r * cos(th)], [r * sin(th)]]) + border.origin
         return border.wrap(pos)
 
@@ -274,103 +341,151 @@ class Population:
 
         """
         # Compute new directions
-        angles = []
-        for ind in self.pop:
-            angles.append(self.reorient(ind))
+        angles = self.reorient()
 
         # Update positions
-        for ind, angle in zip(self.pop, angles):
-            ind.turn_to(angle, dt)
-            ind.tick(dt)
-            ind.pos = self.perception.border.wrap(ind.pos)
+        self.engine.turn_to(angles, dt)
+        self.engine.tick(dt)
+        self.engine.wrap(self.perception.border)
 
     def draw(self):
         """Draw the population as a set of vectors.
 
         Returns:
-            tuple(list<float>,list<float>,list<float>,list<float>,list<int> >: The lists of X and Y positions then of U and V direction vector and the vector colour.
+            tuple(numpy.ndarray,numpy.ndarray,numpy.ndarray,numpy.ndarray,list<int> >: The X and Y positions then the U and V direction vector and the vector colour.
         """
-        x = []
-        y = []
-        u = []
-        v = []
-        color = []
-        for i in self.pop:
-            x.append(i.pos[0])
-            y.append(i.pos[1])
-            u.append(i.dir[0])
-            v.append(i.dir[1])
-            color.append(i.color)
-        c = self.cgroup
-        d = self.dgroup
-        x.append(c[0])
-        y.append(c[1])
-        u.append(d[0])
-        v.append(d[1])
-        color.append(PALETTE["highlight"])
-        return x, y, u, v, color
-
-    def reorient(self, ind):
-        """Compute a new orientation for the individual.
-
-        Calculate the new direction of the individual with 3 rules:
+        pos = np.vstack([self.engine.pos, self.cgroup.reshape(1, -1)])
+        direction = np.vstack([self.engine.dir, self.dgroup.reshape(1, -1)])
+        color = self.engine.color + [PALETTE["highlight"]]
+        return pos[:, 0], pos[:, 1], direction[:, 0], direction[:, 1], color
+
+    def reorient(self):
+        """Compute a new orientation for every individual.
+
+        Calculate the new direction of each individual with 3 rules:
         - Repulsion
         - Orientation
         - Attraction
 
+        Returns:
+            numpy.ndarray: The new orientation of each individual (in radians).
+
+        """
+        engine = self.engine
+        n = len(engine)
+        neighborhood = self._neighborhood()
+        nearby = self.perception.detect_all(neighborhood)  # The nearby pairs
+        i = neighborhood.i[nearby]
+        j = neighborhood.j[nearby]
+        roo = engine.roo if self.roo_sd > 0.0 else self._of_individuals(self.roo)
+
+        diff = neighborhood.diff[nearby]
+        dist = neighborhood.dist[nearby]
+        superposed = np.all(np.isclose(diff, 0.0), axis=1)  # The boids are superposed
+        # Compute random vectors to escape
+        diff[superposed] = self._gauss(engine.replica[i[superposed]], 1.0, 2)
+        dist[superposed] = np.hypot(diff[superposed, 0], diff[superposed, 1])
+        dir2other = diff / dist[:, np.newaxis]
+        in_r = dist <= engine.ror[i]  # Repulsion zone
+        in_o = ~in_r & (dist <= roo[i])  # Orientation zone
+        in_a = ~in_r & ~in_o & (dist <= engine.roa[i])  # Attraction zone
+
+        # Calculate all three forces
+        des_r = -sum_by_index(dir2other[in_r], i[in_r], n)  # Desired repulsion
+        des_o = sum_by_index(neighborhood.heading[j[in_o]], i[in_o], n)  # Desired orientation
+        des_a = sum_by_index(dir2other[in_a], i[in_a], n)  # Desired attraction
+        nb_r = np.bincount(i[in_r], minlength=n)  # Number of individuals in repulsion zone
+        nb_o = np.bincount(i[in_o], minlength=n)  # Number of individuals in orientation zone
+        nb_a = np.bincount(i[in_a], minlength=n)  # Number of individuals in attraction zone
+
+        # Choose the rule to apply, from the lowest to the highest priority
+        des_dir = neighborhood.heading.copy()  # No decision
+        des_dir[nb_a > 0] = des_a[nb_a > 0]  # Attraction rule only
+        des_dir[nb_o > 0] = np.where(
+            (nb_a[nb_o > 0] == 0)[:, np.newaxis],
+            des_o[nb_o > 0],  # Orientation rule only
+            (des_o[nb_o > 0] + des_a[nb_o > 0]) / 2,  # Orientation and attraction rules
+        )
+        des_dir[nb_r > 0] = des_r[nb_r > 0]  # Repulsion rule only
+
+        # Compute the new angles from the desired directions
+        new_angles = np.arctan2(des_dir[:, 1], des_dir[:, 0])
+        new_angles += self._gauss(engine.replica, self.std)  # Apply noise to the decision
+
+        return new_angles
+
+    def _of_replica(self, value, replica):
+        """Get the value of a parameter for one replica.
+
+        Args:
+            value (float or numpy.ndarray): The parameter, for every replica or for each one.
+            replica (int): The replica.
+
+        Returns:
+            float: The value of the parameter for the replica.
+
+        """
+        return float(np.broadcast_to(value, (self.replicas,))[replica])
+
+    def _of_individuals(self, value):
+        """Get the value of a parameter for each individual.
+
+        Args:
+            value (float or numpy.ndarray): The parameter, for every replica or for each one.
+
+        Returns:
+            numpy.ndarray: The value of the parameter for the replica of each individual.
+
+        """
+        return np.broadcast_to(np.asarray(value, dtype=float), (self.replicas,))[self.engine.replica]
+
+    def _gauss(self, replica, sd, dim=None):
+        """Draw values from a centered gaussian distribution, each with the generator of its replica.
+
         Args:
-            ind (Individual): The given individual.
+            replica (numpy.ndarray): The replica of each value to draw.
+            sd (float or numpy.ndarray): The standard deviation of the distribution, for every replica or for
+                each one.
+            dim (int, optional): The dimension of each value. Defaults to None (scalar values).
 
         Returns:
-            float: The new orientation for the given individual (in radians).
+            numpy.ndarray: The drawn values.
 
         """
-        nearby = self.perception.detect(ind, self.pop)  # The nearby boids
-        border = self.perception.border  # The border policy
-        des_r = np.zeros((2, 1), dtype="float")  # Desired repulsion
-        des_o = np.zeros((2, 1), dtype="float")  # Desired orientation
-        des_a = np.zeros((2, 1), dtype="float")  # Desired attraction
-        nb_r = 0  # Number of individuals in repulsion zone
-        nb_o = 0  # Number of individuals in orientation zone
-        nb_a = 0  # Number of individuals in attraction zone
-        roo = ind.roo if self.roo_sd > 0.0 else self.roo
-
-        # Calculate all three forces if there are any boids nearby
-        for other in nearby:
-            diff = border.vector(ind.pos, other.pos)
-            if np.allclose(diff, np.zeros((2, 1))):  # The boids are superposed
-                # Compute a random vector to escape
-                diff = np_rand.normal(0, 1, (2, 1))
-            dist = np.linalg.norm(diff)
-            dir2other = diff / dist
-            if dist <= ind.ror:  # Repulsion zone
-                des_r -= dir2other
-                nb_r += 1
-            elif dist <= roo:  # Orientation zone
-                des_o += other.dir
-                nb_o += 1
-            elif dist <= ind.roa:  # Attraction zone
-                des_a += dir2other
-                nb_a += 1
-
-        # Choose the rule to apply
-        if nb_r > 0:  # Repulsion rule only
-            des_dir = des_r
-        elif nb_o > 0:
-            if nb_a == 0:  # Orientation rule only
-                des_dir = des_o
-            else:  # Orientation and attraction rules
-                des_dir = np.mean([des_o, des_a], axis=0)
-        elif nb_a > 0:  # Attraction rule only
-            des_dir = des_a
-        else:  # No decision
-            des_dir = ind.dir
-
-        # Compute the new angle from the desired direction
-        new_angle = angle(des_dir)
-        new_angle += random.gauss(0.0, self.std)  # Apply noise to the decision
-
-        return new_angle
+        shape = (len(replica),) if dim is None else (len(replica), dim)
+        values = np.zeros(shape)
+        for value in np.unique(replica):
+            rows = replica == value
+            values[rows] = self.rngs[value].normal(
+                0.0, self._of_replica(sd, value), (np.count_nonzero(rows),) + shape[1:]
+            )
+        return values
+
+    def _neighborhood(self):
+        """List the candidate pairs of individuals for this tick.
+
+        Only the pairs within the largest radius of the zones (repulsion, orientation or attraction) can change a
+        decision, unless the perception needs more to be exact. The radius of orientation can exceed the radius of
+        attraction, either for the whole population or for some individuals drawn with a deviation.
+
+        Returns:
+            Neighborhood: The candidate pairs of individuals.
+
+        """
+        border = self.perception.border
+        engine = self.engine
+        radius = max(
+            engine.ror.max(initial=0.0),
+            engine.roo.max(initial=0.0),
+            engine.roa.max(initial=0.0),
+            float(np.max(self.roo)),
+        )
+        radius = self.perception.cutoff(radius)
+        if self.skin <= 0.0 or not np.isfinite(radius):
+            return CellList(radius).neighborhood(self.engine, border)
+        if self.verlet_list is None or self.verlet_list.radius != radius:
+            self.verlet_list = VerletList(radius, self.skin)
+        return self.verlet_list.neighborhood(self.engine, border)
 
     def store_quantities(self, data_logger, is_roo_rising=False):
         """Store data.
@@ -399,9 +514,7 @@ class Population:
             "roa_sd": self.roa_sd,
             "is_roo_rising": is_roo_rising,
         }
-        data_logger.quantities = data_logger.quantities.append(
-            quantities, ignore_index=True
-        )
+        data_logger.quantities.append(quantities)
 
     def store_state(self, data_logger):
         """Store the current state.
@@ -410,23 +523,21 @@ class Population:
             data_logger (DataLogger): The given data logger to fill.
 
         """
-        front_order = self.front_order
-        center_order = self.center_order
-        for i in range(len(self.pop)):
-            ind = self.pop[i]
-            ind_state = {
-                "id": i,
-                "pos": ind.pos.reshape(-1),
-                "angle": ind.angle[0],
-                "speed": ind.speed,
-                "turning_rate": ind.turning_rate,
-                "ror": ind.ror,
-                "roo": ind.roo,
-                "roa": ind.roa,
-                "front_idx": front_order[i],
-                "center_idx": center_order[i],
+        engine = self.engine
+        data_logger.state.extend(
+            {
+                "id": np.arange(len(engine)),
+                "pos": engine.pos,
+                "angle": engine.angle,
+                "speed": engine.speed,
+                "turning_rate": engine.turning_rate,
+                "ror": engine.ror,
+                "roo": engine.roo,
+                "roa": engine.roa,
+                "front_idx": self.front_order,
+                "center_idx": self.center_order,
             }
-            data_logger.state = data_logger.state.append(ind_state, ignore_index=True)
+        )
 
     def get_properties(self):
         """Get a list of string describing the properties.
@@ -0,0 +1,285 @@
+# -*- coding: utf-8 -*-
+import struct
+import zlib
+
+import numpy as np
+
+from . import PALETTE
+
+
+def hex_to_rgb(color):
+    """Convert a hexadecimal colour to its components.
+
+    Args:
+        color (str): The colour, as '#RRGGBB'.
+
+    Returns:
+        tuple<int,int,int>: The red, green and blue components.
+    """
+    return tuple(int(color[k : k + 2], 16) for k in (1, 3, 5))
+
+
+def write_png(path, image):
+    """Save an RGB image as a PNG file.
+
+    Args:
+        path (str): The path to the file.
+        image (numpy.ndarray): The (H,W,3) uint8 pixels.
+    """
+
+    def chunk(kind, data):
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    height, width, _ = image.shape
+    rows = np.empty((height, 1 + 3 * width), dtype=np.uint8)
+    rows[:, 0] = 0  # No filter
+    rows[:, 1:] = image.reshape(height, -1)
+    with open(path, "wb") as png:
+        png.write(b"\x89PNG\r\n\x1a\n")
+        png.write(chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)))
+        png.write(chunk(b"IDAT", zlib.compress(rows.tobytes(), 6)))
+        png.write(chunk(b"IEND", b""))
+
+
+def triangles(x, y, dx, dy, length):
+    """Compute the corners of triangles pointing to their directions.
+
+    Args:
+        x (numpy.ndarray): The column of the centre of each triangle (in pixels).
+        y (numpy.ndarray): The row of the centre of each triangle (in pixels).
+        dx (numpy.ndarray): The column component of the direction of each triangle.
+        dy (numpy.ndarray): The row component of the direction of each triangle.
+        length (float): The length of the triangles (in pixels).
+
+    Returns:
+        tuple<numpy.ndarray,numpy.ndarray>: The (N,3) columns and rows of the tip then the base corners.
+    """
+    norm = np.hypot(dx, dy)
+    norm[norm == 0.0] = 1.0
+    ux, uy = dx / norm * (length / 2), dy / norm * (length / 2)
+    wx, wy = -uy * (2 / 3), ux * (2 / 3)  # Half the base, perpendicular to the direction
+    return (
+        np.stack([x + ux, x - ux + wx, x - ux - wx], axis=1),
+        np.stack([y + uy, y - uy + wy, y - uy - wy], axis=1),
+    )
+
+
+def scan(vx, vy, px, py):
+    """Find the pixels inside triangles.
+
+    Args:
+        vx (numpy.ndarray): The (N,3) columns of the corners of each triangle (in pixels).
+        vy (numpy.ndarray): The (N,3) rows of the corners of each triangle (in pixels).
+        px (numpy.ndarray): The (N,P) columns of the pixels to test for each triangle.
+        py (numpy.ndarray): The (N,P) rows of the pixels to test for each triangle.
+
+    Returns:
+        numpy.ndarray: The (N,P) mask of the pixels whose centre is inside the triangle.
+    """
+    cx, cy = px + 0.5, py + 0.5
+    shape = np.broadcast(cx, vx[:, :1]).shape
+    inside = np.ones(shape, dtype=bool)
+    outside = np.ones(shape, dtype=bool)
+    for a, b in ((0, 1), (1, 2), (2, 0)):
+        # The pixels on the same side of the three edges
+        ax, ay = vx[:, a, np.newaxis], vy[:, a, np.newaxis]
+        edge = (vx[:, b, np.newaxis] - ax) * (cy - ay) - (vy[:, b, np.newaxis] - ay) * (cx - ax)
+        inside &= edge >= 0.0
+        outside &= edge <= 0.0
+    return inside | outside
+
+
+class RasterRenderer:
+    """The class draws frames straight into an image, without matplotlib.
+
+    Each vector is drawn as a triangle pointing to its direction. The triangles are scan-converted once, for a set
+    of quantized directions, into sprites (lists of pixel offsets): drawing a frame only paints the sprite pixels
+    of every vector at once, a pixel being written as a single 32-bit RGBA value, and the next frame clears only
+    these pixels. The image has a margin of a sprite size, so the sprites near the edges need no clipping. The
+    vector of the group (the last one of a frame) is scan-converted on its own, bigger, its length following its
+    norm. The properties of a frame are not written.
+
+    """
+
+    EXTENSION = "png"
+    """str: The format of the saved images."""
+
+    def __init__(self, res, length=None, directions=64):
+        """Build a renderer.
+
+        Args:
+            res (list<int>): The width and the height of the image (in pixels).
+            length (float, optional): The length of a triangle (in pixels). Defaults to None (the image width over
+                120).
+            directions (int, optional): The number of quantized directions of the sprites. Defaults to 64.
+        """
+        width, height = (int(size) for size in res)
+        self.length = max(width, height) / 120 if length is None else length
+        """float: The length of a triangle (in pixels)."""
+        self.margin = int(np.ceil(self.length)) + 2
+        """int: The size of the margin around the image, and of the sprites (in pixels)."""
+        self.canvas = np.empty((height + 2 * self.margin, width + 2 * self.margin, 4), dtype=np.uint8)
+        """numpy.ndarray: The RGBA pixels of the current frame, with the margin."""
+        self.pixels = self.canvas.view(np.uint32).reshape(-1)
+        """numpy.ndarray: The pixels of the canvas, flattened, as 32-bit values."""
+        self.colors = {}
+        """dict<str,numpy.uint32>: The colours already seen, as 32-bit values."""
+        self.background = self._packed([PALETTE["background"]])[0]
+        """numpy.uint32: The colour of the background, as a 32-bit value."""
+        self.painted = None
+        """list<numpy.ndarray>: The pixels painted over the background in the current frame (None when the whole
+        canvas must be painted with the background)."""
+
+        # The sprite of each direction, centred on its middle pixel
+        side = self.margin
+        ox, oy = np.tile(np.arange(side), side), np.repeat(np.arange(side), side)
+        angles = np.arange(directions) * (2 * np.pi / directions)
+        centre = np.full(directions, side // 2 + 0.5)
+        vx, vy = triangles(centre, centre, np.cos(angles), np.sin(angles), self.length)
+        painted = scan(vx, vy, ox[np.newaxis], oy[np.newaxis])
+        offsets = (oy - side // 2) * self.canvas.shape[1] + (ox - side // 2)
+        size = painted.sum(axis=1).max()
+        self.sprites = np.empty((directions, size), dtype=int)
+        """numpy.ndarray: The (D,P) offsets of the pixels of the sprite of each direction from its centre, in the
+        flattened canvas (the shorter sprites repeat their first pixel)."""
+        for d in range(directions):
+            sprite = offsets[painted[d]]
+            self.sprites[d] = np.pad(sprite, (0, size - len(sprite)), mode="edge")
+        self.offsets = np.empty((0, size), dtype=int)
+        """numpy.ndarray: The buffer of the pixels of the sprites of a frame, kept not to allocate it again."""
+
+    @property
+    def image(self):
+        """Get the pixels of the current frame.
+
+        Returns:
+            numpy.ndarray: The (H,W,4) RGBA pixels.
+
+        """
+        return self.canvas[self.margin : -self.margin, self.margin : -self.margin]
+
+    def rasterize(self, frame):
+        """Rasterize a frame.
+
+        Args:
+            frame (Frame): The frame to rasterize.
+
+        Returns:
+            numpy.ndarray: The (H,W,4) RGBA pixels, overwritten by the next frame.
+        """
+        # Only the pixels painted by the previous frame differ from the background, but filling the whole canvas
+        # is faster than writing them back one by one when they are many
+        if self.painted is None or sum(len(pixels) for pixels in self.painted) > len(self.pixels) // 8:
+            self.pixels.fill(self.background)
+        else:
+            for pixels in self.painted:
+                self.pixels[pixels] = self.background
+        self.painted = []
+        x, y = self._project(frame)
+        x, y = x + self.margin, y + self.margin
+        colors = self._packed(frame.color)
+        self._sprites(x[:-1], y[:-1], frame.u[:-1], -frame.v[:-1], colors[:-1])
+        norm = np.hypot(frame.u[-1], frame.v[-1])
+        if norm > 0.0:
+            self._triangle(x[-1], y[-1], frame.u[-1], -frame.v[-1], colors[-1], 4 * self.length * norm)
+        return self.image
+
+    def save(self, frame, path):
+        """Draw a frame and save it as a PNG image.
+
+        Args:
+            frame (Frame): The frame to save.
+            path (str): The path to the image.
+        """
+        write_png(path, self.rasterize(frame)[..., :3])
+
+    def _project(self, frame):
+        """Compute the pixel coordinates of the vectors.
+
+        The view keeps the aspect ratio: it fits the limits of the frame, or the vectors with a margin.
+
+        Args:
+            frame (Frame): The frame to project.
+
+        Returns:
+            tuple<numpy.ndarray,numpy.ndarray>: The column and the row of each vector in the image (in pixels, as
+                floats).
+        """
+        height, width = self.canvas.shape[0] - 2 * self.margin, self.canvas.shape[1] - 2 * self.margin
+        if frame.limits is not None:
+            (left, right), (bottom, top) = frame.limits
+        else:
+            left, right = frame.x.min(), frame.x.max()
+            bottom, top = frame.y.min(), frame.y.max()
+            margin = 0.05 * max(right - left, top - bottom, 1e-9)
+            left, right, bottom, top = left - margin, right + margin, bottom - margin, top + margin
+        scale = min(width / (right - left), height / (top - bottom))
+        x = width / 2 + (frame.x - (left + right) / 2) * scale
+        y = height / 2 - (frame.y - (bottom + top) / 2) * scale  # The rows go down
+        return x, y
+
+    def _packed(self, colors):
+        """Convert colours to 32-bit RGBA values.
+
+        Args:
+            colors (list<str>): The hexadecimal colours.
+
+        Returns:
+            numpy.ndarray: The 32-bit value of each colour.
+        """
+        for color in set(colors) - self.colors.keys():
+            self.colors[color] = np.array(hex_to_rgb(color) + (255,), dtype=np.uint8).view(np.uint32)[0]
+        return np.array([self.colors[color] for color in colors], dtype=np.uint32)
+
+    def _sprites(self, x, y, dx, dy, colors):
+        """Paint the sprites of vectors.
+
+        Args:
+            x (numpy.ndarray): The column of each vector in the canvas (in pixels).
+            y (numpy.ndarray): The row of each vector in the canvas (in pixels).
+            dx (numpy.ndarray): The column component of the direction of each vector.
+            dy (numpy.ndarray): The row component of the direction of each vector.
+            colors (numpy.ndarray): The 32-bit colour of each vector.
+        """
+        height, width, _ = self.canvas.shape
+        half = self.margin // 2
+        col, row = np.floor(x).astype(int), np.floor(y).astype(int)
+        visible = (col >= half) & (col < width - half) & (row >= half) & (row < height - half)
+        col, row, dx, dy, colors = col[visible], row[visible], dx[visible], dy[visible], colors[visible]
+
+        directions = len(self.sprites)
+        direction = np.rint(np.arctan2(dy, dx) * (directions / (2 * np.pi))).astype(int) % directions
+        # The pixels are computed in place in a buffer kept between frames, then painted as a flat list
+        n, size = len(direction), self.sprites.shape[1]
+        if len(self.offsets) < n:
+            self.offsets = np.empty((2 * n, size), dtype=int)
+        pixels = self.offsets[:n]
+        np.take(self.sprites, direction, axis=0, out=pixels, mode="clip")  # "raise" would copy
+        np.add(pixels, (row * width + col)[:, np.newaxis], out=pixels)
+        pixels = pixels.reshape(-1)
+        self.pixels[pixels] = np.repeat(colors, size)
+        self.painted.append(pixels)
+
+    def _triangle(self, x, y, dx, dy, color, length):
+        """Paint a triangle, scan-converted on its own.
+
+        Args:
+            x (float): The column of the centre of the triangle in the canvas (in pixels).
+            y (float): The row of the centre of the triangle in the canvas (in pixels).
+            dx (float): The column component of the direction of the triangle.
+            dy (float): The row component of the direction of the triangle.
+            color (numpy.uint32): The 32-bit colour of the triangle.
+            length (float): The length of the triangle (in pixels).
+        """
+        vx, vy = triangles(np.array([x]), np.array([y]), np.array([dx]), np.array([dy]), length)
+        height, width, _ = self.canvas.shape
+        left, top = int(np.floor(vx.min())), int(np.floor(vy.min()))
+        px, py = np.meshgrid(
+            np.arange(max(left, 0), min(int(vx.max()) + 1, width)),
+            np.arange(max(top, 0), min(int(vy.max()) + 1, height)),
+        )
+        px, py = px.reshape(-1), py.reshape(-1)
+        painted = scan(vx, vy, px[np.newaxis], py[np.newaxis])[0]
+        pixels = py[painted] * width + px[painted]
+        self.pixels[pixels] = color
+        self.painted.append(pixels)
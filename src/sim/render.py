@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+import argparse
+import os
+import subprocess
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from . import PALETTE
+from .borders import Infinite, Toric, Wall
+from .frame import Frame
+from .trajectory import open_trajectory
+from .video import VideoEncoder
+
+BORDERS = {"Wall": Wall, "Toric": Toric, "Infinite": Infinite}
+"""dict<str,type>: The border classes, by name."""
+
+
+def build_border(header):
+    """Build the border of a recording.
+
+    Args:
+        header (dict): The header of the recording.
+
+    Returns:
+        Border: The border.
+    """
+    border = header["border"]
+    return BORDERS[border["kind"]](np.reshape(border["length"], (-1, 1)), np.reshape(border["origin"], (-1, 1)))
+
+
+def build_frame(border, colors, pos, angle):
+    """Build the frame of a recorded state, like Canvas.update() during a simulation.
+
+    Args:
+        border (Border): The border of the recording.
+        colors (list<str>): The colour of each individual, then the highlight colour.
+        pos (numpy.ndarray): The (N,2) positions.
+        angle (numpy.ndarray): The (N) orientations (in radians).
+
+    Returns:
+        Frame: The frame, with the vector of the group last.
+    """
+    direction = np.stack([np.cos(angle), np.sin(angle)], axis=1)
+    cgroup = np.mean(border.vector_many(np.zeros((1, 2)), pos)[0], axis=0)
+    dgroup = np.mean(direction, axis=0)
+    pos = np.vstack([pos, cgroup])
+    direction = np.vstack([direction, dgroup])
+    limits = None
+    if not isinstance(border, Infinite):
+        begin = border.origin.reshape(-1) - border.length.reshape(-1)
+        end = border.origin.reshape(-1) + border.length.reshape(-1)
+        limits = ((begin[0], end[0]), (begin[1], end[1]))
+    return Frame(pos[:, 0], pos[:, 1], direction[:, 0], direction[:, 1], colors, limits)
+
+
+def render_segment(path, video, start, stop, res, fps, codec, renderer, window=256):
+    """Render a segment of the frames of a recording to a video (in a worker process).
+
+    Args:
+        path (str): The folder of the recording.
+        video (str): The path to the video of the segment.
+        start (int): The first frame.
+        stop (int): The frame after the last one.
+        res (list<int>): The width and the height of the video (in pixels).
+        fps (float): The frame rate (in Hertz).
+        codec (str): The ffmpeg video codec.
+        renderer (str): The renderer of the frames, 'matplotlib' or 'raster'.
+        window (int, optional): The number of frames read at once. Defaults to 256.
+
+    Returns:
+        str: The path to the video of the segment.
+    """
+    trajectory = open_trajectory(path)
+    border = build_border(trajectory.header)
+    colors = trajectory.header["colors"] + [PALETTE["highlight"]]
+    encoder = VideoEncoder(video, res, fps, codec, renderer=renderer)
+    try:
+        for first in range(start, stop, window):
+            pos, angle = trajectory.window(first, min(first + window, stop))
+            for t in range(len(pos)):
+                encoder.write(build_frame(border, colors, pos[t], angle[t]))
+    finally:
+        encoder.close()
+    return video
+
+
+def render(path, output=None, res=(1920, 1080), fps=None, codec="libvpx-vp9", renderer="matplotlib", workers=None):
+    """Render the video of a recording on a pool of processes.
+
+    Args:
+        path (str): The folder of the recording.
+        output (str, optional): The path to the video. Defaults to None (the folder of the recording with the .mp4
+            extension).
+        res (list<int>, optional): The width and the height of the video (in pixels). Defaults to (1920, 1080).
+        fps (float, optional): The frame rate (in Hertz). Defaults to None (one frame per time step).
+        codec (str, optional): The ffmpeg video codec. Defaults to 'libvpx-vp9'.
+        renderer (str, optional): The renderer of the frames, 'matplotlib' or 'raster'. Defaults to 'matplotlib'.
+        workers (int, optional): The number of worker processes, and of segments. Defaults to None (the number of
+            processors).
+
+    Returns:
+        str: The path to the video.
+
+    Raises:
+        RuntimeError: When ffmpeg failed to join the segments.
+    """
+    trajectory = open_trajectory(path)
+    output = output or os.path.normpath(path) + ".mp4"
+    fps = fps or 1 / trajectory.header["dt"]
+    workers = max(1, min(workers or os.cpu_count(), len(trajectory)))
+    bounds = np.linspace(0, len(trajectory), workers + 1).astype(int)
+
+    with tempfile.TemporaryDirectory(dir=os.path.dirname(os.path.abspath(output))) as folder:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    render_segment,
+                    path,
+                    os.path.join(folder, f"segment-{k:04d}.mp4"),
+                    start,
+                    stop,
+                    res,
+                    fps,
+                    codec,
+                    renderer,
+                )
+                for k, (start, stop) in enumerate(zip(bounds[:-1], bounds[1:]))
+                if stop > start
+            ]
+            segments = [future.result() for future in futures]
+
+        # Join the segments as they are, with the concat demuxer
+        playlist = os.path.join(folder, "segments.txt")
+        with open(playlist, "w") as lines:
+            lines.writelines(f"file '{os.path.abspath(segment)}'\n" for segment in segments)
+        command = ["ffmpeg", "-y", "-hide_banner", "-loglevel", "error", "-f", "concat", "-safe", "0"]
+        if subprocess.call(command + ["-i", playlist, "-c", "copy", output]) != 0:
+            raise RuntimeError(f"ffmpeg failed to join the segments of {output}")
+    return output
+
+
+def get_args(argv=None):
+    """Parse the arguments of the command.
+
+    Args:
+        argv (list<str>, optional): The arguments. Defaults to None (the command line).
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description="Render the video of a recorded trajectory (see --record), its segments on a pool of processes."
+    )
+    parser.add_argument("trajectory", type=str, help="the folder of the recorded trajectory")
+    parser.add_argument("--output", type=str, default=None, help="the path to the video (defaults to TRAJECTORY.mp4)")
+    parser.add_argument("--res", type=str, default="1920x1080", help="the resolution")
+    parser.add_argument("--fps", type=float, default=None, help="the frame rate (defaults to one frame per time step)")
+    parser.add_argument("--codec", type=str, default="libvpx-vp9", help="the ffmpeg codec of the video (e.g. libx264)")
+    parser.add_argument(
+        "--renderer",
+        type=str,
+        choices=["matplotlib", "raster"],
+        default="matplotlib",
+        help="the renderer of the frames: matplotlib or a faster raster one",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None, help="the number of worker processes (defaults to the processors)"
+    )
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = get_args()
+    video = render(
+        args.trajectory,
+        args.output,
+        np.array(args.res.split("x"), dtype="int"),
+        args.fps,
+        args.codec,
+        args.renderer,
+        args.workers,
+    )
+    print(f"Video: {video}")
@@ -1,9 +1,13 @@
 # -*- coding: utf-8 -*-
 
 import time
+from argparse import Namespace
 from math import pi, ceil
 import numpy as np
 from . import Incrementor, Canvas, Population, Universe, DataLogger
+from . import checkpoint as ckpt
+from .canvas import FrameSchedule
+from .trajectory import CompressedTrajectoryWriter, TrajectoryWriter
 from . import arguments as argu
 from .borders import Wall, Toric, Infinite
 from .perceptions import BlindSpot, KNN, Outlier, Range
@@ -108,12 +112,18 @@ class Sim:
             - 1
         ) * incrementor.step_duration
 
-    def from_args(self, args):
+    def from_args(self, args, sweep=None, outputs=None):
         """Launch a simulation from command arguments.
 
         Args:
             args (dict): The given command arguments.
+            sweep (dict<str,numpy.ndarray>, optional): The arguments taking one value per replica, among
+                attraction_radius, orientation_radius, repulsion_radius, std, speed and turning_rate. Defaults to
+                None.
+            outputs (list<str>, optional): The specific path to output each replica to. Defaults to None.
         """
+        if sweep:
+            args = Namespace(**{**vars(args), **sweep})
         argu.global_cond(args.speed, args.time_step, args.repulsion_radius)
 
         # Creation of border
@@ -164,6 +174,27 @@ class Sim:
             args.ror_sd,
             args.roo_sd,
             args.roa_sd,
+            args.verlet_skin,
+            args.replicas,
+            args.seed,
+            outputs,
+            args.checkpoint,
+            args.checkpoint_step,
+            args.restore,
+            args.fork,
+            args.record,
+            args.record_format,
+            args.record_bits,
+            args.record_chunk,
+            args.log_format,
+            args.log_chunk,
+            args.codec,
+            args.renderer,
+            args.render_every,
+            argu.get_render_window(args.render_window),
+            args.render_duration,
+            args.fps,
+            args.batch,
         )
 
     def run(
@@ -184,6 +215,27 @@ class Sim:
         ror_sd=0.0,
         roo_sd=0.0,
         roa_sd=0.0,
+        verlet_skin=0.0,
+        replicas=1,
+        seed=None,
+        outputs=None,
+        checkpoint=None,
+        checkpoint_step=None,
+        restore=None,
+        fork=0,
+        record=False,
+        record_format="npy",
+        record_bits=16,
+        record_chunk=256,
+        log_format="csv",
+        log_chunk=0,
+        codec="libvpx-vp9",
+        renderer="matplotlib",
+        render_every=1,
+        render_window=(0, None),
+        render_duration=None,
+        fps=30.0,
+        batch=False,
     ):
         """Run one instance.
 
@@ -204,11 +256,56 @@ class Sim:
             ror_sd (float, optional): The sd. of the range of repulsion Gaussien distribution. Defaults to 0.0.
             roo_sd (float, optional): The sd. of the range of orientation Gaussien distribution. Defaults to 0.0.
             roa_sd (float, optional): The sd. of the range of attraction Gaussien distribution. Defaults to 0.0.
+            verlet_skin (float, optional): The skin of the neighbor lists reused across steps. Defaults to 0.0.
+            replicas (int, optional): The number of independent replicas simulated together, each one logged in
+                its own folder suffixed by its number. Defaults to 1.
+            seed (int, optional): The seed of the random generators. Defaults to None.
+            outputs (list<str>, optional): The specific path to output each replica to (overrides output and
+                replicas). Defaults to None.
+            checkpoint (str, optional): The path to save a checkpoint of the simulation to. Defaults to None.
+            checkpoint_step (int, optional): The step to save the checkpoint at, ending the simulation. Defaults to
+                None (after the last step).
+            restore (str, optional): The path to a checkpoint to start from instead of a new population. Defaults
+                to None.
+            fork (int, optional): The number of branches forked from each restored replica, with new random
+                generators seeded by seed. Defaults to 0 (the restored simulation is resumed as is).
+            record (bool, optional): Whether the trajectory of each replica is recorded in its output folder.
+                Defaults to False.
+            record_format (str, optional): The format of the recorded trajectories, 'npy' (memory-mapped float
+                arrays) or 'compressed' (quantized and compressed chunks). Defaults to 'npy'.
+            record_bits (int, optional): The resolution of the compressed positions, as a fraction of the border
+                length. Defaults to 16.
+            record_chunk (int, optional): The number of frames per compressed chunk. Defaults to 256.
+            log_format (str, optional): The format of the logs, 'csv', 'npz' or 'parquet'. Defaults to 'csv'.
+            log_chunk (int, optional): The number of rows written at once while logging. Defaults to 0 (the logs
+                are written at the end).
+            codec (str, optional): The ffmpeg codec of the video. Defaults to 'libvpx-vp9'.
+            renderer (str, optional): The renderer of the video and the snapshots, 'matplotlib' or 'raster'.
+                Defaults to 'matplotlib'.
+            render_every (int, optional): The number of ticks between two rendered ticks. Defaults to 1.
+            render_window (tuple<int,int>, optional): The first rendered tick and the tick after the last one (None
+                for the last step). Defaults to (0, None).
+            render_duration (float, optional): The duration of the video (in seconds), the rendered ticks being
+                decimated to keep the frame rate under fps. Defaults to None (the simulated duration).
+            fps (float, optional): The maximal frame rate of the video when its duration is given. Defaults to 30.
+            batch (bool, optional): Whether the snapshots are saved as frames, drawn later by sim.snapshots, so that
+                matplotlib is not used during the run. Defaults to False.
+
+        The parameters of the population (roa, ror, decision_noise_sd, speed, turning_rate and the range of
+        orientation) can also be given as one value per replica.
         """
-        # Initialize the data logger
-        dl = DataLogger()
-        if output:
-            dl.destination = f"../logs/{output}/"  # Change the output directory
+        # Initialize one data logger per replica
+        if outputs:
+            replicas = len(outputs)
+        dls = [DataLogger(log_format, log_chunk) for _ in range(replicas)]
+        for r, dl in enumerate(dls):
+            if outputs:
+                dl.destination = f"../logs/{outputs[r]}/"
+                continue
+            if output:
+                dl.destination = f"../logs/{output}/"  # Change the output directory
+            if replicas > 1:
+                dl.destination = f"{dl.destination[:-1]}_{r}/"
 
         # Initialize the simulation
         pop = Population(
@@ -224,9 +321,17 @@ class Sim:
             ror_sd,
             roo_sd,
             roa_sd,
+            seed=seed,
+            skin=verlet_skin,
+            replicas=replicas,
         )
         start = time.perf_counter()
-        with Canvas(timestep, render) as canvas:
+        schedule = None
+        if render:
+            schedule = FrameSchedule(timestep, self.steps_nb, render_every, render_window, render_duration, fps)
+        with Canvas(timestep, render, res, codec, renderer=renderer, schedule=schedule, batch=batch) as canvas:
+            for dl in dls:
+                dl.writer = canvas.writer  # The logs are written in the background
             u = Universe(
                 canvas,
                 border=self.border,
@@ -235,29 +340,69 @@ class Sim:
                 verbose=verbose,
             )
 
-            u.populate(pop_size)
-            dl.mkdir_dest()
-            u.draw(first=True)
-            canvas.snapshot(dl.destination + "initial_state")
+            step = 0
+            if restore:
+                step, dumps = ckpt.restore(restore, u, self.incrementor)
+                if fork:
+                    u.pop = u.pop.fork(fork, seed)
+                    dumps = dumps * fork
+                if u.pop.replicas != len(dls):
+                    raise ValueError(
+                        f"The checkpoint gives {u.pop.replicas} replicas, but {len(dls)} are logged"
+                    )
+                for dl, dump in zip(dls, dumps):
+                    dl.load(dump)
+            else:
+                u.populate(pop_size)
+            stop = self.steps_nb if checkpoint_step is None else min(checkpoint_step, self.steps_nb)
+            if record:
+                if record_format == "compressed":
+                    u.recorders = [
+                        CompressedTrajectoryWriter(
+                            dl.destination + "trajectory",
+                            u.pop,
+                            r,
+                            timestep,
+                            step,
+                            record_bits,
+                            record_chunk,
+                            writer=canvas.writer,
+                        )
+                        for r, dl in enumerate(dls)
+                    ]
+                else:
+                    u.recorders = [
+                        TrajectoryWriter(dl.destination + "trajectory", u.pop, r, stop - step + 1, timestep, step)
+                        for r, dl in enumerate(dls)
+                    ]
+                for recorder in u.recorders:
+                    recorder.record(u.pop.engine)  # The initial state
+            for r, dl in enumerate(dls):
+                dl.mkdir_dest()
+                u.draw(first=True, replica=r)
+                canvas.snapshot(dl.destination + "initial_state")
             # Simulation loop
             if canvas.render:
-                for i in range(self.steps_nb):
+                for i in range(step, stop):
                     print(
                         f"Simulation step {i} / {self.steps_nb} ({i * 100 // self.steps_nb}%)",
                         end="\r",
                     )
-                    u.draw(ind=i)
+                    if canvas.schedule.rendered(i):
+                        u.draw(ind=i)
                     u.tick()
                     if self.incrementor is not None:
                         if self.incrementor.will_change:
-                            u.pop.store_quantities(dl, self.incrementor.is_rising)
-                            canvas.snapshot(
-                                dl.destination
-                                + f"intermidiate_roo-{u.pop.roo}_rising-{self.incrementor.is_rising}.png"
-                            )
+                            for r, dl in enumerate(dls):
+                                u.pop.replica(r).store_quantities(dl, self.incrementor.is_rising)
+                                u.draw(first=True, replica=r)  # The last video frame may be an earlier tick
+                                canvas.snapshot(
+                                    dl.destination
+                                    + f"intermidiate_roo-{u.pop.roo}_rising-{self.incrementor.is_rising}.png"
+                                )
                         u.pop.roo = self.incrementor.next()
             else:
-                for i in range(self.steps_nb):
+                for i in range(step, stop):
                     print(
                         f"Simulation step {i} / {self.steps_nb} ({i * 100 // self.steps_nb}%)",
                         end="\r",
@@ -265,24 +410,32 @@ class Sim:
                     u.tick()
                     if self.incrementor is not None:
                         if self.incrementor.will_change:
-                            u.pop.store_quantities(dl, self.incrementor.is_rising)
-                            u.draw(first=True)
-                            canvas.snapshot(
-                                dl.destination
-                                + f"intermidiate_roo-{u.pop.roo}_rising-{self.incrementor.is_rising}.png"
-                            )
+                            for r, dl in enumerate(dls):
+                                u.pop.replica(r).store_quantities(dl, self.incrementor.is_rising)
+                                u.draw(first=True, replica=r)
+                                canvas.snapshot(
+                                    dl.destination
+                                    + f"intermidiate_roo-{u.pop.roo}_rising-{self.incrementor.is_rising}.png"
+                                )
                         u.pop.roo = self.incrementor.next()
             end = time.perf_counter()
             print("\nSimulation: Done in {:.3f} s".format(end - start))
+            if checkpoint:
+                ckpt.save(checkpoint, u, stop, self.incrementor, dls)
+            for recorder in u.recorders:
+                recorder.close()
 
             # Store the final state
-            if not self.incrementor:
-                u.pop.store_quantities(dl)
-            u.pop.store_state(dl)
-
+            for r, dl in enumerate(dls):
+                replica = u.pop.replica(r)
+                if not self.incrementor:
+                    replica.store_quantities(dl)
+                replica.store_state(dl)
 
-        dl.flush() # Write on the disk
+            for r, dl in enumerate(dls):
+                dl.flush() # Write on the disk
 
-        # Save the final state of the population as an image
-        u.draw(first=True)
-        canvas.snapshot(dl.destination + "final_state")
+                # Save the final state of the population as an image
+                u.draw(first=True, replica=r)
+                canvas.snapshot(dl.destination + "final_state")
+        # The canvas waited for the logs and the images to be written
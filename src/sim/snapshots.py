@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+import argparse
+import functools
+import glob
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from .frame import FRAME_SUFFIX, Frame, FrameRenderer
+from .raster import RasterRenderer
+
+
+@functools.lru_cache(maxsize=None)
+def get_renderer(renderer, res):
+    """Get the renderer of the snapshots of a worker process, built once.
+
+    Args:
+        renderer (str): The renderer, 'matplotlib' (PDF images) or 'raster' (PNG images).
+        res (tuple<int,int>): The width and the height of the raster images (in pixels).
+
+    Returns:
+        FrameRenderer or RasterRenderer: The renderer.
+    """
+    return RasterRenderer(res) if renderer == "raster" else FrameRenderer((8, 4.5))
+
+
+def draw_snapshot(path, renderer="matplotlib", res=(1920, 1080)):
+    """Draw the snapshot of a saved frame (in a worker process).
+
+    Args:
+        path (str): The path to the saved frame.
+        renderer (str, optional): The renderer, 'matplotlib' (PDF images) or 'raster' (PNG images). Defaults to
+            'matplotlib'.
+        res (tuple<int,int>, optional): The width and the height of the raster images (in pixels). Defaults to
+            (1920, 1080).
+
+    Returns:
+        str: The path to the image, next to the frame.
+    """
+    renderer = get_renderer(renderer, tuple(res))
+    image = f"{path[: -len(FRAME_SUFFIX)]}.{renderer.EXTENSION}"
+    renderer.save(Frame.load(path), image)
+    return image
+
+
+def draw_snapshots(folders, renderer="matplotlib", res=(1920, 1080), workers=None):
+    """Draw the snapshots of the frames saved in batch mode, on a pool of processes.
+
+    Args:
+        folders (list<str>): The folders searched (recursively) for saved frames.
+        renderer (str, optional): The renderer, 'matplotlib' (PDF images) or 'raster' (PNG images). Defaults to
+            'matplotlib'.
+        res (tuple<int,int>, optional): The width and the height of the raster images (in pixels). Defaults to
+            (1920, 1080).
+        workers (int, optional): The number of worker processes. Defaults to None (the number of processors).
+
+    Returns:
+        list<str>: The paths to the images.
+    """
+    paths = sorted(
+        path
+        for folder in folders
+        for path in glob.glob(os.path.join(folder, "**", "*" + FRAME_SUFFIX), recursive=True)
+    )
+    if not paths:
+        return []
+    workers = min(workers or os.cpu_count(), len(paths))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        n = len(paths)
+        chunksize = max(1, n // (4 * workers))
+        return list(executor.map(draw_snapshot, paths, [renderer] * n, [tuple(res)] * n, chunksize=chunksize))
+
+
+def get_args(argv=None):
+    """Parse the arguments of the command.
+
+    Args:
+        argv (list<str>, optional): The arguments. Defaults to None (the command line).
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description="Draw the snapshots of the frames saved by the simulations (--batch).")
+    parser.add_argument("folders", type=str, nargs="+", help="the folders searched (recursively) for saved frames")
+    parser.add_argument(
+        "--renderer",
+        type=str,
+        choices=["matplotlib", "raster"],
+        default="matplotlib",
+        help="the renderer of the snapshots: matplotlib (PDF images) or a faster raster one (PNG images)",
+    )
+    parser.add_argument("--res", type=str, default="1920x1080", help="the resolution of the raster images")
+    parser.add_argument(
+        "--workers", type=int, default=None, help="the number of worker processes (defaults to the processors)"
+    )
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = get_args()
+    res = tuple(int(size) for size in args.res.split("x"))
+    images = draw_snapshots(args.folders, args.renderer, res, args.workers)
+    print(f"Snapshots: {len(images)} drawn")
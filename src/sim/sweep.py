@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+import contextlib
+import glob
+import hashlib
+import io
+import itertools
+import json
+import os
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+
+from .arguments import get_args
+from .sim import Sim
+
+
+class Job:
+    def __init__(self, cmd, outputs, sweep=None, seed=None):
+        """Build a job, aka. one simulation of a sweep.
+
+        Args:
+            cmd (str): The command to simulate.
+            outputs (list<str>): The output path of each replica, relative to logs/.
+            sweep (dict<str,numpy.ndarray>, optional): The arguments taking one value per replica. Defaults to None.
+            seed (int, optional): The seed of the random generators. Defaults to None.
+        """
+        self.cmd = cmd
+        """str: The command to simulate."""
+        self.outputs = outputs
+        """list<str>: The output path of each replica, relative to logs/."""
+        self.sweep = sweep
+        """dict<str,numpy.ndarray>: The arguments taking one value per replica."""
+        self.seed = seed
+        """int: The seed of the random generators."""
+
+    def key(self, version):
+        """Compute the key of the job results.
+
+        Args:
+            version (str): The version of the simulation code.
+
+        Returns:
+            str: The hash of the fully resolved arguments, the seed and the code version.
+        """
+        cmd = self.cmd.split(" ") + ([] if self.seed is None else ["--seed", str(self.seed)])
+        content = {
+            "args": vars(get_args(cmd)),
+            "sweep": {name: np.asarray(value).tolist() for name, value in (self.sweep or {}).items()},
+            "outputs": self.outputs,
+            "version": version,
+        }
+        return hashlib.sha256(json.dumps(content, sort_keys=True).encode()).hexdigest()
+
+    def digest(self):
+        """Compute the hash of the logs of every replica.
+
+        Returns:
+            str: The hash of the paths and the contents of the log files (None when a log is missing).
+        """
+        digest = hashlib.sha256()
+        for output in self.outputs:
+            for name in ("quantities", "state"):
+                log = f"../logs/{output}/{name}"
+                if os.path.isfile(log + ".csv"):
+                    paths = [log + ".csv"]
+                elif os.path.isdir(log):
+                    paths = sorted(glob.glob(os.path.join(log, "part-*")))
+                else:
+                    return None
+                for path in paths:
+                    digest.update(path.encode())
+                    with open(path, "rb") as part:
+                        for block in iter(lambda: part.read(1 << 20), b""):
+                            digest.update(block)
+        return digest.hexdigest()
+
+    def is_complete(self, digest):
+        """Whether the logs of every replica are the ones written when the job finished.
+
+        A log cut by a crash, or written again by an interrupted run, doesn't match its recorded hash.
+
+        Args:
+            digest (str): The hash of the logs recorded when the job finished (see digest()).
+
+        Returns:
+            bool: Whether the logs of every replica match the recorded hash.
+        """
+        return digest is not None and self.digest() == digest
+
+    def __str__(self):
+        return self.outputs[0] if len(self.outputs) == 1 else f"{self.outputs[0]} (+{len(self.outputs) - 1})"
+
+
+def code_version():
+    """Compute the version of the simulation code.
+
+    Returns:
+        str: The hash of the sources of the simulation package.
+    """
+    digest = hashlib.sha256()
+    root = os.path.dirname(os.path.abspath(__file__))
+    for path in sorted(glob.glob(os.path.join(root, "**", "*.py"), recursive=True)):
+        digest.update(os.path.relpath(path, root).encode())
+        with open(path, "rb") as source:
+            digest.update(source.read())
+    return digest.hexdigest()
+
+
+def read_manifest(path):
+    """Read the keys of the finished jobs and the hashes of their logs.
+
+    Args:
+        path (str): The path to the manifest.
+
+    Returns:
+        dict<str,str>: The hash of the logs of each finished job, by key (empty when there is no manifest; None
+            for the records without hash).
+    """
+    if not os.path.isfile(path):
+        return {}
+    digests = {}
+    with open(path) as manifest:
+        for line in manifest:
+            try:
+                record = json.loads(line)
+                digests[record["key"]] = record.get("digest")
+            except (ValueError, KeyError):
+                pass  # A line cut by a crash
+    return digests
+
+
+def expand(cmd, ranges, output, nb_repeat=1):
+    """Expand a command template into one job per combination of the parameter values.
+
+    The repeats of a combination are the replicas of its job.
+
+    Args:
+        cmd (str): The command template, with a named field per parameter.
+        ranges (dict<str,list>): The values of each parameter.
+        output (str): The output path template, with a named field per parameter and the 'itr' field.
+        nb_repeat (int, optional): The number of repetitions of each combination. Defaults to 1.
+
+    Returns:
+        list<Job>: The jobs.
+    """
+    jobs = []
+    for values in itertools.product(*ranges.values()):
+        fields = dict(zip(ranges.keys(), values))
+        outputs = [output.format(itr=i, **fields) for i in range(nb_repeat)]
+        jobs.append(Job(cmd.format(**fields), outputs))
+    return jobs
+
+
+def run_job(job):
+    """Simulate a job (in a worker process).
+
+    The job output is kept quiet, not to interleave the progress of the concurrent jobs.
+
+    Args:
+        job (Job): The job to simulate.
+
+    Returns:
+        str: The traceback when the job failed, else None.
+    """
+    cmd = job.cmd.split(" ")
+    if job.seed is not None:
+        cmd += ["--seed", str(job.seed)]
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            Sim().from_args(get_args(cmd), job.sweep, job.outputs)
+    except Exception:
+        return traceback.format_exc()
+    return None
+
+
+def run_sweep(name, jobs, workers=None, seed=0, manifest=None):
+    """Simulate the jobs of a sweep on a pool of processes.
+
+    Each job gets its own seed from the seed of the sweep, so a sweep is reproducible whatever the number of
+    workers. A failed job is reported, then the sweep goes on, even when its worker process dies.
+
+    With a manifest, each finished job is recorded with its key and the hash of its logs, once they are closed. The
+    jobs already recorded whose logs still match their hash are skipped: a sweep restarted after a crash only
+    simulates the missing jobs, and the ones whose logs were cut.
+
+    Args:
+        name (str): The name of the sweep, used in the progress messages.
+        jobs (list<Job>): The jobs to simulate.
+        workers (int, optional): The number of worker processes. Defaults to None (the number of processors).
+        seed (int, optional): The seed of the sweep. Defaults to 0.
+        manifest (str, optional): The path to the manifest of the finished jobs. Defaults to None (no cache).
+
+    Returns:
+        list<Job>: The failed jobs.
+    """
+    for job, child in zip(jobs, np.random.SeedSequence(seed).spawn(len(jobs))):
+        if job.seed is None:
+            job.seed = int(child.generate_state(1)[0])
+
+    keys = {}
+    if manifest is not None:
+        version = code_version()
+        finished = read_manifest(manifest)
+        keys = {job: job.key(version) for job in jobs}
+        skipped = [job for job in jobs if keys[job] in finished and job.is_complete(finished[keys[job]])]
+        jobs = [job for job in jobs if job not in skipped]
+        print(f"[{name}] {len(skipped)} jobs already done")
+
+    failed = []
+    done = 0
+
+    def finish(job, error):
+        """Report a finished job, and record it in the manifest when it succeeded."""
+        nonlocal done
+        done += 1
+        if error is not None:
+            failed.append(job)
+            print(f"[{name}] Job {job} failed:\n{error}")
+        elif manifest is not None:
+            record = {"key": keys[job], "outputs": job.outputs, "digest": job.digest()}
+            with open(manifest, "a") as records:
+                records.write(json.dumps(record) + "\n")
+        print(f"[{name}] Progression: {done * 100 // len(jobs)}% ({done} / {len(jobs)}, {job})")
+
+    # A worker process that dies (crash, out of memory) breaks the pool, and every unfinished job with it
+    broken = []
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        futures = {executor.submit(run_job, job): job for job in jobs}
+        for future in as_completed(futures):
+            try:
+                error = future.result()
+            except BrokenProcessPool:
+                broken.append(futures[future])
+                continue
+            except Exception:
+                error = traceback.format_exc()
+            finish(futures[future], error)
+
+    # So these jobs are simulated again, each in its own process: only the one whose process dies fails
+    for job in broken:
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            try:
+                error = executor.submit(run_job, job).result()
+            except BrokenProcessPool:
+                error = traceback.format_exc()  # The worker process died
+        finish(job, error)
+    print(f"[{name}] Done ! ({len(failed)} failed)")
+    return failed
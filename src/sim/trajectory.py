@@ -0,0 +1,369 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+import zlib
+from math import pi
+
+import numpy as np
+
+from .writer import output
+
+
+def _describe(pop, replica, dt, start):
+    """Describe the recording of a replica.
+
+    Args:
+        pop (Population): The population to record.
+        replica (int): The replica to record.
+        dt (float): The time step (in seconds).
+        start (int): The step of the first frame.
+
+    Returns:
+        tuple<slice or numpy.ndarray,dict>: The individuals of the replica in the engine and the header of the
+            recording.
+    """
+    members = np.flatnonzero(pop.engine.replica == replica)
+    index = members
+    if len(members) > 0 and members[-1] - members[0] + 1 == len(members):
+        index = slice(members[0], members[-1] + 1)  # Contiguous, copied without gathering
+    snapshot = pop.replica(replica)
+    border = pop.perception.border
+    header = {
+        "n": len(members),
+        "dt": dt,
+        "start": start,
+        "border": {
+            "kind": type(border).__name__,
+            "origin": np.reshape(border.origin, -1).tolist(),
+            "length": np.reshape(border.length, -1).tolist(),
+        },
+        "params": {
+            name: float(getattr(snapshot, name))
+            for name in snapshot.PER_REPLICA + ("speed_sd", "tr_sd", "ror_sd", "roo_sd", "roa_sd")
+        },
+        "colors": snapshot.engine.color,
+    }
+    return index, header
+
+
+class TrajectoryWriter:
+    """The class records the trajectory of a replica, tick after tick.
+
+    The positions and the orientations are written in preallocated memory-mapped .npy files, so recording a tick
+    is a plain copy. A JSON header describes the recording.
+
+    """
+
+    def __init__(self, path, pop, replica, frames, dt, start=0):
+        """Build a new trajectory writer.
+
+        Args:
+            path (str): The folder to record in.
+            pop (Population): The population to record.
+            replica (int): The replica to record.
+            frames (int): The maximal number of frames to record.
+            dt (float): The time step (in seconds).
+            start (int, optional): The step of the first frame. Defaults to 0.
+        """
+        self.path = path
+        """str: The folder to record in."""
+        index, header = _describe(pop, replica, dt, start)
+        self.index = index
+        """slice or numpy.ndarray: The individuals of the replica in the engine."""
+        self.header = {**header, "codec": "npy"}
+        """dict: The description of the recording."""
+        self.frames = 0
+        """int: The number of recorded frames."""
+
+        n = self.header["n"]
+        os.makedirs(path, exist_ok=True)
+        self.pos = np.lib.format.open_memmap(
+            os.path.join(path, "pos.npy"), mode="w+", dtype=float, shape=(frames, n, 2)
+        )
+        """numpy.memmap: The (T,N,2) positions (in length units)."""
+        self.angle = np.lib.format.open_memmap(
+            os.path.join(path, "angle.npy"), mode="w+", dtype=float, shape=(frames, n)
+        )
+        """numpy.memmap: The (T,N) orientations (in radians)."""
+
+    def record(self, engine):
+        """Record the current state as a new frame.
+
+        Args:
+            engine (Engine): The engine holding the replica.
+        """
+        self.pos[self.frames] = engine.pos[self.index]
+        self.angle[self.frames] = engine.angle[self.index]
+        self.frames += 1
+
+    def close(self):
+        """Flush the frames and write the header."""
+        self.pos.flush()
+        self.angle.flush()
+        with open(os.path.join(self.path, "header.json"), "w") as header:
+            json.dump({**self.header, "frames": self.frames}, header, indent=2)
+
+
+class Trajectory:
+    """The class reads a recorded trajectory.
+
+    The frames are memory-mapped, so reading a window of frames copies nothing until the values are used.
+
+    """
+
+    def __init__(self, path):
+        """Open a recorded trajectory.
+
+        Args:
+            path (str): The folder of the recording.
+        """
+        with open(os.path.join(path, "header.json")) as header:
+            self.header = json.load(header)
+            """dict: The description of the recording (n, dt, start, border, params, colors, frames)."""
+        frames = self.header["frames"]
+        self.pos = np.load(os.path.join(path, "pos.npy"), mmap_mode="r")[:frames]
+        """numpy.ndarray: The (T,N,2) positions (in length units)."""
+        self.angle = np.load(os.path.join(path, "angle.npy"), mmap_mode="r")[:frames]
+        """numpy.ndarray: The (T,N) orientations (in radians)."""
+
+    def __len__(self):
+        return len(self.pos)
+
+    @property
+    def time(self):
+        """Get the time of each frame.
+
+        Returns:
+            numpy.ndarray: The time of each frame (in seconds).
+
+        """
+        return (self.header["start"] + np.arange(len(self))) * self.header["dt"]
+
+    def window(self, start, stop):
+        """Get a range of frames.
+
+        Args:
+            start (int): The first frame.
+            stop (int): The frame after the last one.
+
+        Returns:
+            tuple<numpy.ndarray,numpy.ndarray>: The (stop-start,N,2) positions and the (stop-start,N) orientations.
+
+        """
+        return self.pos[start:stop], self.angle[start:stop]
+
+
+class CompressedTrajectoryWriter:
+    """The class records the trajectory of a replica in a compact form.
+
+    The positions are quantized to fixed-point integers, in steps of length / 2^bits from the border origin, and
+    the orientations to 16 bits. The positions are stored as 32-bit integers, or as 64-bit ones from the chunk
+    where they stop fitting (e.g. many bits, or individuals drifting away on an infinite border). The frames are
+    grouped in chunks: in a chunk, each frame is stored as its difference with the previous one, then the chunk
+    is compressed with zlib. An index of the chunks lets a reader decode a window of frames alone.
+
+    """
+
+    def __init__(self, path, pop, replica, dt, start=0, bits=16, chunk=256, level=6, writer=None):
+        """Build a new compressed trajectory writer.
+
+        Args:
+            path (str): The folder to record in.
+            pop (Population): The population to record.
+            replica (int): The replica to record.
+            dt (float): The time step (in seconds).
+            start (int, optional): The step of the first frame. Defaults to 0.
+            bits (int, optional): The resolution of the positions, as a fraction of the border length. Defaults to
+                16.
+            chunk (int, optional): The number of frames per chunk. Defaults to 256.
+            level (int, optional): The zlib compression level. Defaults to 6.
+            writer (AsyncWriter, optional): The writer compressing and writing the chunks in the background.
+                Defaults to None (the chunks are written at once).
+        """
+        index, header = _describe(pop, replica, dt, start)
+        self.path = path
+        """str: The folder to record in."""
+        self.index = index
+        """slice or numpy.ndarray: The individuals of the replica in the engine."""
+        self.header = {**header, "codec": "zlib-delta", "bits": bits, "chunks": []}
+        """dict: The description of the recording, with the (offset, size, frames, integer type of the positions) of
+        each chunk."""
+        self.level = level
+        """int: The zlib compression level."""
+        self.writer = writer
+        """AsyncWriter: The writer compressing and writing the chunks in the background (None writes them at once)."""
+        self.frames = 0
+        """int: The number of recorded frames."""
+        self.origin = np.array(header["border"]["origin"])
+        """numpy.ndarray: The origin of the quantized positions (in length units)."""
+        self.resolution = np.array(header["border"]["length"]) / 2 ** bits
+        """numpy.ndarray: The quantization step of the positions along each axis (in length units)."""
+
+        n = header["n"]
+        self.pos = np.zeros((chunk, n, 2), dtype=np.int32)
+        """numpy.ndarray: The quantized positions of the frames of the current chunk."""
+        self.angle = np.zeros((chunk, n), dtype=np.uint16)
+        """numpy.ndarray: The quantized orientations of the frames of the current chunk."""
+        os.makedirs(path, exist_ok=True)
+        self.file = open(os.path.join(path, "frames.bin"), "wb")
+        """file: The file of the compressed chunks."""
+
+    def record(self, engine):
+        """Record the current state as a new frame.
+
+        Args:
+            engine (Engine): The engine holding the replica.
+
+        Raises:
+            ValueError: When a quantized position doesn't fit in a 64-bit integer.
+        """
+        k = self.frames % len(self.pos)
+        pos = np.rint((engine.pos[self.index] - self.origin) / self.resolution)
+        if not np.all(np.abs(pos) < 2.0 ** (8 * self.pos.itemsize - 1)):
+            self._widen(pos)
+        self.pos[k] = pos
+        self.angle[k] = np.rint((engine.angle[self.index] + pi) * (2 ** 16 / (2 * pi))).astype(np.int64) % 2 ** 16
+        self.frames += 1
+        if self.frames % len(self.pos) == 0:
+            self._write_chunk(len(self.pos))
+
+    def close(self):
+        """Write the last chunk and the header."""
+        remaining = self.frames % len(self.pos)
+        if remaining > 0:
+            self._write_chunk(remaining)
+        output(self.writer, self._write_header, self.frames)
+
+    def _widen(self, pos):
+        """Store the positions of the current chunk as 64-bit integers.
+
+        Args:
+            pos (numpy.ndarray): The quantized positions that don't fit in the current integers.
+
+        Raises:
+            ValueError: When the positions don't fit in 64-bit integers either.
+        """
+        if self.pos.dtype == np.int64 or not np.all(np.abs(pos) < 2.0 ** 63):
+            raise ValueError(
+                f"The positions can't be quantized in {self.header['bits']} bits (too far from the border origin)"
+            )
+        self.pos = self.pos.astype(np.int64)
+
+    def _write_chunk(self, frames):
+        """Compute the deltas of the frames of the current chunk, then compress and write them.
+
+        Args:
+            frames (int): The number of frames in the chunk.
+        """
+        pos = self.pos[:frames].copy()
+        angle = self.angle[:frames].copy()
+        pos[1:] -= self.pos[: frames - 1]  # Wraps around like its inverse, the cumulative sum
+        angle[1:] -= self.angle[: frames - 1]
+        output(self.writer, self._compress, pos, angle)
+
+    def _compress(self, pos, angle):
+        """Compress and write a chunk.
+
+        Args:
+            pos (numpy.ndarray): The deltas of the quantized positions.
+            angle (numpy.ndarray): The deltas of the quantized orientations.
+        """
+        data = zlib.compress(pos.tobytes() + angle.tobytes(), self.level)
+        self.header["chunks"].append((self.file.tell(), len(data), len(pos), pos.dtype.name))
+        self.file.write(data)
+
+    def _write_header(self, frames):
+        """Close the file of the chunks and write the header.
+
+        Args:
+            frames (int): The number of recorded frames.
+        """
+        self.file.close()
+        with open(os.path.join(self.path, "header.json"), "w") as header:
+            json.dump({**self.header, "frames": frames}, header, indent=2)
+
+
+class CompressedTrajectory:
+    """The class reads a compressed recorded trajectory.
+
+    Only the chunks overlapping the requested frames are read and decoded.
+
+    """
+
+    def __init__(self, path):
+        """Open a compressed recorded trajectory.
+
+        Args:
+            path (str): The folder of the recording.
+        """
+        self.path = path
+        """str: The folder of the recording."""
+        with open(os.path.join(path, "header.json")) as header:
+            self.header = json.load(header)
+            """dict: The description of the recording (n, dt, start, border, params, colors, frames, chunks)."""
+        self.first = np.cumsum([0] + [chunk[2] for chunk in self.header["chunks"]])
+        """numpy.ndarray: The first frame of each chunk, then the number of frames."""
+        self.origin = np.array(self.header["border"]["origin"])
+        """numpy.ndarray: The origin of the quantized positions (in length units)."""
+        self.resolution = np.array(self.header["border"]["length"]) / 2 ** self.header["bits"]
+        """numpy.ndarray: The quantization step of the positions along each axis (in length units)."""
+
+    def __len__(self):
+        return self.header["frames"]
+
+    @property
+    def time(self):
+        """Get the time of each frame.
+
+        Returns:
+            numpy.ndarray: The time of each frame (in seconds).
+
+        """
+        return (self.header["start"] + np.arange(len(self))) * self.header["dt"]
+
+    def window(self, start, stop):
+        """Decode a range of frames.
+
+        Args:
+            start (int): The first frame.
+            stop (int): The frame after the last one.
+
+        Returns:
+            tuple<numpy.ndarray,numpy.ndarray>: The (stop-start,N,2) positions and the (stop-start,N) orientations.
+
+        """
+        start, stop, _ = slice(start, stop).indices(len(self))
+        n = self.header["n"]
+        pos = [np.zeros((0, n, 2))]
+        angle = [np.zeros((0, n))]
+        first = np.searchsorted(self.first, start, side="right") - 1
+        last = np.searchsorted(self.first, stop, side="left")
+        with open(os.path.join(self.path, "frames.bin"), "rb") as chunks:
+            for c in range(first, last):
+                chunk = self.header["chunks"][c]
+                offset, size, frames = chunk[:3]
+                dtype = np.dtype(chunk[3] if len(chunk) > 3 else "int32")  # The first recordings had no type
+                chunks.seek(offset)
+                data = zlib.decompress(chunks.read(size))
+                chunk_pos = np.frombuffer(data, dtype=dtype, count=frames * n * 2).reshape(frames, n, 2)
+                chunk_angle = np.frombuffer(data, dtype=np.uint16, offset=chunk_pos.nbytes).reshape(frames, n)
+                rows = slice(max(start - self.first[c], 0), min(stop - self.first[c], frames))
+                chunk_pos = np.cumsum(chunk_pos, axis=0, dtype=dtype)[rows]
+                chunk_angle = np.cumsum(chunk_angle, axis=0, dtype=np.uint16)[rows]
+                pos.append(chunk_pos * self.resolution + self.origin)
+                angle.append(chunk_angle * (2 * pi / 2 ** 16) - pi)
+        return np.concatenate(pos), np.concatenate(angle)
+
+
+def open_trajectory(path):
+    """Open a recorded trajectory, whatever its codec.
+
+    Args:
+        path (str): The folder of the recording.
+
+    Returns:
+        Trajectory or CompressedTrajectory: The recorded trajectory.
+    """
+    with open(os.path.join(path, "header.json")) as header:
+        codec = json.load(header).get("codec", "npy")
+    return CompressedTrajectory(path) if codec == "zlib-delta" else Trajectory(path)
@@ -4,7 +4,7 @@ from .borders import Border, Infinite
 
 
 class Universe:
-    def __init__(self, canvas, border, population, dt=1, verbose=False):
+    def __init__(self, canvas, border, population, dt=1, verbose=False, recorders=None):
         """Build a universe.
 
         Args:
@@ -13,6 +13,7 @@ class Universe:
             population (Population): The population of particles in the universe
             dt (float): The time step (in seconds).
             verbose (bool): Flag to display population info in the canvas.
+            recorders (list<TrajectoryWriter>): The recorders of the trajectories, fed after each tick.
         """
         self.dt = dt
         """float: The time step duration (in seconds)."""
@@ -24,22 +25,34 @@ class Universe:
         """Border: The border policy."""
         self.verbose = verbose
         """bool: Flag to display population info in the canvas."""
+        self.recorders = recorders or []
+        """list<TrajectoryWriter>: The recorders of the trajectories, fed after each tick."""
 
     def populate(self, n):
         """Populate with new individuals.
 
+        Each replica of the population gets its own individuals, one replica after the other.
+
         Args:
-            n (int): The number of individuals to add.
+            n (int): The number of individuals to add to each replica.
         """
-        for _ in range(n):
-            self.pop.add_individual()
+        for replica in range(self.pop.replicas):
+            for _ in range(n):
+                self.pop.add_individual(replica=replica)
+
+    def draw(self, first=False, ind=-1, replica=0):
+        """Draw on the canvas.
 
-    def draw(self, first=False, ind=-1):
-        """Draw on the canvas."""
+        Args:
+            first (bool): Whether the whole figure is drawn again.
+            ind (int): The current step.
+            replica (int): The replica to draw when the population holds several ones.
+        """
+        pop = self.pop if self.pop.replicas == 1 else self.pop.replica(replica)
         if first:
-            self.canvas.draw(self.border, self.pop, self.verbose)
+            self.canvas.draw(self.border, pop, self.verbose)
         else:
-            self.canvas.update(ind, self.pop, self.verbose)
+            self.canvas.update(ind, pop, self.verbose)
 
     def tick(self):
         """Perform on tick.
@@ -47,6 +60,8 @@ class Universe:
         Recursively update the whole simulation.
         """
         self.pop.tick(self.dt)
+        for recorder in self.recorders:
+            recorder.record(self.pop.engine)
 
     def spin_once(self):
         """Perform one spin of the simulation.
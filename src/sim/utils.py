@@ -39,6 +39,46 @@ def normalize_angle(angle):
     return normalized_angle
 
 
+def normalize_angles(angles):
+    """Normalize the given angles to lie in [-pi, pi[.
+
+    The angles already in [-pi, pi[ are kept as they are and the ones less than a turn away are shifted by one
+    turn, exactly like normalize_angle(); only the others are wrapped with a modulo.
+
+    Args:
+        angles (numpy.ndarray): The angles (in radians).
+
+    Returns:
+        numpy.ndarray: The normalized angles (in radians).
+    """
+    angles = np.where(angles < -pi, angles + 2 * pi, angles)
+    angles = np.where(angles >= pi, angles - 2 * pi, angles)
+    far = (angles < -pi) | (angles >= pi)
+    if np.any(far):
+        angles[far] = (angles[far] + pi) % (2 * pi) - pi
+    return angles
+
+
+def sum_by_index(values, index, n):
+    """Sum the rows of values that share the same index.
+
+    Args:
+        values (numpy.ndarray): The (K,2) array of values to sum.
+        index (numpy.ndarray): The (K,) array of indices in [0, n[.
+        n (int): The number of indices.
+
+    Returns:
+        numpy.ndarray: The (n,2) array of sums (zeros for unused indices).
+    """
+    return np.stack(
+        [
+            np.bincount(index, weights=values[:, 0], minlength=n),
+            np.bincount(index, weights=values[:, 1], minlength=n),
+        ],
+        axis=1,
+    )
+
+
 def unit_vector(orientation):
     """Create a unit vector from its orientation.
 
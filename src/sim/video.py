@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+import subprocess
+
+import numpy as np
+
+from .frame import FrameRenderer
+from .raster import RasterRenderer
+
+
+class VideoEncoder:
+    """The class encodes frames into a video, without temporary files.
+
+    Each frame is rasterized by a renderer reused from frame to frame, copied into a reused RGB buffer, then
+    streamed as raw video to an ffmpeg process over its standard input.
+
+    """
+
+    DPI = 100
+    """int: The resolution of the figure (in dots per inch)."""
+
+    def __init__(self, path, res, fps, codec="libvpx-vp9", crf=20, blit=True, renderer="matplotlib"):
+        """Build a video encoder and start ffmpeg.
+
+        Args:
+            path (str): The path to the video.
+            res (list<int>): The width and the height of the video (in pixels, even numbers).
+            fps (float): The frame rate (in Hertz).
+            codec (str, optional): The ffmpeg video codec. Defaults to 'libvpx-vp9'.
+            crf (int, optional): The constant rate factor (the quality, lower is better). Defaults to 20.
+            blit (bool, optional): Whether the background of the frames is restored instead of drawn again.
+                Defaults to True.
+            renderer (str, optional): The renderer of the frames, 'matplotlib' or 'raster'. Defaults to
+                'matplotlib'.
+
+        Raises:
+            ValueError: When the width or the height is not an even number.
+        """
+        width, height = (int(size) for size in res)
+        if width % 2 or height % 2:
+            raise ValueError(f"The video resolution {width}x{height} is not made of even numbers")
+        self.path = path
+        """str: The path to the video."""
+        if renderer == "raster":
+            self.renderer = RasterRenderer((width, height))
+        else:
+            self.renderer = FrameRenderer((width / self.DPI, height / self.DPI), self.DPI, blit)
+        """FrameRenderer or RasterRenderer: The renderer rasterizing the frames."""
+        self.rgb = np.empty((height, width, 3), dtype=np.uint8)
+        """numpy.ndarray: The (H,W,3) pixels of the current frame."""
+        self.process = subprocess.Popen(
+            [
+                "ffmpeg", "-y", "-hide_banner", "-loglevel", "error",
+                "-f", "rawvideo", "-pix_fmt", "rgb24", "-s", f"{width}x{height}", "-r", str(fps), "-i", "-",
+                "-c:v", codec, "-crf", str(crf), "-pix_fmt", "yuv420p",
+                path,
+            ],
+            stdin=subprocess.PIPE,
+        )
+        """subprocess.Popen: The ffmpeg process."""
+
+    def write(self, frame):
+        """Encode a frame.
+
+        Args:
+            frame (Frame): The frame to encode.
+        """
+        self.rgb[...] = self.renderer.rasterize(frame)[..., :3]
+        self.process.stdin.write(self.rgb.data)
+
+    def close(self):
+        """Wait for ffmpeg to finish the video.
+
+        Raises:
+            RuntimeError: When ffmpeg failed.
+        """
+        self.process.stdin.close()
+        if self.process.wait() != 0:
+            raise RuntimeError(f"ffmpeg failed to encode {self.path} (exit code {self.process.returncode})")
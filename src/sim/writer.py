@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+import queue
+import threading
+
+
+class AsyncWriter:
+    """The class performs the output tasks (writing logs, saving images) on a background thread.
+
+    The tasks are queued in order and performed one after the other. The queue is bounded: when the writer falls
+    behind, submitting a task waits for a free slot, so the pending outputs can't pile up in memory. A task must
+    only use values that are not modified afterwards (copies, or immutable states).
+
+    """
+
+    def __init__(self, maxsize=16):
+        """Build a writer and start its thread.
+
+        Args:
+            maxsize (int, optional): The maximal number of pending tasks. Defaults to 16.
+        """
+        self.tasks = queue.Queue(maxsize)
+        """queue.Queue: The pending tasks, as (function, arguments) pairs (None stops the thread)."""
+        self.error = None
+        """BaseException: The first error raised by a task (the next tasks are skipped, until the writer is closed)."""
+        self.raised = False
+        """bool: Whether the error was already raised to the caller."""
+        self.thread = threading.Thread(target=self._work, name="AsyncWriter", daemon=True)
+        """threading.Thread: The thread performing the tasks."""
+        self.thread.start()
+
+    def submit(self, function, *args):
+        """Queue a task, waiting for a free slot when the queue is full.
+
+        Args:
+            function (callable): The function to call.
+            *args: The arguments of the function.
+
+        Raises:
+            RuntimeError: When the writer is closed.
+        """
+        if not self.thread.is_alive():
+            raise RuntimeError("The writer is closed")
+        self._raise()
+        self.tasks.put((function, args))
+
+    def wait(self):
+        """Wait for the pending tasks to be performed.
+
+        Raises:
+            BaseException: The first error raised by a task.
+        """
+        self.tasks.join()
+        self._raise()
+
+    def close(self):
+        """Perform the pending tasks, then stop the thread.
+
+        Raises:
+            BaseException: The first error raised by a task.
+        """
+        if self.thread.is_alive():
+            self.tasks.put(None)
+            self.thread.join()
+        self._raise()
+
+    def _raise(self):
+        """Raise the first error of a task, once (the writer stays failed)."""
+        if self.error is not None and not self.raised:
+            self.raised = True
+            raise self.error
+
+    def _work(self):
+        """Perform the tasks until stopped."""
+        while True:
+            task = self.tasks.get()
+            try:
+                if task is None:
+                    return
+                function, args = task
+                if self.error is None:  # After an error, the outputs are likely inconsistent
+                    function(*args)
+            except BaseException as error:
+                self.error = error
+            finally:
+                self.tasks.task_done()
+
+
+def output(writer, function, *args):
+    """Perform an output task, in the background when there is a writer.
+
+    Args:
+        writer (AsyncWriter): The writer (None performs the task at once).
+        function (callable): The function to call.
+        *args: The arguments of the function (not modified afterwards).
+    """
+    if writer is None:
+        function(*args)
+    else:
+        writer.submit(function, *args)
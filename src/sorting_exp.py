@@ -1,13 +1,12 @@
 #!/usr/bin/python3.8
 from math import pi
 import os
-from sim.sim import Sim
-from sim.arguments import get_args
+from sim.sweep import expand, run_sweep
 
 import numpy as np
 
 
-def run_sorting_exp(nb_repeat, name, cmd, variable):
+def run_sorting_exp(nb_repeat, name, cmd, variable, workers=None):
     """Run the memory experience.
 
     Args:
@@ -15,6 +14,7 @@ def run_sorting_exp(nb_repeat, name, cmd, variable):
         name (str): The name of this experience.
         cmd (str): The command template to use.
         variable (list<tuple<str,str,str> >): The list of arguments to add one at a time (their name, their command template, their range).
+        workers (int, optional): The number of worker processes. Defaults to None (the number of processors).
     """
     # Create the required folders
     if not os.path.exists("../logs"):
@@ -26,23 +26,16 @@ def run_sorting_exp(nb_repeat, name, cmd, variable):
     with open(f"../logs/{name}/cmd_template.txt", "w") as cmd_log:
         cmd_log.write(cmd)
 
-    # Repeat the simulation
-    for i in range(nb_repeat):
-        for var_name, var_pattern, var_range in variable:
-            for val in var_range:
-                param_cmd = cmd + " " + var_pattern.format(val)
-                print(
-                    "[Sorting experience] Variable: {} = {} - Repeat: {}%".format(
-                        var_name, val, i * 100 // nb_repeat
-                    )
-                )
-                itr_cmd = param_cmd + " --output {}/{}_{}_itr_{}".format(
-                    name, var_name, val, i
-                )
-                args = get_args(itr_cmd.split(" "))
-                sim = Sim()
-                sim.from_args(args)
-    print("[Sorting experience] Done !")
+    # Repeat the simulation (the replicas are logged in <variable>_<value>_itr_<i>)
+    jobs = []
+    for var_name, var_pattern, var_range in variable:
+        jobs += expand(
+            cmd + " " + var_pattern.format("{val}"),
+            {"val": var_range},
+            name + "/" + var_name + "_{val}_itr_{itr}",
+            nb_repeat,
+        )
+    run_sweep("Sorting experience", jobs, workers, manifest=f"../logs/{name}/manifest.jsonl")
 
 
 if __name__ == "__main__":
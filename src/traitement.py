@@ -1,10 +1,12 @@
 #!/usr/bin/python3.8
-import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
 import os
 
+from sim.data_logger import read_log
+from sim.trajectory import open_trajectory
+
 ### For Latex Render ###
 plt.rcParams.update(
     {
@@ -20,7 +22,7 @@ analysis = ""  # Specify the type of experience: memory, sorting, behaviour
 
 
 def get_logs(dirs):
-    """Get log files.
+    """Get log files (see read_log()).
 
     Args:
         dirs (list<string>): List of directories.
@@ -34,13 +36,32 @@ def get_logs(dirs):
             continue
         files = os.listdir(path + dire + "/")
         for file in files:
-            if "state" in file and file.endswith(".csv"):
-                state_logs.append(path + dire + "/" + file)
-            elif "quantities" in file and file.endswith(".csv"):
-                quantities_logs.append(path + dire + "/" + file)
+            name, extension = os.path.splitext(file)  # A CSV file or a folder of typed parts
+            if extension not in (".csv", ""):
+                continue
+            if "state" in name:
+                state_logs.append(path + dire + "/" + name)
+            elif "quantities" in name:
+                quantities_logs.append(path + dire + "/" + name)
     return quantities_logs, state_logs
 
 
+def get_trajectories(dirs):
+    """Get the recorded trajectories (see the --record option).
+
+    Args:
+        dirs (list<string>): List of directories.
+
+    Returns:
+        dict<string,Trajectory or CompressedTrajectory>: The trajectory recorded in each directory.
+    """
+    trajectories = {}
+    for dire in dirs:
+        if os.path.isfile(path + dire + "/trajectory/header.json"):
+            trajectories[dire] = open_trajectory(path + dire + "/trajectory")
+    return trajectories
+
+
 def get_med_e(data):
     """Compute median and errors of dataset.
 
@@ -76,11 +97,15 @@ def plot_c_d(c, d, x_c, x_d):
 def plot_memory(quantities_logs):
     """Plot memory graph.
 
+    Each log holds a whole rising then falling schedule, as the memory experience logs it in <name>/itr_<i> with
+    one branch. With several branches, the rising part is logged apart in <name>/rising/itr_<i> and each falling
+    branch in <name>/itr_<i>_branch_<b>, from the step the range of orientation starts falling.
+
     Args:
         quantities_logs (list<string>): "quantities" log files.
     """
     for ind, quantities_log in zip(range(len(quantities_logs)), quantities_logs):
-        quantities = pd.read_csv(quantities_log)
+        quantities = read_log(quantities_log)
         if ind == 0:
             r_d = quantities.loc[quantities["is_roo_rising"] == 0]["roo"].to_numpy()
             nb_d = len(r_d)
@@ -146,7 +171,7 @@ def plot_behaviours(quantities_logs):
         quantities_logs (list<string>): "quantities" log files.
     """
     for ind, quantities_log in zip(range(len(quantities_logs)), quantities_logs):
-        quantities = pd.read_csv(quantities_log)
+        quantities = read_log(quantities_log)
         if ind == 0:
             pgroup = {}
             mgroup = {}
@@ -221,8 +246,8 @@ def plot_sorting(state_logs, quantities_logs):
     for ind, state_log, quantities_log in zip(
         range(len(state_logs)), state_logs, quantities_logs
     ):
-        state = pd.read_csv(state_log)
-        quantities = pd.read_csv(quantities_log)
+        state = read_log(state_log)
+        quantities = read_log(quantities_log)
         if ind == 0:
             # Initialisation
             rho_speed_f = {}
@@ -0,0 +1,84 @@
+import pytest
+
+from src.sim.canvas import FrameSchedule
+
+
+def rendered_ticks(schedule, ticks):
+    """List the rendered ticks of a simulation.
+
+    Args:
+        schedule (FrameSchedule): The frame schedule.
+        ticks (int): The number of ticks of the simulation.
+
+    Returns:
+        list<int>: The rendered ticks.
+    """
+    return [tick for tick in range(ticks) if schedule.rendered(tick)]
+
+
+def test_every_tick_by_default():
+    schedule = FrameSchedule(0.1)
+    assert schedule.fps == pytest.approx(10.0)
+    assert schedule.frames is None
+    assert rendered_ticks(schedule, 50) == list(range(50))
+
+
+def test_decimation():
+    schedule = FrameSchedule(0.1, steps=41, every=3)
+    assert schedule.frames == 14  # The last tick, 39, is rendered
+    assert rendered_ticks(schedule, 41) == list(range(0, 41, 3))
+    assert schedule.fps == pytest.approx(10.0 / 3)  # The playback speed is kept
+
+
+def test_window():
+    schedule = FrameSchedule(0.1, steps=100, every=4, window=(10, 25))
+    assert rendered_ticks(schedule, 100) == [10, 14, 18, 22]
+    assert schedule.frames == 4
+    assert schedule.fps == pytest.approx(2.5)
+
+    # The window ends with the simulation
+    for window in ((5, None), (5, 1000)):
+        schedule = FrameSchedule(0.1, steps=41, window=window)
+        assert schedule.stop == 41
+        assert rendered_ticks(schedule, 41) == list(range(5, 41))
+        assert schedule.frames == 36
+
+
+def test_duration():
+    # Decimated down to the maximal frame rate
+    schedule = FrameSchedule(0.1, steps=1000, duration=10.0, max_fps=30.0)
+    assert schedule.every == 4
+    assert schedule.frames == 250
+    assert schedule.fps == pytest.approx(25.0)
+
+    # Played slower, without decimation, and never faster than asked
+    for every, frames in ((1, 41), (3, 14)):
+        schedule = FrameSchedule(0.1, steps=41, every=every, duration=10.0, max_fps=30.0)
+        assert schedule.every == every and schedule.frames == frames
+        assert schedule.frames / schedule.fps == pytest.approx(10.0)
+
+    # Only the window is played
+    schedule = FrameSchedule(0.1, steps=1000, window=(100, 200), duration=2.0, max_fps=30.0)
+    assert schedule.every == 2 and schedule.frames == 50
+    assert schedule.fps == pytest.approx(25.0)
+    assert rendered_ticks(schedule, 1000) == list(range(100, 200, 2))
+
+
+def test_invalid_schedules():
+    with pytest.raises(ValueError):
+        FrameSchedule(0.1, every=0)
+    with pytest.raises(ValueError):
+        FrameSchedule(0.1, window=(10, 10))
+    with pytest.raises(ValueError):
+        FrameSchedule(0.1, steps=41, window=(50, None))
+    with pytest.raises(ValueError):
+        FrameSchedule(0.1, duration=10.0)
+
+
+if __name__ == "__main__":
+    test_every_tick_by_default()
+    test_decimation()
+    test_window()
+    test_duration()
+    test_invalid_schedules()
+    print("FrameSchedule: OK")
@@ -0,0 +1,94 @@
+import os
+import tempfile
+
+import numpy as np
+
+from src.sim import DataLogger, Incrementor, Population, Universe
+from src.sim import checkpoint as ckpt
+from src.sim.borders import Toric
+from src.sim.perceptions import BlindSpot, Range
+
+
+def build_universe(seed=4):
+    """Build an unpopulated universe of two replicas, with per-replica parameters.
+
+    Args:
+        seed (int, optional): The seed of the random generators. Defaults to 4.
+
+    Returns:
+        Universe: The universe.
+    """
+    border = Toric(np.array([[60.0], [60.0]]))
+    per = BlindSpot(np.pi - 0.5, np.pi / 2, border, Range(20.0, border))
+    pop = Population(
+        10.0, 4.0, 1.0, per, np.array([0.05, 0.1]), speed=np.array([1.0, 1.5]), roo_sd=0.5, seed=seed, replicas=2
+    )
+    return Universe(None, border, pop, dt=0.5)
+
+
+def advance(universe, incrementor, loggers, steps):
+    """Advance a simulation like Simulation.run() does without rendering.
+
+    Args:
+        universe (Universe): The universe to advance.
+        incrementor (Incrementor): The incrementor of the range of orientation.
+        loggers (list<DataLogger>): The data logger of each replica.
+        steps (int): The number of steps.
+    """
+    for _ in range(steps):
+        universe.tick()
+        if incrementor.will_change:
+            for r, dl in enumerate(loggers):
+                universe.pop.replica(r).store_quantities(dl, incrementor.is_rising)
+        universe.pop.roo = incrementor.next()
+
+
+def test_restore_resumes_the_straight_run():
+    k, steps = 23, 50
+    straight = build_universe()
+    straight.populate(30)
+    incrementor = Incrementor(4.0, 1.0, 8.0, 5)
+    loggers = [DataLogger(), DataLogger()]
+    advance(straight, incrementor, loggers, steps)
+
+    first = build_universe()
+    first.populate(30)
+    first_incrementor = Incrementor(4.0, 1.0, 8.0, 5)
+    first_loggers = [DataLogger(), DataLogger()]
+    advance(first, first_incrementor, first_loggers, k)
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "checkpoint.npz")
+        ckpt.save(path, first, k, first_incrementor, first_loggers)
+
+        resumed = build_universe(seed=None)  # The random generators come from the checkpoint
+        resumed_incrementor = Incrementor(4.0, 1.0, 8.0, 5)
+        step, dumps = ckpt.restore(path, resumed, resumed_incrementor)
+    assert step == k
+    resumed_loggers = [DataLogger(), DataLogger()]
+    for dl, dump in zip(resumed_loggers, dumps):
+        dl.load(dump)
+    advance(resumed, resumed_incrementor, resumed_loggers, steps - k)
+
+    # Same state
+    for name, column in straight.pop.engine.columns().items():
+        np.testing.assert_array_equal(resumed.pop.engine.columns()[name], column, err_msg=name)
+    assert resumed.pop.engine.color == straight.pop.engine.color
+    assert vars(resumed_incrementor) == vars(incrementor)
+    for name in Population.PER_REPLICA:
+        np.testing.assert_array_equal(getattr(resumed.pop, name), getattr(straight.pop, name), err_msg=name)
+    # Same quantities
+    for resumed_dl, dl in zip(resumed_loggers, loggers):
+        assert len(dl.quantities) > 0
+        expected = dl.quantities.frame()
+        quantities = resumed_dl.quantities.frame()
+        assert list(quantities.columns) == list(expected.columns)
+        for column in expected.columns:
+            np.testing.assert_array_equal(quantities[column].to_numpy(), expected[column].to_numpy(), err_msg=column)
+    # Same random streams
+    for resumed_rng, rng in zip(resumed.pop.rngs, straight.pop.rngs):
+        np.testing.assert_array_equal(resumed_rng.random(8), rng.random(8))
+
+
+if __name__ == "__main__":
+    test_restore_resumes_the_straight_run()
+    print("Checkpoint: OK")
@@ -1,12 +1,75 @@
-from src.data_logger import DataLogger
+import tempfile
+
+import numpy as np
+import pandas
+import pytest
 from pandas import DataFrame
+
+from src.sim.data_logger import DataLogger, read_log
+
+
+def fill(dl, ticks=11, n=3):
+    """Log quantities and states like a simulation does.
+
+    Args:
+        dl (DataLogger): The data logger to fill.
+        ticks (int, optional): The number of logged ticks. Defaults to 11.
+        n (int, optional): The number of individuals. Defaults to 3.
+    """
+    rng = np.random.default_rng(6)
+    for t in range(ticks):
+        dl.quantities.append(
+            {
+                "cgroup": rng.normal(size=2),
+                "pgroup": rng.random(),
+                "roo": 4.0 + t,
+                "is_roo_rising": t % 3 == 0,
+                "label": f"tick-{t}",
+            }
+        )
+        dl.state.extend(
+            {
+                "id": np.arange(n),
+                "pos": rng.normal(size=(n, 2)),
+                "angle": rng.uniform(-np.pi, np.pi, n),
+                "front_idx": rng.permutation(n),
+            }
+        )
+
+
+def test_flush_writes_data_frames():
+    with tempfile.TemporaryDirectory() as folder:
+        dl = DataLogger()
+        dl.destination = folder + "/"
+        dl.test = DataFrame({"test1": [1, 2, 3], "test2": [-1, -2, -3]})
+        dl.flush()
+        pandas.testing.assert_frame_equal(pandas.read_csv(folder + "/test.csv", index_col=0), dl.test)
+        dl.test = pandas.concat([dl.test, DataFrame({"test1": [4], "test2": [-4]})], ignore_index=True)
+        dl.flush()
+        pandas.testing.assert_frame_equal(pandas.read_csv(folder + "/test.csv", index_col=0), dl.test)
+
+
+@pytest.mark.parametrize("log_format", DataLogger.FORMATS)
+@pytest.mark.parametrize("chunk", [0, 4])
+def test_formats_read_back_the_same_rows(log_format, chunk):
+    reference = DataLogger()
+    fill(reference)
+    with tempfile.TemporaryDirectory() as folder:
+        dl = DataLogger(log_format, chunk)
+        dl.destination = folder + "/"
+        fill(dl)
+        dl.flush()
+        for name in ("quantities", "state"):
+            expected = getattr(reference, name).frame()
+            log = read_log(folder + "/" + name)
+            pandas.testing.assert_frame_equal(log.reset_index(drop=True), expected, check_dtype=False)
+            assert list(log.columns) == list(expected.columns)
+            assert log["label" if name == "quantities" else "front_idx"].dtype == expected.dtypes.iloc[-1]
+
+
 if __name__ == "__main__":
-    dl = DataLogger()
-    data = {"test1": [1, 2, 3], "test2": [-1, -2, -3]}
-    dl.test = DataFrame(data)
-    print(dl.__dict__.keys())
-    dl.flush()
-    print(dl.test)
-    dl.test = dl.test.append({"test1": 4, "test2": -4}, ignore_index=True)
-    print(dl.test)
-    dl.flush()
+    test_flush_writes_data_frames()
+    for log_format in DataLogger.FORMATS:
+        for chunk in (0, 4):
+            test_formats_read_back_the_same_rows(log_format, chunk)
+    print("DataLogger: OK")
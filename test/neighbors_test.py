@@ -0,0 +1,104 @@
+import numpy as np
+
+from src.sim.borders import Infinite, Toric, Wall
+from src.sim.engine import Engine, all_pairs
+from src.sim.neighbors import CellList, VerletList
+
+
+def build_engine(n, replicas, border, rng):
+    """Build an engine of individuals spread over the border.
+
+    Args:
+        n (int): The number of individuals of each replica.
+        replicas (int): The number of replicas.
+        border (Border): The border policy.
+        rng (numpy.random.Generator): The random generator to use.
+
+    Returns:
+        Engine: The engine.
+    """
+    size = n * replicas
+    length = np.reshape(border.length, -1)
+    columns = {
+        "pos": border.wrap_many(rng.uniform(-length / 2, length / 2, (size, 2))),
+        "angle": rng.uniform(-np.pi, np.pi, size),
+        "speed": rng.uniform(0.5, 1.5, size),
+        "turning_rate": np.full(size, 0.2),
+        "ror": np.ones(size),
+        "roo": np.full(size, 5.0),
+        "roa": np.full(size, 10.0),
+        "replica": np.repeat(np.arange(replicas), n),
+    }
+    return Engine.from_columns(columns, ["#FFFFFF"] * size)
+
+
+def brute_force(engine, border, radius):
+    """List the pairs of individuals closer than a radius by testing every pair.
+
+    Args:
+        engine (Engine): The population stored as arrays.
+        border (Border): The border policy.
+        radius (float): The search radius (in length units).
+
+    Returns:
+        set<tuple<int,int>>: The pairs (i, j).
+    """
+    i, j = all_pairs(engine.replica)
+    diff = border.vector_many(engine.pos, engine.pos, (i, j))
+    close = np.sum(diff ** 2, axis=1) <= radius ** 2
+    return set(zip(i[close].tolist(), j[close].tolist()))
+
+
+def pairs_of(neighborhood):
+    """Get the pairs of a neighborhood, checking they are sorted by i then j.
+
+    Args:
+        neighborhood (Neighborhood): The neighborhood.
+
+    Returns:
+        set<tuple<int,int>>: The pairs (i, j).
+    """
+    order = np.lexsort((neighborhood.j, neighborhood.i))
+    assert np.array_equal(order, np.arange(len(neighborhood)))
+    return set(zip(neighborhood.i.tolist(), neighborhood.j.tolist()))
+
+
+def test_cell_list_matches_brute_force():
+    rng = np.random.default_rng(0)
+    length = np.array([[60.0], [40.0]])
+    cases = [
+        (Toric(length), 7.0),
+        (Toric(length), 25.0),  # Less than 3 cells along Y
+        (Toric(np.array([[10.0], [10.0]])), 4.0),  # 2 cells per axis
+        (Toric(np.array([[10.0], [10.0]])), 6.0),  # 1 cell per axis
+        (Toric(length, np.array([[5.0], [-3.0]])), 9.5),  # Off-centre torus
+        (Wall(length), 7.0),
+        (Infinite(length), 7.0),
+        (Toric(length), np.inf),
+    ]
+    for border, radius in cases:
+        for replicas in (1, 3):
+            engine = build_engine(80, replicas, border, rng)
+            neighborhood = CellList(radius).neighborhood(engine, border)
+            assert pairs_of(neighborhood) == brute_force(engine, border, radius), (border, radius, replicas)
+
+
+def test_verlet_list_matches_cell_list():
+    rng = np.random.default_rng(1)
+    for border in (Toric(np.array([[30.0], [30.0]])), Infinite(np.array([[30.0], [30.0]]))):
+        engine = build_engine(60, 2, border, rng)
+        verlet_list = VerletList(6.0, 2.0)
+        for _ in range(40):
+            expected = CellList(6.0).neighborhood(engine, border)
+            neighborhood = verlet_list.neighborhood(engine, border)
+            assert pairs_of(neighborhood) == pairs_of(expected)
+            np.testing.assert_allclose(neighborhood.dist, expected.dist)
+            engine.angle = engine.angle + rng.normal(0.0, 0.5, len(engine))
+            engine.tick(0.5)
+            engine.wrap(border)
+
+
+if __name__ == "__main__":
+    test_cell_list_matches_brute_force()
+    test_verlet_list_matches_cell_list()
+    print("Neighbors: OK")
@@ -0,0 +1,119 @@
+from math import pi
+
+import numpy as np
+
+from src.sim.borders import Infinite, Toric
+from src.sim.engine import all_pairs
+from src.sim.neighbors import Neighborhood
+from src.sim.perceptions import KNN, BlindSpot, Outlier, Range
+
+from neighbors_test import build_engine
+
+
+def outlier_engine(deviations, rng):
+    """Build an observer whose neighbors deviate from their circular mean, 0, by the given angles.
+
+    Args:
+        deviations (list<float>): The deviation of each neighbor (in radians), symmetric so that the circular mean
+            is exactly 0.
+        rng (numpy.random.Generator): The random generator to use.
+
+    Returns:
+        Engine: The engine, the observer first.
+    """
+    engine = build_engine(len(deviations) + 1, 1, Infinite(np.array([[50.0], [50.0]])), rng)
+    engine.pos = rng.uniform(-3.0, 3.0, (len(engine), 2))  # All in range
+    engine.angle = [1.3] + deviations
+    return engine
+
+
+def detected_one_by_one(per, engine):
+    """List the detections with the per-individual path (detect then _filter).
+
+    Args:
+        per (Perception): The perception.
+        engine (Engine): The population stored as arrays.
+
+    Returns:
+        set<tuple<int,int>>: The pairs (i, j) where i detects j.
+    """
+    detected = set()
+    for ind in engine.views:
+        pop = [other for other in engine.views if other.replica == ind.replica]
+        detected |= {(ind.index, other.index) for other in per.detect(ind, pop)}
+    return detected
+
+
+def detected_all(per, engine, border):
+    """List the detections with the whole-array path (detect_all).
+
+    Args:
+        per (Perception): The perception.
+        engine (Engine): The population stored as arrays.
+        border (Border): The border policy.
+
+    Returns:
+        set<tuple<int,int>>: The pairs (i, j) where i detects j.
+    """
+    neighborhood = Neighborhood(engine, border, all_pairs(engine.replica))
+    mask = per.detect_all(neighborhood)
+    return set(zip(neighborhood.i[mask].tolist(), neighborhood.j[mask].tolist()))
+
+
+def perceptions(border):
+    """Build the perceptions to check.
+
+    Args:
+        border (Border): The border policy.
+
+    Returns:
+        list<Perception>: The perceptions.
+    """
+    return [
+        Range(12.0, border),
+        BlindSpot(pi - 0.1, pi / 2, border, Range(12.0, border)),
+        BlindSpot(pi / 2, pi / 3, border, BlindSpot(-pi / 2, pi / 3, border, Range(12.0, border))),
+        KNN(1, border, Range(12.0, border)),
+        KNN(4, border, Range(12.0, border)),
+        KNN(4, border, BlindSpot(-pi, pi / 2, border, Range(12.0, border))),
+        Outlier(pi / 4, border, Range(12.0, border)),
+        Outlier(pi / 2, border, KNN(5, border, Range(12.0, border))),
+    ]
+
+
+def test_detect_all_matches_filter():
+    rng = np.random.default_rng(3)
+    for border in (Toric(np.array([[50.0], [50.0]])), Infinite(np.array([[50.0], [50.0]]))):
+        engine = build_engine(50, 2, border, rng)
+        for per in perceptions(border):
+            assert detected_all(per, engine, border) == detected_one_by_one(per, engine), per
+
+
+def test_fused_blind_spots():
+    border = Infinite(np.array([[50.0], [50.0]]))
+    inner = Range(12.0, border)
+    per = BlindSpot(pi / 2, pi / 3, border, BlindSpot(-pi / 2, pi / 4, border, inner))
+    assert per.cones == [(-pi / 2, pi / 8), (pi / 2, pi / 6)]
+    assert per.wrapped is inner
+
+
+def test_outlier_threshold():
+    rng = np.random.default_rng(7)
+    border = Infinite(np.array([[50.0], [50.0]]))
+    deviation = 0.6
+    for deviations in ([0.0, deviation, -deviation], [0.2, -0.2, deviation, -deviation]):
+        engine = outlier_engine(deviations, rng)
+        for threshold, outlier in [(deviation - 1e-9, True), (deviation, False), (deviation + 1e-9, False)]:
+            per = Outlier(threshold, border, Range(12.0, border))
+            detected = detected_all(per, engine, border)
+            assert detected == detected_one_by_one(per, engine)
+            # An outlier deviates strictly more than the threshold: only the first one is seen
+            seen = sorted(j for i, j in detected if i == 0)
+            assert seen == ([1 + deviations.index(deviation)] if outlier else list(range(1, len(engine))))
+
+
+if __name__ == "__main__":
+    test_detect_all_matches_filter()
+    test_fused_blind_spots()
+    test_outlier_threshold()
+    print("Perceptions: OK")
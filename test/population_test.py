@@ -0,0 +1,102 @@
+from math import pi
+
+import numpy as np
+
+from src.sim import Population
+from src.sim.borders import Infinite, Toric
+from src.sim.perceptions import BlindSpot, Range
+from src.sim.utils import angle
+
+
+def reorient_one(pop, ind):
+    """Compute the new orientation of an individual like the per-individual implementation (without noise).
+
+    Args:
+        pop (Population): The population of the individual.
+        ind (Individual): The given individual.
+
+    Returns:
+        float: The new orientation for the given individual (in radians).
+    """
+    nearby = pop.perception.detect(ind, pop.pop)
+    border = pop.perception.border
+    des_r = np.zeros((2, 1))
+    des_o = np.zeros((2, 1))
+    des_a = np.zeros((2, 1))
+    nb_r = nb_o = nb_a = 0
+    roo = ind.roo if pop.roo_sd > 0.0 else pop.roo
+    for other in nearby:
+        diff = border.vector(ind.pos, other.pos)
+        dist = np.linalg.norm(diff)
+        dir2other = diff / dist
+        if dist <= ind.ror:
+            des_r -= dir2other
+            nb_r += 1
+        elif dist <= roo:
+            des_o += other.dir
+            nb_o += 1
+        elif dist <= ind.roa:
+            des_a += dir2other
+            nb_a += 1
+    if nb_r > 0:
+        des_dir = des_r
+    elif nb_o > 0:
+        des_dir = des_o if nb_a == 0 else (des_o + des_a) / 2
+    elif nb_a > 0:
+        des_dir = des_a
+    else:
+        des_dir = ind.dir
+    return angle(des_dir.reshape(-1))
+
+
+def build_population(roa, roo, per, n=150, roo_sd=0.0, skin=0.0, seed=2):
+    """Build a noiseless population.
+
+    Args:
+        roa (float): The radius of attraction (in length units).
+        roo (float): The radius of orientation (in length units).
+        per (Perception): The perception of the population.
+        n (int, optional): The number of individuals. Defaults to 150.
+        roo_sd (float, optional): The standard deviation of the range of orientation. Defaults to 0.0.
+        skin (float, optional): The skin of the neighbor lists. Defaults to 0.0.
+        seed (int, optional): The seed of the random generators. Defaults to 2.
+
+    Returns:
+        Population: The population.
+    """
+    pop = Population(roa, roo, 1.0, per, 0.0, roo_sd=roo_sd, seed=seed, skin=skin)
+    for _ in range(n):
+        pop.add_individual()
+    return pop
+
+
+def assert_reorient_matches(pop):
+    """Check the vectorized reorientation against the per-individual one.
+
+    Args:
+        pop (Population): The population to check.
+    """
+    expected = np.array([reorient_one(pop, ind) for ind in pop.pop])
+    difference = np.angle(np.exp(1j * (pop.reorient() - expected)))
+    np.testing.assert_allclose(difference, 0.0, atol=1e-9)
+
+
+def test_reorient_orientation_beyond_attraction():
+    border = Toric(np.array([[80.0], [80.0]]))
+    for skin in (0.0, 2.0):
+        pop = build_population(14.0, 18.0, Range(30.0, border), skin=skin)
+        assert_reorient_matches(pop)
+
+
+def test_reorient_deviated_orientation():
+    border = Infinite(np.array([[100.0], [100.0]]))
+    per = BlindSpot(pi / 2, pi / 2, border, BlindSpot(-pi / 2, pi / 2, border, Range(1000.0, border)))
+    pop = build_population(17.0, 15.0, per, roo_sd=2.5)
+    assert np.any(pop.engine.roo > pop.engine.roa)
+    assert_reorient_matches(pop)
+
+
+if __name__ == "__main__":
+    test_reorient_orientation_beyond_attraction()
+    test_reorient_deviated_orientation()
+    print("Population: OK")
@@ -0,0 +1,91 @@
+import os
+import tempfile
+
+import matplotlib.image
+import numpy as np
+import pytest
+
+from src.sim import PALETTE, Population
+from src.sim.borders import Toric, Wall
+from src.sim.canvas import Canvas
+from src.sim.perceptions import Range
+from src.sim.raster import RasterRenderer, hex_to_rgb
+
+RES = (320, 180)
+"""tuple<int,int>: The width and the height of the images (in pixels)."""
+
+
+def draw(border, positions):
+    """Draw a few boids the way the simulation does.
+
+    Args:
+        border (Border): The border policy.
+        positions (numpy.ndarray): The (N,2) positions of the boids.
+
+    Returns:
+        Frame: The frame showing the boids then the group vector.
+    """
+    pop = Population(10.0, 5.0, 1.0, Range(20.0, border), 0.1, seed=2)
+    for _ in range(len(positions)):
+        pop.add_individual()
+    pop.engine.pos = np.asarray(positions, dtype=float)
+    canvas = Canvas(0.1, False, renderer="raster", batch=True)
+    canvas.draw(border, pop, False)
+    return canvas.current_frame
+
+
+def pixel(frame, k):
+    """Compute the pixel holding the centre of a vector.
+
+    Args:
+        frame (Frame): The frame, whose limits are centred on the origin.
+        k (int): The index of the vector.
+
+    Returns:
+        tuple<int,int>: The row and the column of the pixel.
+    """
+    (left, right), (bottom, top) = frame.limits
+    width, height = RES
+    scale = min(width / (right - left).item(), height / (top - bottom).item())
+    return int(height / 2 - frame.y[k] * scale), int(width / 2 + frame.x[k] * scale)
+
+
+@pytest.mark.parametrize("border", [Toric(np.array([[100.0], [60.0]])), Wall(np.array([[100.0], [60.0]]))])
+def test_boids_are_painted_at_their_position(border):
+    renderer = RasterRenderer(RES)
+    background = hex_to_rgb(PALETTE["background"])
+    positions = np.array([[-25.0, -15.0], [25.0, -15.0], [-25.0, 15.0], [25.0, 15.0]])
+    first = draw(border, positions)
+    image = renderer.rasterize(first)
+    assert image.shape == (RES[1], RES[0], 4) and image.dtype == np.uint8
+    for k in range(len(positions)):
+        assert tuple(image[pixel(first, k)][:3]) == hex_to_rgb(first.color[k])
+    assert tuple(image[0, 0]) == background + (255,)
+    painted = np.any(image[..., :3] != background, axis=2).sum()
+    assert 0 < painted < image.shape[0] * image.shape[1] // 10
+
+    # The boids of the previous frame are cleared
+    second = draw(border, positions * 0.5)
+    image = renderer.rasterize(second)
+    for k in range(len(positions)):
+        assert tuple(image[pixel(first, k)][:3]) == background
+        assert tuple(image[pixel(second, k)][:3]) == hex_to_rgb(second.color[k])
+
+
+def test_png_round_trip():
+    border = Toric(np.array([[100.0], [60.0]]))
+    frame = draw(border, np.array([[-25.0, -15.0], [25.0, 15.0]]))
+    renderer = RasterRenderer(RES)
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "frame.png")
+        renderer.save(frame, path)
+        image = matplotlib.image.imread(path)
+    assert image.shape == (RES[1], RES[0], 3)
+    np.testing.assert_array_equal(np.rint(image * 255).astype(np.uint8), renderer.image[..., :3])
+
+
+if __name__ == "__main__":
+    for border in (Toric(np.array([[100.0], [60.0]])), Wall(np.array([[100.0], [60.0]]))):
+        test_boids_are_painted_at_their_position(border)
+    test_png_round_trip()
+    print("RasterRenderer: OK")
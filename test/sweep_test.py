@@ -0,0 +1,86 @@
+import json
+import os
+import tempfile
+
+from src.sim import sweep
+from src.sim.sweep import Job, run_job, run_sweep
+
+
+def run_or_die(job):
+    """Simulate a job, or kill its worker process when its output ends with 'die'.
+
+    Args:
+        job (Job): The job to simulate.
+
+    Returns:
+        str: The traceback when the job failed, else None.
+    """
+    if job.outputs[0].endswith("die"):
+        os._exit(1)
+    return run_job(job)
+
+
+def run_twice(folder):
+    """Run a sweep of one job, then run it again.
+
+    Args:
+        folder (str): The working folder of the sweep (the logs go to its parent).
+
+    Returns:
+        list<dict>: The records of the manifest.
+    """
+    manifest = os.path.join(folder, "manifest.jsonl")
+    job = Job("-n 8 --view-dist 30 -ror 2 -v 1 --step-nb 5", ["sweep/job_0"])
+    assert run_sweep("Test", [job], workers=1, manifest=manifest) == []
+    assert run_sweep("Test", [Job(job.cmd, job.outputs)], workers=1, manifest=manifest) == []
+    with open(manifest) as records:
+        return [json.loads(line) for line in records]
+
+
+def test_manifest_skips_the_complete_jobs_only():
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as root:
+        folder = os.path.join(root, "src")
+        os.makedirs(folder)
+        os.chdir(folder)
+        try:
+            records = run_twice(folder)
+            assert len(records) == 1  # Skipped the second time
+            assert records[0]["digest"] is not None
+
+            # A log cut by an interrupted run of the job
+            state = os.path.join(root, "logs", "sweep", "job_0", "state.csv")
+            with open(state, "r+") as log:
+                log.truncate(os.path.getsize(state) // 2)
+            records = run_twice(folder)
+            assert len(records) == 2  # Simulated again, then skipped
+            assert records[1]["key"] == records[0]["key"] and records[1]["digest"] == records[0]["digest"]
+        finally:
+            os.chdir(cwd)
+
+
+def test_dead_worker_fails_its_job_only():
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as root:
+        folder = os.path.join(root, "src")
+        os.makedirs(folder)
+        os.chdir(folder)
+        sweep.run_job = run_or_die
+        try:
+            manifest = os.path.join(folder, "manifest.jsonl")
+            cmd = "-n 8 --view-dist 30 -ror 2 -v 1 --step-nb 5"
+            jobs = [Job(cmd, [f"sweep/{output}"]) for output in ("job_0", "job_1", "die", "job_2")]
+            failed = run_sweep("Test", jobs, workers=2, manifest=manifest)
+            assert failed == [jobs[2]]
+            with open(manifest) as records:
+                outputs = sorted(json.loads(line)["outputs"][0] for line in records)
+            assert outputs == ["sweep/job_0", "sweep/job_1", "sweep/job_2"]
+        finally:
+            sweep.run_job = run_job
+            os.chdir(cwd)
+
+
+if __name__ == "__main__":
+    test_manifest_skips_the_complete_jobs_only()
+    test_dead_worker_fails_its_job_only()
+    print("Sweep: OK")
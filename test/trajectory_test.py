@@ -0,0 +1,111 @@
+import os
+import tempfile
+from math import pi
+
+import numpy as np
+import pytest
+
+from src.sim import Population
+from src.sim.borders import Infinite, Toric
+from src.sim.perceptions import Range
+from src.sim.trajectory import CompressedTrajectoryWriter, TrajectoryWriter, open_trajectory
+
+
+def build_population(border, n=20, seed=5):
+    """Build a population of two replicas.
+
+    Args:
+        border (Border): The border policy.
+        n (int, optional): The number of individuals of each replica. Defaults to 20.
+        seed (int, optional): The seed of the random generators. Defaults to 5.
+
+    Returns:
+        Population: The population.
+    """
+    pop = Population(10.0, 5.0, 1.0, Range(20.0, border), 0.1, seed=seed, replicas=2)
+    for replica in range(2):
+        for _ in range(n):
+            pop.add_individual(replica=replica)
+    return pop
+
+
+def record(folder, pop, frames, bits=16, chunk=7, drift=0.0):
+    """Record the same ticks of the second replica in both formats.
+
+    Args:
+        folder (str): The folder to record in.
+        pop (Population): The population to tick.
+        frames (int): The number of frames.
+        bits (int, optional): The resolution of the compressed positions. Defaults to 16.
+        chunk (int, optional): The number of frames per compressed chunk. Defaults to 7.
+        drift (float, optional): The distance added to the positions at each tick (in length units). Defaults to
+            0.0.
+
+    Returns:
+        tuple<Trajectory,CompressedTrajectory>: The recorded trajectories.
+    """
+    plain = TrajectoryWriter(os.path.join(folder, "npy"), pop, 1, frames, 1.0)
+    compressed = CompressedTrajectoryWriter(os.path.join(folder, "zlib"), pop, 1, 1.0, bits=bits, chunk=chunk)
+    for _ in range(frames):
+        plain.record(pop.engine)
+        compressed.record(pop.engine)
+        pop.tick(1.0)
+        pop.engine.pos = pop.engine.pos + drift
+    plain.close()
+    compressed.close()
+    return open_trajectory(plain.path), open_trajectory(compressed.path)
+
+
+def assert_close(plain, compressed, start, stop):
+    """Check a window of the compressed frames against the plain ones, within the quantization steps.
+
+    Args:
+        plain (Trajectory): The plain trajectory.
+        compressed (CompressedTrajectory): The compressed trajectory.
+        start (int): The first frame.
+        stop (int): The frame after the last one.
+    """
+    pos, angle = plain.window(start, stop)
+    decoded_pos, decoded_angle = compressed.window(start, stop)
+    assert decoded_pos.shape == pos.shape and decoded_angle.shape == angle.shape
+    assert np.all(np.abs(decoded_pos - pos) <= compressed.resolution / 2 * (1 + 1e-6))
+    angle_error = np.abs(np.angle(np.exp(1j * (decoded_angle - angle))))
+    assert np.all(angle_error <= pi / 2 ** 16 * (1 + 1e-6))
+
+
+def test_compressed_round_trip():
+    with tempfile.TemporaryDirectory() as folder:
+        plain, compressed = record(folder, build_population(Toric(np.array([[50.0], [50.0]]))), 30)
+        assert len(compressed) == len(plain) == 30
+        np.testing.assert_array_equal(compressed.time, plain.time)
+        for start, stop in [(0, 30), (0, 7), (5, 9), (6, 22), (21, 30), (29, 30), (12, 12)]:
+            assert_close(plain, compressed, start, stop)
+
+
+def test_compressed_positions_widen_beyond_32_bits():
+    with tempfile.TemporaryDirectory() as folder:
+        # One step is 100 / 2^26 length units: the drift leaves the 32-bit range after a few chunks
+        pop = build_population(Infinite(np.array([[100.0], [100.0]])))
+        plain, compressed = record(folder, pop, 30, bits=26, drift=200.0)
+        types = [chunk[3] for chunk in compressed.header["chunks"]]
+        assert types[0] == "int32" and types[-1] == "int64"
+        for start, stop in [(0, 30), (3, 17)]:
+            assert_close(plain, compressed, start, stop)
+
+
+def test_compressed_positions_overflow():
+    with tempfile.TemporaryDirectory() as folder:
+        pop = build_population(Infinite(np.array([[100.0], [100.0]])))
+        writer = CompressedTrajectoryWriter(os.path.join(folder, "zlib"), pop, 0, 1.0, bits=62)
+        writer.record(pop.engine)
+        pop.engine.pos = pop.engine.pos + 1000.0  # 1000 length units are more than 2^63 steps
+        with pytest.raises(ValueError):
+            writer.record(pop.engine)
+        writer.file.close()
+
+
+if __name__ == "__main__":
+    test_compressed_round_trip()
+    test_compressed_positions_widen_beyond_32_bits()
+    test_compressed_positions_overflow()
+    print("Trajectory: OK")
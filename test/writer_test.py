@@ -0,0 +1,102 @@
+import tempfile
+import threading
+
+import pandas
+import pytest
+
+from src.sim.canvas import Canvas
+from src.sim.data_logger import DataLogger, read_log
+from src.sim.writer import AsyncWriter
+
+from data_logger_test import fill
+
+
+def test_submit_waits_for_a_free_slot():
+    writer = AsyncWriter(maxsize=2)
+    release = threading.Event()
+    writer.submit(release.wait)  # Keeps the thread busy
+    done = []
+    submitter = threading.Thread(target=lambda: [writer.submit(done.append, k) for k in range(5)])
+    submitter.start()
+    submitter.join(0.2)
+    assert submitter.is_alive()  # Blocked on the full queue
+    assert writer.tasks.qsize() <= 2 and done == []
+    release.set()
+    submitter.join(5.0)
+    assert not submitter.is_alive()
+    writer.close()
+    assert done == list(range(5))
+
+
+def test_close_performs_the_pending_tasks():
+    writer = AsyncWriter(maxsize=4)
+    done = []
+    for k in range(50):
+        writer.submit(done.append, k)
+    writer.close()
+    assert done == list(range(50))
+    assert not writer.thread.is_alive()
+    with pytest.raises(RuntimeError):
+        writer.submit(done.append, 50)
+
+
+def test_task_error_reaches_the_caller():
+    def fail():
+        raise OSError("disk full")
+
+    writer = AsyncWriter()
+    done = []
+    writer.submit(fail)
+    writer.submit(done.append, 1)  # Skipped after the error
+    with pytest.raises(OSError, match="disk full"):
+        writer.wait()
+    writer.submit(done.append, 2)  # Still skipped until closed
+    writer.close()  # The error is raised once
+    assert done == []
+
+    writer = AsyncWriter()
+    writer.submit(fail)
+    with pytest.raises(OSError, match="disk full"):
+        writer.close()
+
+
+def test_canvas_keeps_the_simulation_error():
+    def fail():
+        raise OSError("disk full")
+
+    with pytest.raises(ValueError, match="simulation"):
+        with Canvas(1, False, batch=True) as canvas:
+            canvas.writer.submit(fail)
+            raise ValueError("simulation")
+
+    with pytest.raises(OSError, match="disk full"):
+        with Canvas(1, False, batch=True) as canvas:
+            canvas.writer.submit(fail)
+
+
+@pytest.mark.parametrize("log_format", DataLogger.FORMATS)
+def test_streamed_logs_through_the_writer(log_format):
+    reference = DataLogger()
+    fill(reference)
+    with tempfile.TemporaryDirectory() as folder:
+        writer = AsyncWriter(maxsize=2)
+        dl = DataLogger(log_format, chunk=4, writer=writer)
+        dl.destination = folder + "/"
+        fill(dl)
+        assert len(dl.state) < 4  # The full chunks were handed to the writer
+        assert dl.dump() == reference.dump()  # Including the rows already written
+        dl.flush()
+        writer.close()
+        for name in ("quantities", "state"):
+            log = read_log(folder + "/" + name).reset_index(drop=True)
+            pandas.testing.assert_frame_equal(log, getattr(reference, name).frame(), check_dtype=False)
+
+
+if __name__ == "__main__":
+    test_submit_waits_for_a_free_slot()
+    test_close_performs_the_pending_tasks()
+    test_task_error_reaches_the_caller()
+    test_canvas_keeps_the_simulation_error()
+    for log_format in DataLogger.FORMATS:
+        test_streamed_logs_through_the_writer(log_format)
+    print("AsyncWriter: OK")